@@ -20,22 +20,29 @@ Design Philosophy:
 """
 
 import sys
+import re
+import time
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache, partial
+from operator import itemgetter
 from uuid import UUID
 import asyncio
+import weakref
 import logging
 import tempfile
 import shutil
+from decimal import Decimal
+
+import orjson
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks, UploadFile, File, Form, Body, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel, Field
-from dotenv import load_dotenv
 from contextlib import asynccontextmanager
 
 # Import authentication
@@ -43,13 +50,9 @@ from api.auth import verify_password, create_access_token, get_current_user, ACC
 
 # Load environment variables from .env file in agent root directory
 # CRITICAL: Do NOT load from CWD, which might be a generated project directory
-# Get agent root directory (parent of api/ directory)
-_api_dir = Path(__file__).parent
-_agent_root = _api_dir.parent
-_agent_env_file = _agent_root / ".env"
+from core.config import load_agent_env
 
-# Load from agent's .env only, not from any project directory
-load_dotenv(dotenv_path=_agent_env_file)
+load_agent_env()
 
 # Ensure authentication is available for Claude SDK
 # The SDK expects CLAUDE_CODE_OAUTH_TOKEN (preferred) or ANTHROPIC_API_KEY
@@ -70,7 +73,7 @@ if leaked_api_key:
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.orchestrator import AgentOrchestrator, SessionInfo, SessionStatus, SessionType
-from core.database_connection import DatabaseManager, is_postgresql_configured, get_db
+from core.database_connection import is_postgresql_configured, get_db
 from core.config import Config
 from core.reset import reset_project
 from core.spec_generator import generate_spec_stream
@@ -104,13 +107,14 @@ class ProjectResponse(BaseModel):
     """Response model for project information."""
     model_config = {"extra": "ignore"}  # Ignore extra fields from database
 
-    id: str  # UUID as string
+    # Typed to match database rows; Pydantic serializes UUID/datetime to JSON
+    id: UUID
     name: str
-    created_at: str
-    updated_at: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
     status: str = "active"
     is_initialized: bool = False  # NEW: Whether initialization (Session 1) is complete
-    completed_at: Optional[str] = None  # Timestamp when all tasks completed
+    completed_at: Optional[datetime] = None  # Timestamp when all tasks completed
     total_cost_usd: float = 0.0  # Total cost across all sessions
     total_time_seconds: int = 0  # Total time in seconds across all sessions
     progress: Dict[str, Any]
@@ -132,6 +136,17 @@ class SessionStart(BaseModel):
     auto_continue: bool = Field(True, description="Auto-continue to next session after completion")
 
 
+class ProjectSettingsUpdate(BaseModel):
+    """Request model for updating project settings (only sent fields are applied)."""
+    model_config = {"extra": "allow"}  # Keep accepting settings not listed here
+
+    auto_continue: Optional[bool] = None
+    sandbox_type: Optional[str] = None
+    coding_model: Optional[str] = None
+    initializer_model: Optional[str] = None
+    max_iterations: Optional[int] = None
+
+
 class SessionResponse(BaseModel):
     """Response model for session information."""
     session_id: str  # UUID as string
@@ -147,17 +162,75 @@ class SessionResponse(BaseModel):
     metrics: Dict[str, Any] = {}
 
 
+# =============================================================================
+# JSON Serialization
+# =============================================================================
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively (e.g. Decimal)."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    return str(obj)
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    orjson serializes datetime, UUID and dict rows natively, so endpoints
+    returning this directly skip FastAPI's jsonable_encoder pass and any
+    manual isoformat()/str() conversion.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
 # =============================================================================
 # FastAPI Application
 # =============================================================================
 
+async def _flush_pending_events(project_id: str):
+    """Broadcast the latest held snapshot event(s) for a project."""
+    pending = pending_project_events.pop(project_id, None)
+    if pending:
+        for message in pending.values():
+            await notify_project_update(project_id, message)
+
+
+async def _flush_events_after_delay(project_id: str):
+    """Flush coalesced events once the coalescing window has elapsed."""
+    try:
+        await asyncio.sleep(EVENT_COALESCE_SECONDS)
+    finally:
+        # Deregister before flushing so events arriving mid-flush start a new window
+        if event_flush_tasks.get(project_id) is asyncio.current_task():
+            del event_flush_tasks[project_id]
+    await _flush_pending_events(project_id)
+
+
 # Global orchestrator instance (needs to be created before lifespan)
 async def orchestrator_event_callback(project_id: UUID, event_type: str, data: Dict[str, Any]):
     """Handle events from the orchestrator and broadcast via WebSocket."""
-    await notify_project_update(str(project_id), {
+    project_key = str(project_id)
+    message = {
         "type": event_type,
         **data
-    })
+    }
+
+    if event_type in COALESCED_EVENT_TYPES:
+        if not active_connections.get(project_key):
+            return
+        # Keep only the newest payload per event type until the window closes
+        pending_project_events.setdefault(project_key, {})[event_type] = message
+        if project_key not in event_flush_tasks:
+            event_flush_tasks[project_key] = asyncio.create_task(_flush_events_after_delay(project_key))
+        return
+
+    # Everything else (messages, task/test updates, session lifecycle) is sent
+    # immediately, after any held snapshots so clients see events in order
+    await _flush_pending_events(project_key)
+    await notify_project_update(project_key, message)
 
 orchestrator = AgentOrchestrator(verbose=False, event_callback=orchestrator_event_callback)
 
@@ -180,16 +253,33 @@ setup_structured_logging(
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager - runs on startup and shutdown."""
-    # Startup: Clean up stale sessions from previous runs
-    logger.info("API starting up - cleaning up stale sessions...")
-    try:
-        count = await orchestrator.cleanup_stale_sessions()
-        if count > 0:
-            logger.info(f"Marked {count} stale session(s) as interrupted on startup")
-        else:
-            logger.info("No stale sessions found")
-    except Exception as e:
-        logger.error(f"Failed to cleanup stale sessions on startup: {e}")
+    # uvicorn[standard] ships uvloop/httptools; confirm which loop is serving us
+    loop_type = type(asyncio.get_running_loop())
+    logger.info(f"Event loop: {loop_type.__module__}.{loop_type.__name__}")
+
+    # Startup: Create the process-wide connection pool once so requests
+    # never pay pool creation cost on the hot path. asyncpg opens min_size
+    # connections up front, each running the pool init hook (JSONB codec +
+    # hot statement warm-up), so first requests find them ready.
+    app.state.db = None
+    if not is_postgresql_configured():
+        logger.warning("PostgreSQL not configured - API will have limited functionality")
+    else:
+        try:
+            app.state.db = await get_db()
+            logger.info("PostgreSQL connection verified")
+
+            # Clean up orphaned "running" sessions from previous server instance
+            # This provides fast UX feedback (within seconds) when server restarts.
+            # It covers every session the stale sweep would catch, so the stale
+            # sweep only runs periodically below.
+            cleaned = await cleanup_orphaned_sessions(app.state.db)
+            if cleaned > 0:
+                logger.info(f"✓ Cleaned up {cleaned} orphaned session(s) from previous server instance")
+            else:
+                logger.info("No orphaned sessions found")
+        except Exception as e:
+            logger.error(f"Failed to connect to PostgreSQL: {e}")
 
     # Start periodic cleanup background task
     cleanup_task = None
@@ -220,6 +310,7 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
     logger.info("API shutting down")
+    await shutdown_event()
 
 
 app = FastAPI(
@@ -227,6 +318,7 @@ app = FastAPI(
     description="API for managing autonomous coding agent projects and sessions with PostgreSQL backend",
     version="2.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware (allow all origins for now - restrict in production)
@@ -264,26 +356,55 @@ app.include_router(prompt_improvements_router)
 # Load configuration
 config = Config.load_default()
 
-# Active WebSocket connections (project_id -> list of WebSockets)
-active_connections: Dict[str, List[WebSocket]] = {}
+# Default models, resolved once (config is loaded at import and never reloaded)
+DEFAULT_INITIALIZER_MODEL = config.models.initializer
+DEFAULT_CODING_MODEL = config.models.coding
+
+# Active WebSocket connections (project_id -> set of WebSockets). Weak
+# references, so a socket that skipped explicit cleanup can't be kept alive
+active_connections: Dict[str, "weakref.WeakSet[WebSocket]"] = {}
+
+# Outbound WebSocket batching: broadcasts are queued per project and a writer
+# task ships everything queued within a short window as one JSON array frame
+WS_BATCH_MAX_MESSAGES = 64
+WS_BATCH_MAX_WAIT_SECONDS = 0.015
+# Agent progress events arrive in rapid streams, so a lone one still waits out
+# the window for followers instead of going out in a frame of its own
+WS_BATCH_WAIT_MESSAGE_TYPES = {"progress"}
+ws_outbound_queues: Dict[str, asyncio.Queue] = {}
+ws_writer_tasks: Dict[str, asyncio.Task] = {}
+# Each client has its own bounded queue drained by its own writer task, so a
+# slow client drops its oldest frames instead of delaying everyone else
+WS_CLIENT_QUEUE_SIZE = 256
+ws_client_queues: "weakref.WeakKeyDictionary[WebSocket, asyncio.Queue]" = weakref.WeakKeyDictionary()
+
+# Orchestrator event coalescing: snapshot-style events (only the latest value
+# matters to clients) are held per project and flushed at most once per window
+COALESCED_EVENT_TYPES = {"tool_use"}
+EVENT_COALESCE_SECONDS = 0.05
+pending_project_events: Dict[str, Dict[str, Dict[str, Any]]] = {}
+event_flush_tasks: Dict[str, asyncio.Task] = {}
 
 # Background tasks for running sessions
 running_sessions: Dict[str, asyncio.Task] = {}
 
 
-# Helper function to convert datetime fields
-def convert_datetimes_to_str(data: Dict[str, Any], fields: List[str] = None) -> Dict[str, Any]:
-    """Convert datetime fields to ISO format strings for JSON serialization."""
-    if fields is None:
-        fields = ['created_at', 'updated_at', 'started_at', 'ended_at', 'env_configured_at', 'completed_at']
+def _spawn_session_task(project_id: str, coro) -> asyncio.Task:
+    """
+    Run a session coroutine in the background, tracked in running_sessions.
+
+    The entry is dropped when the task finishes (unless a newer task has
+    replaced it), so finished sessions don't accumulate.
+    """
+    task = asyncio.create_task(coro)
+    running_sessions[project_id] = task
 
-    for field in fields:
-        if field in data and data[field]:
-            if hasattr(data[field], 'isoformat'):
-                data[field] = data[field].isoformat()
-            else:
-                data[field] = str(data[field])
-    return data
+    def _forget(done: asyncio.Task):
+        if running_sessions.get(project_id) is done:
+            del running_sessions[project_id]
+
+    task.add_done_callback(_forget)
+    return task
 
 
 # =============================================================================
@@ -309,78 +430,75 @@ async def cleanup_orphaned_sessions(db: Any) -> int:
     async with db.acquire() as conn:
         # Mark any 'running' sessions as interrupted
         # These are sessions from the previous server instance that didn't clean up
-        result = await conn.execute(
+        # Count the updated rows in the same statement instead of parsing "UPDATE N"
+        count = await conn.fetchval(
             """
-            UPDATE sessions
-            SET status = 'interrupted',
-                ended_at = COALESCE(ended_at, NOW()),
-                interruption_reason = 'Server was restarted while session was running'
-            WHERE status = 'running'
-              AND ended_at IS NULL
+            WITH interrupted AS (
+                UPDATE sessions
+                SET status = 'interrupted',
+                    ended_at = COALESCE(ended_at, NOW()),
+                    interruption_reason = 'Server was restarted while session was running'
+                WHERE status = 'running'
+                  AND ended_at IS NULL
+                RETURNING 1
+            )
+            SELECT count(*) FROM interrupted
             """
         )
-
-        # Extract count from "UPDATE N" result
-        count = int(result.split()[-1]) if result else 0
-        return count
+        return count or 0
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database connection on startup."""
-    if not is_postgresql_configured():
-        logger.warning("PostgreSQL not configured - API will have limited functionality")
-    else:
-        # Test database connection
-        try:
-            async with DatabaseManager() as db:
-                logger.info("PostgreSQL connection verified")
-
-                # Clean up orphaned "running" sessions from previous server instance
-                # This provides fast UX feedback (within seconds) when server restarts
-                cleaned = await cleanup_orphaned_sessions(db)
-                if cleaned > 0:
-                    logger.info(f"✓ Cleaned up {cleaned} orphaned session(s) from previous server instance")
-        except Exception as e:
-            logger.error(f"Failed to connect to PostgreSQL: {e}")
-
-
-@app.on_event("shutdown")
 async def shutdown_event():
-    """Clean up on shutdown."""
-    # Cancel any running sessions
-    for session_id, task in running_sessions.items():
-        if not task.done():
-            task.cancel()
+    """Clean up on shutdown (called from lifespan)."""
+    # Cancel running sessions, event flushes and WebSocket batch writers, then wait for
+    # all of them together rather than one after another
+    pending = [
+        task
+        for task in (*running_sessions.values(), *event_flush_tasks.values(), *ws_writer_tasks.values())
+        if not task.done()
+    ]
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    # Close WebSocket connections concurrently (errors are ignored)
+    await asyncio.gather(
+        *(ws.close() for connections in list(active_connections.values()) for ws in list(connections)),
+        return_exceptions=True
+    )
 
-    # Close database connection pool
+    # Close database connection pool once nothing is using it
     from core.database_connection import close_db
     await close_db()
 
-    # Close WebSocket connections
-    for connections in active_connections.values():
-        for ws in connections:
-            try:
-                await ws.close()
-            except Exception:
-                pass
-
 
 # =============================================================================
 # Health & Info Endpoints
 # =============================================================================
 
+# Liveness/readiness probes can hit /api/health many times per second, so the
+# serialized body (timestamp included) is rebuilt at most once per interval
+HEALTH_CACHE_SECONDS = 1.0
+_health_cache: Tuple[float, bytes] = (float("-inf"), b"")
+
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
-    db_status = "healthy" if is_postgresql_configured() else "not configured"
+    global _health_cache
+
+    now = time.monotonic()
+    if now - _health_cache[0] >= HEALTH_CACHE_SECONDS:
+        db_status = "healthy" if is_postgresql_configured() else "not configured"
+        body = orjson.dumps({
+            "status": "healthy",
+            "timestamp": datetime.now().isoformat(),
+            "version": "2.0.0",
+            "database": db_status,
+        })
+        _health_cache = (now, body)
 
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "version": "2.0.0",
-        "database": db_status,
-    }
+    return Response(content=_health_cache[1], media_type="application/json")
 
 
 @app.get("/api/info")
@@ -390,8 +508,8 @@ async def get_info(current_user: dict = Depends(get_current_user)):
         "version": "2.0.0",
         "database_configured": is_postgresql_configured(),
         "default_models": {
-            "initializer": config.models.initializer,
-            "coding": config.models.coding,
+            "initializer": DEFAULT_INITIALIZER_MODEL,
+            "coding": DEFAULT_CODING_MODEL,
         },
         "generations_dir": config.project.default_generations_dir,
     }
@@ -409,13 +527,13 @@ async def trigger_orphaned_session_cleanup(current_user: dict = Depends(get_curr
         raise HTTPException(status_code=503, detail="Database not configured")
 
     try:
-        async with DatabaseManager() as db:
-            cleaned = await cleanup_orphaned_sessions(db)
-            return {
-                "success": True,
-                "cleaned_count": cleaned,
-                "message": f"Cleaned up {cleaned} orphaned session(s)"
-            }
+        db = await get_db()
+        cleaned = await cleanup_orphaned_sessions(db)
+        return {
+            "success": True,
+            "cleaned_count": cleaned,
+            "message": f"Cleaned up {cleaned} orphaned session(s)"
+        }
     except Exception as e:
         logger.error(f"Failed to cleanup orphaned sessions: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -489,6 +607,17 @@ async def verify_token(current_user: dict = Depends(get_current_user)):
 # Helper Functions
 # =============================================================================
 
+# Chunk size for streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _copy_upload_to_path(upload: UploadFile, dest: Path) -> None:
+    """Stream an upload's spooled file to dest in fixed-size chunks (blocking)."""
+    upload.file.seek(0)
+    with open(dest, 'wb') as out:
+        shutil.copyfileobj(upload.file, out, UPLOAD_CHUNK_SIZE)
+
+
 async def _handle_multi_file_upload(
     spec_files: List[UploadFile],
     project_name: str
@@ -513,11 +642,11 @@ async def _handle_multi_file_upload(
     temp_dir = Path(tempfile.mkdtemp(prefix=f"spec_{project_name}_"))
 
     try:
-        # Save all uploaded files
+        # Stream each upload to disk off the event loop instead of
+        # buffering whole files in memory
         for file in spec_files:
             file_path = temp_dir / file.filename
-            content = await file.read()
-            file_path.write_bytes(content)
+            await asyncio.to_thread(_copy_upload_to_path, file, file_path)
 
         logger.info(f"Saved {len(spec_files)} spec files to {temp_dir}")
         return temp_dir
@@ -539,20 +668,14 @@ async def list_projects(current_user: dict = Depends(get_current_user)):
     try:
         projects = await orchestrator.list_projects()
 
-        # Convert UUIDs and datetimes for JSON serialization
-        # Also extract sandbox_type from metadata for easier frontend access
+        # Extract sandbox_type from metadata for easier frontend access
+        # (ProjectResponse serializes UUIDs and datetimes)
         response_projects = []
         for p in projects:
             project_dict = dict(p)
-            project_dict['id'] = str(project_dict.get('id', ''))
-            project_dict = convert_datetimes_to_str(project_dict)
 
             # Extract sandbox_type from metadata to top level
-            metadata = project_dict.get('metadata', {})
-            if isinstance(metadata, str):
-                metadata = json.loads(metadata)
-            if metadata is None:
-                metadata = {}
+            metadata = project_dict.get('metadata') or {}
 
             # sandbox_type is nested in metadata.settings
             settings = metadata.get('settings', {})
@@ -658,6 +781,10 @@ async def validate_spec(
 # Project Management Endpoints
 # ============================================================================
 
+# Project names double as directory and container names
+PROJECT_NAME_PATTERN = re.compile(r'[a-z0-9_-]+')
+
+
 @app.post("/api/projects", response_model=ProjectResponse)
 async def create_project(
     name: str = Form(...),
@@ -684,9 +811,8 @@ async def create_project(
     """
     try:
         # Validate project name format
-        import re
         import json as json_module
-        if not re.match(r'^[a-z0-9_-]+$', name):
+        if not PROJECT_NAME_PATTERN.fullmatch(name):
             raise HTTPException(
                 status_code=400,
                 detail="Project name must contain only lowercase letters, numbers, hyphens, and underscores (no spaces or special characters)"
@@ -744,8 +870,6 @@ async def create_project(
 
         # Convert for response
         project_dict = dict(project)
-        project_dict['id'] = str(project_dict.get('id', ''))
-        project_dict = convert_datetimes_to_str(project_dict)
 
         # Add default values for response
         project_dict['progress'] = {'total_tasks': 0, 'completed_tasks': 0}
@@ -764,24 +888,16 @@ async def create_project(
 
 
 @app.get("/api/projects/{project_id}", response_model=ProjectResponse)
-async def get_project(project_id: str, current_user: dict = Depends(get_current_user)):
+async def get_project(project_id: UUID, current_user: dict = Depends(get_current_user)):
     """Get project details by ID."""
     try:
-        # Convert string to UUID
-        project_uuid = UUID(project_id)
-        project_info = await orchestrator.get_project_info(project_uuid)
+        project_info = await orchestrator.get_project_info(project_id)
 
         # Convert for response
         project_dict = dict(project_info)
-        project_dict['id'] = str(project_dict.get('id', ''))
-        project_dict = convert_datetimes_to_str(project_dict)
 
         # Extract sandbox_type from metadata to top level
-        metadata = project_dict.get('metadata', {})
-        if isinstance(metadata, str):
-            metadata = json.loads(metadata)
-        if metadata is None:
-            metadata = {}
+        metadata = project_dict.get('metadata') or {}
 
         # sandbox_type is nested in metadata.settings
         settings = metadata.get('settings', {})
@@ -790,31 +906,24 @@ async def get_project(project_id: str, current_user: dict = Depends(get_current_
 
         return project_dict
     except ValueError as e:
-        if "not found" in str(e).lower():
-            raise HTTPException(status_code=404, detail=str(e))
-        else:
-            raise HTTPException(status_code=400, detail="Invalid project ID format")
+        # Malformed IDs are rejected by FastAPI (422); ValueError means not found
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to get project {project_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.delete("/api/projects/{project_id}")
-async def delete_project(project_id: str):
+async def delete_project(project_id: UUID):
     """Delete a project and all associated data."""
     try:
-        # Convert string to UUID
-        project_uuid = UUID(project_id)
-
         # Delete the project
-        await orchestrator.delete_project(project_uuid)
+        await orchestrator.delete_project(project_id)
 
         return {"message": f"Project {project_id} deleted successfully"}
     except ValueError as e:
-        if "not found" in str(e).lower():
-            raise HTTPException(status_code=404, detail=str(e))
-        else:
-            raise HTTPException(status_code=400, detail="Invalid project ID format")
+        # Malformed IDs are rejected by FastAPI (422); ValueError means not found
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to delete project {project_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -826,97 +935,87 @@ async def delete_project(project_id: str):
 
 def extract_sandbox_type(project: dict) -> str:
     """Extract sandbox_type from project metadata."""
-    metadata = project.get('metadata', {})
-    if isinstance(metadata, str):
-        metadata = json.loads(metadata)
-    if metadata is None:
-        metadata = {}
+    metadata = project.get('metadata') or {}
     settings = metadata.get('settings', {})
     return settings.get('sandbox_type', 'docker')
 
 @app.get("/api/projects/{project_id}/container/status")
-async def get_container_status(project_id: str):
+async def get_container_status(project_id: UUID):
     """Get the status of a project's Docker container."""
     try:
         from core.sandbox_manager import SandboxManager
 
         # Get project from database
-        project_uuid = UUID(project_id)
-        async with DatabaseManager() as db:
-            project = await db.get_project(project_uuid)
+        db = await get_db()
+        project = await db.get_project(project_id)
 
-            if not project:
-                raise HTTPException(status_code=404, detail="Project not found")
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
 
-            project_name = project.get('name')
-            sandbox_type = extract_sandbox_type(project)
+        project_name = project.get('name')
+        sandbox_type = extract_sandbox_type(project)
 
-            if sandbox_type != 'docker':
-                return {
-                    "container_exists": False,
-                    "sandbox_type": sandbox_type,
-                    "message": f"Project uses {sandbox_type} sandbox (not Docker)"
-                }
+        if sandbox_type != 'docker':
+            return {
+                "container_exists": False,
+                "sandbox_type": sandbox_type,
+                "message": f"Project uses {sandbox_type} sandbox (not Docker)"
+            }
 
-            # Get container status
-            status = SandboxManager.get_docker_container_status(project_name)
+        # Get container status
+        status = SandboxManager.get_docker_container_status(project_name)
 
-            if status:
-                return {
-                    "container_exists": True,
-                    "status": status['status'],
-                    "container_id": status['id'],
-                    "container_name": status['name'],
-                    "ports": status.get('ports', {}),
-                    "sandbox_type": sandbox_type
-                }
-            else:
-                return {
-                    "container_exists": False,
-                    "sandbox_type": sandbox_type,
-                    "message": "No container found for this project"
-                }
+        if status:
+            return {
+                "container_exists": True,
+                "status": status['status'],
+                "container_id": status['id'],
+                "container_name": status['name'],
+                "ports": status.get('ports', {}),
+                "sandbox_type": sandbox_type
+            }
+        else:
+            return {
+                "container_exists": False,
+                "sandbox_type": sandbox_type,
+                "message": "No container found for this project"
+            }
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID format")
     except Exception as e:
         logger.error(f"Failed to get container status for project {project_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/projects/{project_id}/container/start")
-async def start_container(project_id: str):
+async def start_container(project_id: UUID):
     """Start a project's Docker container."""
     try:
         from core.sandbox_manager import SandboxManager
 
         # Get project from database
-        project_uuid = UUID(project_id)
-        async with DatabaseManager() as db:
-            project = await db.get_project(project_uuid)
+        db = await get_db()
+        project = await db.get_project(project_id)
 
-            if not project:
-                raise HTTPException(status_code=404, detail="Project not found")
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
 
-            project_name = project.get('name')
-            sandbox_type = extract_sandbox_type(project)
+        project_name = project.get('name')
+        sandbox_type = extract_sandbox_type(project)
 
-            if sandbox_type != 'docker':
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Project uses {sandbox_type} sandbox (not Docker)"
-                )
+        if sandbox_type != 'docker':
+            raise HTTPException(
+                status_code=400,
+                detail=f"Project uses {sandbox_type} sandbox (not Docker)"
+            )
 
-            # Start the container
-            started = SandboxManager.start_docker_container(project_name)
+        # Start the container
+        started = SandboxManager.start_docker_container(project_name)
 
-            if started:
-                return {"message": f"Container started successfully", "started": True}
-            else:
-                return {"message": "Container was already running or doesn't exist", "started": False}
+        if started:
+            return {"message": f"Container started successfully", "started": True}
+        else:
+            return {"message": "Container was already running or doesn't exist", "started": False}
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID format")
     except HTTPException:
         raise
     except Exception as e:
@@ -925,38 +1024,35 @@ async def start_container(project_id: str):
 
 
 @app.post("/api/projects/{project_id}/container/stop")
-async def stop_container(project_id: str):
+async def stop_container(project_id: UUID):
     """Stop a project's Docker container."""
     try:
         from core.sandbox_manager import SandboxManager
 
         # Get project from database
-        project_uuid = UUID(project_id)
-        async with DatabaseManager() as db:
-            project = await db.get_project(project_uuid)
+        db = await get_db()
+        project = await db.get_project(project_id)
 
-            if not project:
-                raise HTTPException(status_code=404, detail="Project not found")
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
 
-            project_name = project.get('name')
-            sandbox_type = extract_sandbox_type(project)
+        project_name = project.get('name')
+        sandbox_type = extract_sandbox_type(project)
 
-            if sandbox_type != 'docker':
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Project uses {sandbox_type} sandbox (not Docker)"
-                )
+        if sandbox_type != 'docker':
+            raise HTTPException(
+                status_code=400,
+                detail=f"Project uses {sandbox_type} sandbox (not Docker)"
+            )
 
-            # Stop the container
-            stopped = SandboxManager.stop_docker_container(project_name)
+        # Stop the container
+        stopped = SandboxManager.stop_docker_container(project_name)
 
-            if stopped:
-                return {"message": "Container stopped successfully", "stopped": True}
-            else:
-                return {"message": "Container was not running or doesn't exist", "stopped": False}
+        if stopped:
+            return {"message": "Container stopped successfully", "stopped": True}
+        else:
+            return {"message": "Container was not running or doesn't exist", "stopped": False}
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID format")
     except HTTPException:
         raise
     except Exception as e:
@@ -965,38 +1061,35 @@ async def stop_container(project_id: str):
 
 
 @app.delete("/api/projects/{project_id}/container")
-async def delete_container(project_id: str):
+async def delete_container(project_id: UUID):
     """Delete a project's Docker container."""
     try:
         from core.sandbox_manager import SandboxManager
 
         # Get project from database
-        project_uuid = UUID(project_id)
-        async with DatabaseManager() as db:
-            project = await db.get_project(project_uuid)
+        db = await get_db()
+        project = await db.get_project(project_id)
 
-            if not project:
-                raise HTTPException(status_code=404, detail="Project not found")
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
 
-            project_name = project.get('name')
-            sandbox_type = extract_sandbox_type(project)
+        project_name = project.get('name')
+        sandbox_type = extract_sandbox_type(project)
 
-            if sandbox_type != 'docker':
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Project uses {sandbox_type} sandbox (not Docker)"
-                )
+        if sandbox_type != 'docker':
+            raise HTTPException(
+                status_code=400,
+                detail=f"Project uses {sandbox_type} sandbox (not Docker)"
+            )
 
-            # Delete the container
-            deleted = SandboxManager.delete_docker_container(project_name)
+        # Delete the container
+        deleted = SandboxManager.delete_docker_container(project_name)
 
-            if deleted:
-                return {"message": "Container deleted successfully", "deleted": True}
-            else:
-                return {"message": "Container doesn't exist", "deleted": False}
+        if deleted:
+            return {"message": "Container deleted successfully", "deleted": True}
+        else:
+            return {"message": "Container doesn't exist", "deleted": False}
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID format")
     except HTTPException:
         raise
     except Exception as e:
@@ -1005,27 +1098,23 @@ async def delete_container(project_id: str):
 
 
 @app.get("/api/projects/{project_id}/progress")
-async def get_project_progress(project_id: str):
+async def get_project_progress(project_id: UUID):
     """Get project progress statistics."""
     try:
-        project_uuid = UUID(project_id)
-        async with DatabaseManager() as db:
-            progress = await db.get_progress(project_uuid)
+        db = await get_db()
+        progress = await db.get_progress(project_id)
 
-            # Convert Decimal values to float for JSON serialization
-            if 'task_completion_pct' in progress:
-                progress['task_completion_pct'] = float(progress['task_completion_pct'])
-            if 'test_pass_pct' in progress:
-                progress['test_pass_pct'] = float(progress['test_pass_pct'])
+        # Convert Decimal values to float for JSON serialization
+        progress = {k: float(v) if isinstance(v, Decimal) else v for k, v in progress.items()}
 
-            return progress
+        return ORJSONResponse(progress)
     except Exception as e:
         logger.error(f"Failed to get progress for project {project_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/projects/{project_id}/coverage")
-async def get_test_coverage(project_id: str):
+async def get_test_coverage(project_id: UUID):
     """
     Get test coverage analysis for a project.
 
@@ -1033,19 +1122,16 @@ async def get_test_coverage(project_id: str):
     including overall statistics, per-epic breakdown, and warnings.
     """
     try:
-        project_uuid = UUID(project_id)
-        async with DatabaseManager() as db:
-            coverage = await db.get_test_coverage(project_uuid)
+        db = await get_db()
+        coverage = await db.get_test_coverage(project_id)
 
-            if not coverage:
-                raise HTTPException(
-                    status_code=404,
-                    detail="Test coverage not available. Run initialization session first."
-                )
+        if not coverage:
+            raise HTTPException(
+                status_code=404,
+                detail="Test coverage not available. Run initialization session first."
+            )
 
-            return coverage
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID format")
+        return coverage
     except HTTPException:
         raise
     except Exception as e:
@@ -1054,46 +1140,56 @@ async def get_test_coverage(project_id: str):
 
 
 @app.get("/api/projects/{project_id}/epics")
-async def get_project_epics(project_id: str):
+async def get_project_epics(project_id: UUID):
     """Get all epics for a project."""
     try:
-        project_uuid = UUID(project_id)
-        async with DatabaseManager() as db:
-            epics = await db.list_epics(project_uuid)
-            return epics
+        db = await get_db()
+        epics = await db.list_epics(project_id)
+        return epics
     except Exception as e:
         logger.error(f"Failed to get epics for project {project_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Task status filter values -> tasks.done (tasks only track completion)
+TASK_STATUS_FILTERS = {"pending": False, "completed": True}
+
+
 @app.get("/api/projects/{project_id}/tasks")
-async def get_project_tasks(project_id: str, status: Optional[str] = None):
-    """Get all tasks for a project."""
+async def get_project_tasks(
+    project_id: UUID,
+    status: Optional[str] = None,
+    done: Optional[bool] = None,
+    epic_id: Optional[int] = None
+):
+    """Get all tasks for a project, optionally filtered by status/done/epic."""
+    if status is not None:
+        if status not in TASK_STATUS_FILTERS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid status filter '{status}'. Use one of: {', '.join(TASK_STATUS_FILTERS)}"
+            )
+        done = TASK_STATUS_FILTERS[status]
+
     try:
-        project_uuid = UUID(project_id)
-        async with DatabaseManager() as db:
-            tasks = await db.list_tasks(project_uuid)
-            # Filter by status if provided
-            if status:
-                tasks = [t for t in tasks if t.get('status') == status]
-            return tasks
+        db = await get_db()
+        # Filtering happens in SQL so unmatched rows never leave Postgres
+        tasks = await db.list_tasks(project_id, epic_id=epic_id, done=done)
+        return tasks
     except Exception as e:
         logger.error(f"Failed to get tasks for project {project_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/projects/{project_id}/tasks/{task_id}")
-async def get_task_detail(project_id: str, task_id: int):
+async def get_task_detail(project_id: UUID, task_id: int):
     """Get detailed task information including tests and epic context."""
     try:
-        project_uuid = UUID(project_id)
-        async with DatabaseManager() as db:
-            task = await db.get_task_with_tests(task_id, project_uuid)
-            if not task:
-                raise HTTPException(status_code=404, detail="Task not found")
-            return task
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID")
+        db = await get_db()
+        task = await db.get_task_with_tests(task_id, project_id)
+        if not task:
+            raise HTTPException(status_code=404, detail="Task not found")
+        return task
     except HTTPException:
         raise
     except Exception as e:
@@ -1102,20 +1198,16 @@ async def get_task_detail(project_id: str, task_id: int):
 
 
 @app.get("/api/projects/{project_id}/epics/{epic_id}")
-async def get_epic_detail(project_id: str, epic_id: int):
+async def get_epic_detail(project_id: UUID, epic_id: int):
     """Get detailed epic information including all tasks."""
     try:
         logger.info(f"Getting epic detail for project={project_id}, epic_id={epic_id}")
-        project_uuid = UUID(project_id)
-        async with DatabaseManager() as db:
-            epic = await db.get_epic_with_tasks(epic_id, project_uuid)
-            logger.info(f"Epic result: {epic is not None}, tasks: {len(epic.get('tasks', [])) if epic else 0}")
-            if not epic:
-                raise HTTPException(status_code=404, detail="Epic not found")
-            return epic
-    except ValueError as e:
-        logger.error(f"ValueError: {e}")
-        raise HTTPException(status_code=400, detail="Invalid project ID")
+        db = await get_db()
+        epic = await db.get_epic_with_tasks(epic_id, project_id)
+        logger.info(f"Epic result: {epic is not None}, tasks: {len(epic.get('tasks', [])) if epic else 0}")
+        if not epic:
+            raise HTTPException(status_code=404, detail="Epic not found")
+        return epic
     except HTTPException:
         raise
     except Exception as e:
@@ -1123,12 +1215,77 @@ async def get_epic_detail(project_id: str, epic_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Parsed .env.example files: path -> (st_mtime_ns, variables)
+_env_example_cache: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+
+
+# One match per comment or KEY=value line, so each file is parsed in a single pass
+ENV_EXAMPLE_LINE_RE = re.compile(r'^(?:#+(?P<comment>.*)|(?P<key>[^=\n]*)=(?P<value>.*))$', re.MULTILINE)
+ENV_VALUE_LINE_RE = re.compile(r'^[ \t]*(?P<key>(?:[^#\s=][^=\n]*)?)=(?P<value>.*)$', re.MULTILINE)
+
+
+def _parse_env_example(env_example_path: Path) -> List[Dict[str, Any]]:
+    """Parse .env.example into variable entries (key, default value, comment, required)."""
+    variables = []
+    current_comment = None
+
+    for match in ENV_EXAMPLE_LINE_RE.finditer(env_example_path.read_text()):
+        key = match.group('key')
+
+        # Comment line
+        if key is None:
+            comment_text = match.group('comment').strip()
+            if comment_text:
+                current_comment = comment_text
+            continue
+
+        # Variable line
+        default_value = match.group('value').strip().strip('"').strip("'")
+
+        # Determine if required
+        required = not default_value or default_value.startswith('your_')
+
+        variables.append({
+            "key": key.strip(),
+            "value": default_value,
+            "comment": current_comment,
+            "required": required
+        })
+        current_comment = None
+
+    return variables
+
+
+def _parse_env_values(env_path: Path) -> Dict[str, str]:
+    """Parse current KEY=value pairs from a .env file."""
+    return {
+        match.group('key').strip(): match.group('value').strip().strip('"').strip("'")
+        for match in ENV_VALUE_LINE_RE.finditer(env_path.read_text())
+    }
+
+
+async def _get_env_example_variables(env_example_path: Path, mtime_ns: int) -> List[Dict[str, Any]]:
+    """
+    Get parsed .env.example variables, re-parsing only when the file changes.
+
+    Returns fresh dict copies so callers can merge in current .env values.
+    """
+    cache_key = str(env_example_path)
+    cached = _env_example_cache.get(cache_key)
+    if cached is None or cached[0] != mtime_ns:
+        variables = await asyncio.to_thread(_parse_env_example, env_example_path)
+        _env_example_cache[cache_key] = (mtime_ns, variables)
+    else:
+        variables = cached[1]
+
+    return [dict(var) for var in variables]
+
+
 @app.get("/api/projects/{project_id}/env")
-async def get_env_config(project_id: str):
+async def get_env_config(project_id: UUID):
     """Get environment configuration for a project."""
     try:
-        project_uuid = UUID(project_id)
-        project_info = await orchestrator.get_project_info(project_uuid)
+        project_info = await orchestrator.get_project_info(project_id)
 
         # Get project path from local_path field
         project_path = Path(project_info.get('local_path', ''))
@@ -1138,50 +1295,17 @@ async def get_env_config(project_id: str):
         env_example_path = project_path / ".env.example"
         env_path = project_path / ".env"
 
-        if not env_example_path.exists():
+        try:
+            example_mtime_ns = env_example_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return {"has_env_example": False, "variables": []}
 
-        # Parse .env.example for variable structure and comments
-        variables = []
-        current_comment = None
-
-        with open(env_example_path, 'r') as f:
-            for line in f:
-                line = line.rstrip()
-
-                # Comment line
-                if line.startswith('#'):
-                    comment_text = line.lstrip('#').strip()
-                    if comment_text:
-                        current_comment = comment_text
-                    continue
-
-                # Variable line
-                if '=' in line:
-                    key, default_value = line.split('=', 1)
-                    key = key.strip()
-                    default_value = default_value.strip().strip('"').strip("'")
-
-                    # Determine if required
-                    required = not default_value or default_value.startswith('your_') or default_value == ''
-
-                    variables.append({
-                        "key": key,
-                        "value": default_value,
-                        "comment": current_comment,
-                        "required": required
-                    })
-                    current_comment = None
+        # Parse .env.example for variable structure and comments (cached by mtime)
+        variables = await _get_env_example_variables(env_example_path, example_mtime_ns)
 
         # Load current values from .env if it exists
         if env_path.exists():
-            env_values = {}
-            with open(env_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        env_values[key.strip()] = value.strip().strip('"').strip("'")
+            env_values = await asyncio.to_thread(_parse_env_values, env_path)
 
             # Update variables with current values
             for var in variables:
@@ -1196,11 +1320,10 @@ async def get_env_config(project_id: str):
 
 
 @app.post("/api/projects/{project_id}/env")
-async def save_env_config(project_id: str, payload: Dict[str, Any]):
+async def save_env_config(project_id: UUID, payload: Dict[str, Any]):
     """Save environment configuration to .env file."""
     try:
-        project_uuid = UUID(project_id)
-        project_info = await orchestrator.get_project_info(project_uuid)
+        project_info = await orchestrator.get_project_info(project_id)
 
         # Get project path
         project_path = Path(project_info.get('local_path', ''))
@@ -1210,29 +1333,33 @@ async def save_env_config(project_id: str, payload: Dict[str, Any]):
         variables = payload.get("variables", [])
         env_path = project_path / ".env"
 
-        with open(env_path, 'w') as f:
-            f.write("# Environment Configuration\n")
-            f.write("# Generated by Autonomous Coding Agent Web UI\n")
-            f.write(f"# Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        # Build the whole file in memory, then write it in one call off the event loop
+        lines = [
+            "# Environment Configuration\n",
+            "# Generated by Autonomous Coding Agent Web UI\n",
+            f"# Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        ]
+
+        for var in variables:
+            key = var.get("key", "")
+            value = var.get("value", "")
+            comment = var.get("comment", "")
 
-            for var in variables:
-                key = var.get("key", "")
-                value = var.get("value", "")
-                comment = var.get("comment", "")
+            if comment:
+                lines.append(f"# {comment}\n")
 
-                if comment:
-                    f.write(f"# {comment}\n")
+            # Quote value if it contains spaces
+            if ' ' in value:
+                lines.append(f'{key}="{value}"\n')
+            else:
+                lines.append(f'{key}={value}\n')
 
-                # Quote value if it contains spaces
-                if ' ' in value:
-                    f.write(f'{key}="{value}"\n')
-                else:
-                    f.write(f'{key}={value}\n')
+            lines.append('\n')
 
-                f.write('\n')
+        await asyncio.to_thread(env_path.write_text, "".join(lines))
 
         # Mark environment as configured in database
-        await orchestrator.mark_env_configured(project_uuid)
+        await orchestrator.mark_env_configured(project_id)
 
         return {
             "status": "saved",
@@ -1250,25 +1377,21 @@ async def save_env_config(project_id: str, payload: Dict[str, Any]):
 # =============================================================================
 
 @app.get("/api/projects/{project_id}/settings")
-async def get_project_settings(project_id: str):
+async def get_project_settings(project_id: UUID):
     """Get project settings."""
     try:
-        project_uuid = UUID(project_id)
-
-        async with DatabaseManager() as db:
-            settings = await db.get_project_settings(project_uuid)
+        db = await get_db()
+        settings = await db.get_project_settings(project_id)
 
         return settings
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID format")
     except Exception as e:
         logger.error(f"Failed to get settings for project {project_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.put("/api/projects/{project_id}/settings")
-async def update_project_settings(project_id: str, settings: Dict[str, Any]):
+async def update_project_settings(project_id: UUID, update: ProjectSettingsUpdate):
     """
     Update project settings.
 
@@ -1280,10 +1403,10 @@ async def update_project_settings(project_id: str, settings: Dict[str, Any]):
     - max_iterations: int | null - Max sessions per auto-run
     """
     try:
-        project_uuid = UUID(project_id)
-
-        async with DatabaseManager() as db:
-            await db.update_project_settings(project_uuid, settings)
+        # Explicit nulls are kept (max_iterations=None means unlimited)
+        settings = update.model_dump(exclude_unset=True)
+        db = await get_db()
+        await db.update_project_settings(project_id, settings)
 
         return {
             "status": "updated",
@@ -1291,15 +1414,13 @@ async def update_project_settings(project_id: str, settings: Dict[str, Any]):
             "settings": settings
         }
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID format")
     except Exception as e:
         logger.error(f"Failed to update settings for project {project_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.patch("/api/projects/{project_id}")
-async def rename_project(project_id: str, name: str = Body(..., embed=True)):
+async def rename_project(project_id: UUID, name: str = Body(..., embed=True)):
     """
     Rename a project.
 
@@ -1317,14 +1438,12 @@ async def rename_project(project_id: str, name: str = Body(..., embed=True)):
         500: Server error
     """
     try:
-        project_uuid = UUID(project_id)
-
-        async with DatabaseManager() as db:
-            # Rename the project (will raise ValueError if name in use or project not found)
-            await db.rename_project(project_uuid, name)
+        db = await get_db()
+        # Rename the project (will raise ValueError if name in use or project not found)
+        await db.rename_project(project_id, name)
 
         # Get updated project info
-        project = await orchestrator.get_project_info(project_uuid)
+        project = await orchestrator.get_project_info(project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found after rename")
 
@@ -1344,7 +1463,7 @@ async def rename_project(project_id: str, name: str = Body(..., embed=True)):
 
 
 @app.post("/api/projects/{project_id}/reset")
-async def reset_project_endpoint(project_id: str):
+async def reset_project_endpoint(project_id: UUID):
     """
     Reset project to post-initialization state.
 
@@ -1369,43 +1488,38 @@ async def reset_project_endpoint(project_id: str):
         500: Reset operation failed
     """
     try:
-        project_uuid = UUID(project_id)
-
         # Get project info
-        async with DatabaseManager() as db:
-            project = await db.get_project(project_uuid)
-            if not project:
-                raise HTTPException(status_code=404, detail="Project not found")
+        db = await get_db()
+        # Project and running session come back from a single query
+        project, active_session = await db.get_project_with_active_session(project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
 
-            # Check if there's an active session
-            active_session = await db.get_active_session(project_uuid)
-            if active_session:
-                raise HTTPException(
-                    status_code=409,
-                    detail="Cannot reset project while a session is running. Stop the session first."
-                )
+        # Check if there's an active session
+        if active_session:
+            raise HTTPException(
+                status_code=409,
+                detail="Cannot reset project while a session is running. Stop the session first."
+            )
 
-            # Get local_path from metadata
-            metadata = project.get('metadata', {})
-            if isinstance(metadata, str):
-                import json
-                metadata = json.loads(metadata)
+        # Get local_path from metadata
+        metadata = project.get('metadata') or {}
 
-            local_path = metadata.get('local_path')
-            if not local_path:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Project has no local path configured"
-                )
+        local_path = metadata.get('local_path')
+        if not local_path:
+            raise HTTPException(
+                status_code=400,
+                detail="Project has no local path configured"
+            )
 
         # Perform reset
-        result = await reset_project(project_uuid, Path(local_path))
+        result = await reset_project(project_id, Path(local_path))
 
         if not result["success"]:
             raise HTTPException(status_code=500, detail=result.get("error", "Reset failed"))
 
         # Notify via WebSocket
-        await notify_project_update(project_id, {
+        await notify_project_update(str(project_id), {
             "type": "project_reset",
             "result": result
         })
@@ -1417,11 +1531,7 @@ async def reset_project_endpoint(project_id: str):
         }
 
     except ValueError as e:
-        error_msg = str(e)
-        if "not initialized" in error_msg.lower():
-            raise HTTPException(status_code=400, detail=error_msg)
-        else:
-            raise HTTPException(status_code=400, detail=f"Invalid project ID: {project_id}")
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
@@ -1435,7 +1545,7 @@ async def reset_project_endpoint(project_id: str):
 
 @app.post("/api/projects/{project_id}/initialize", response_model=SessionResponse)
 async def initialize_project(
-    project_id: str,
+    project_id: UUID,
     initializer_model: Optional[str] = None,
     background_tasks: BackgroundTasks = None
 ):
@@ -1461,48 +1571,37 @@ async def initialize_project(
         500: Server error during initialization
     """
     try:
-        project_uuid = UUID(project_id)
-
         # Start initialization session asynchronously
         async def run_initialization():
             try:
-                # Create progress callback for real-time WebSocket updates
-                async def progress_update(event: Dict[str, Any]):
-                    """Broadcast progress events to connected WebSocket clients."""
-                    await notify_project_update(str(project_uuid), {
-                        "type": "progress",
-                        "event": event
-                    })
-
                 session = await orchestrator.start_initialization(
-                    project_id=project_uuid,
+                    project_id=project_id,
                     initializer_model=initializer_model,
-                    progress_callback=progress_update
+                    progress_callback=partial(_broadcast_progress, str(project_id))
                 )
 
                 # Send WebSocket notification
-                await notify_project_update(str(project_uuid), {
+                await notify_project_update(str(project_id), {
                     "type": "initialization_complete",
                     "session": session.to_dict()
                 })
 
             except Exception as e:
                 logger.error(f"Initialization failed: {e}")
-                await notify_project_update(str(project_uuid), {
+                await notify_project_update(str(project_id), {
                     "type": "initialization_error",
                     "error": str(e)
                 })
 
         # Run in background
-        task = asyncio.create_task(run_initialization())
-        running_sessions[project_id] = task
+        _spawn_session_task(str(project_id), run_initialization())
 
         return {
             "session_id": "pending",  # Will be set once session starts
-            "project_id": project_id,
+            "project_id": str(project_id),
             "session_number": 1,
             "session_type": "initializer",
-            "model": initializer_model or config.models.initializer,
+            "model": initializer_model or DEFAULT_INITIALIZER_MODEL,
             "status": "pending",
             "created_at": datetime.now().isoformat(),
             "message": "Initialization started"
@@ -1522,7 +1621,7 @@ async def initialize_project(
 
 @app.post("/api/projects/{project_id}/initialize/cancel")
 async def cancel_initialization(
-    project_id: str,
+    project_id: UUID,
     current_user: dict = Depends(get_current_user)
 ):
     """
@@ -1546,55 +1645,48 @@ async def cancel_initialization(
         500: Server error
     """
     try:
-        project_uuid = UUID(project_id)
-
-        async with DatabaseManager() as db:
-            # Get project
-            project = await db.get_project(project_uuid)
-            if not project:
-                raise HTTPException(status_code=404, detail="Project not found")
-
-            # Find running initialization session
-            sessions = await db.get_session_history(project_uuid, limit=100)
-            init_session = None
-            for session in sessions:
-                # Note: column name is 'type' not 'session_type'
-                if session.get('type') == 'initializer' and session.get('status') == 'running':
-                    init_session = session
-                    break
-
-            if not init_session:
-                raise HTTPException(
-                    status_code=400,
-                    detail="No initialization session running. Nothing to cancel."
-                )
+        db = await get_db()
+        # Get project and its running session in one query
+        project, active_session = await db.get_project_with_active_session(project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
 
-            session_id = init_session['id']
+        # Note: column name is 'type' not 'session_type'
+        if not active_session or active_session.get('type') != 'initializer':
+            raise HTTPException(
+                status_code=400,
+                detail="No initialization session running. Nothing to cancel."
+            )
 
-            # Stop the session (interrupt it)
-            await orchestrator.stop_session(session_id)
+        # Built as JSONB, so the id arrives as a string
+        session_id = UUID(active_session['id'])
 
-            # Clean up database: Remove all epics, tasks, tests
-            # Use acquire() to get a connection for raw SQL
-            epics = await db.list_epics(project_uuid)
-            async with db.acquire() as conn:
-                for epic in epics:
-                    # This will cascade delete tasks and tests
-                    await conn.execute(
-                        "DELETE FROM epics WHERE id = $1",
-                        epic['id']
-                    )
+        # Stop the session (interrupt it)
+        await orchestrator.stop_session(session_id)
 
-                # Mark session as cancelled (not just interrupted)
-                await conn.execute(
-                    "UPDATE sessions SET status = $1, interruption_reason = $2, ended_at = NOW() WHERE id = $3",
-                    "interrupted",
-                    "Initialization cancelled by user",
-                    session_id
+        # Clean up database: Remove all epics, tasks, tests
+        # Use acquire() to get a connection for raw SQL
+        async with db.acquire() as conn:
+            # One round trip: the epic DELETE (cascading to tasks and tests)
+            # runs as a data-modifying CTE alongside marking the session
+            # cancelled (not just interrupted)
+            await conn.execute(
+                """
+                WITH removed_epics AS (
+                    DELETE FROM epics WHERE project_id = $1
                 )
+                UPDATE sessions
+                SET status = $2, interruption_reason = $3, ended_at = NOW()
+                WHERE id = $4
+                """,
+                project_id,
+                "interrupted",
+                "Initialization cancelled by user",
+                session_id
+            )
 
-            # Note: We keep the project directory and spec file
-            # User may want to modify spec and re-initialize
+        # Note: We keep the project directory and spec file
+        # User may want to modify spec and re-initialize
 
         return {
             "status": "cancelled",
@@ -1611,7 +1703,7 @@ async def cancel_initialization(
 
 @app.post("/api/projects/{project_id}/coding/start", response_model=SessionResponse)
 async def start_coding_sessions(
-    project_id: str,
+    project_id: UUID,
     coding_model: Optional[str] = None,
     max_iterations: Optional[int] = 0,  # 0 = unlimited
     background_tasks: BackgroundTasks = None
@@ -1639,49 +1731,38 @@ async def start_coding_sessions(
         500: Server error during session start
     """
     try:
-        project_uuid = UUID(project_id)
-
         # Start coding sessions asynchronously
         async def run_coding():
             try:
-                # Create progress callback for real-time WebSocket updates
-                async def progress_update(event: Dict[str, Any]):
-                    """Broadcast progress events to connected WebSocket clients."""
-                    await notify_project_update(str(project_uuid), {
-                        "type": "progress",
-                        "event": event
-                    })
-
                 last_session = await orchestrator.start_coding_sessions(
-                    project_id=project_uuid,
+                    project_id=project_id,
                     coding_model=coding_model,
                     max_iterations=max_iterations,
-                    progress_callback=progress_update
+                    progress_callback=partial(_broadcast_progress, str(project_id))
                 )
 
                 # Send WebSocket notification about completion
-                await notify_project_update(str(project_uuid), {
+                await notify_project_update(str(project_id), {
                     "type": "coding_sessions_complete",
                     "last_session": last_session.to_dict()
                 })
 
             except Exception as e:
                 logger.error(f"Coding sessions failed: {e}")
-                await notify_project_update(str(project_uuid), {
+                await notify_project_update(str(project_id), {
                     "type": "coding_sessions_error",
                     "error": str(e)
                 })
 
         # Run in background
-        task = asyncio.create_task(run_coding())
-        running_sessions[project_id] = task
+        _spawn_session_task(str(project_id), run_coding())
 
         return {
             "session_id": "pending",  # Will be set once session starts
-            "project_id": project_id,
+            "project_id": str(project_id),
             "session_number": 0,  # Will be determined dynamically
             "session_type": "coding",
-            "model": coding_model or config.models.coding,
+            "model": coding_model or DEFAULT_CODING_MODEL,
             "status": "pending",
             "created_at": datetime.now().isoformat(),
             "max_iterations": max_iterations,
@@ -1701,21 +1782,21 @@ async def start_coding_sessions(
 
 
 @app.post("/api/projects/{project_id}/sessions/start", response_model=SessionResponse)
-async def start_session(project_id: str, session_config: SessionStart, background_tasks: BackgroundTasks):
+async def start_session(project_id: UUID, session_config: SessionStart):
     """
     **DEPRECATED**: Use /initialize or /coding/start instead.
 
     Start a new coding session (legacy endpoint for backward compatibility).
     """
     try:
-        project_uuid = UUID(project_id)
-
         # Get default models from config if not provided
-        initializer_model = session_config.initializer_model or config.models.initializer
-        coding_model = session_config.coding_model or config.models.coding
+        initializer_model = session_config.initializer_model or DEFAULT_INITIALIZER_MODEL
+        coding_model = session_config.coding_model or DEFAULT_CODING_MODEL
 
         # Start session asynchronously
         async def run_session():
+            # One callback for every session this run starts
+            progress_callback = partial(_broadcast_progress, str(project_id))
             try:
                 if session_config.auto_continue:
                     # Auto-continue loop: run multiple sessions
@@ -1723,7 +1804,7 @@ async def start_session(project_id: str, session_config: SessionStart, backgroun
                     while True:
                         # Check max_iterations
                         if session_config.max_iterations is not None and iteration >= session_config.max_iterations:
-                            await notify_project_update(str(project_uuid), {
+                            await notify_project_update(str(project_id), {
                                 "type": "auto_continue_stopped",
                                 "reason": "max_iterations_reached",
                                 "iterations": iteration
@@ -1735,32 +1816,24 @@ async def start_session(project_id: str, session_config: SessionStart, backgroun
                         # Wait between sessions (except first)
                         if iteration > 1:
                             delay = config.timing.auto_continue_delay
-                            await notify_project_update(str(project_uuid), {
+                            await notify_project_update(str(project_id), {
                                 "type": "auto_continue_delay",
                                 "delay": delay,
                                 "next_session": iteration
                             })
                             await asyncio.sleep(delay)
 
-                        # Create progress callback for real-time WebSocket updates
-                        async def progress_update(event: Dict[str, Any]):
-                            """Broadcast progress events to connected WebSocket clients."""
-                            await notify_project_update(str(project_uuid), {
-                                "type": "progress",
-                                "event": event
-                            })
-
                         # Start session (this blocks until session completes)
                         session = await orchestrator.start_session(
-                            project_id=project_uuid,
+                            project_id=project_id,
                             initializer_model=initializer_model,
                             coding_model=coding_model,
                             max_iterations=None,  # Don't pass to individual session
-                            progress_callback=progress_update
+                            progress_callback=progress_callback
                         )
 
                         # Send WebSocket notification about session completion
-                        await notify_project_update(str(project_uuid), {
+                        await notify_project_update(str(project_id), {
                             "type": "session_completed",
                             "session": session.to_dict(),
                             "auto_continue": True,
@@ -1769,14 +1842,14 @@ async def start_session(project_id: str, session_config: SessionStart, backgroun
 
                         # Check session status
                         if session.status.value == "error":
-                            await notify_project_update(str(project_uuid), {
+                            await notify_project_update(str(project_id), {
                                 "type": "auto_continue_stopped",
                                 "reason": "session_error",
                                 "error": session.error_message
                             })
                             break
                         elif session.status.value == "interrupted":
-                            await notify_project_update(str(project_uuid), {
+                            await notify_project_update(str(project_id), {
                                 "type": "auto_continue_stopped",
                                 "reason": "session_interrupted"
                             })
@@ -1784,47 +1857,40 @@ async def start_session(project_id: str, session_config: SessionStart, backgroun
 
                 else:
                     # Single session mode (original behavior)
-
-                    # Create progress callback for real-time WebSocket updates
-                    async def progress_update(event: Dict[str, Any]):
-                        """Broadcast progress events to connected WebSocket clients."""
-                        await notify_project_update(str(project_uuid), {
-                            "type": "progress",
-                            "event": event
-                        })
-
                     session = await orchestrator.start_session(
-                        project_id=project_uuid,
+                        project_id=project_id,
                         initializer_model=initializer_model,
                         coding_model=coding_model,
                         max_iterations=session_config.max_iterations,
-                        progress_callback=progress_update
+                        progress_callback=progress_callback
                     )
 
                     # Send WebSocket notification
-                    await notify_project_update(str(project_uuid), {
+                    await notify_project_update(str(project_id), {
                         "type": "session_completed",
                         "session": session.to_dict()
                     })
 
             except Exception as e:
                 logger.error(f"Session failed: {e}")
-                await notify_project_update(str(project_uuid), {
+                await notify_project_update(str(project_id), {
                     "type": "session_error",
                     "error": str(e)
                 })
 
-        # Create task for background execution and store it to prevent garbage collection
-        background_tasks.add_task(run_session)
-
-        # Get the actual session info that will be created
+        # Get the actual session info that will be created (before the
+        # background task can create the session row)
         db = await get_db()
-        next_session_num = await db.get_next_session_number(project_uuid)
+        next_session_num = await db.get_next_session_number(project_id)
+
+        # Run in background, tracked like the other session endpoints
+        _spawn_session_task(str(project_id), run_session())
+
         # Return info about the session that will be created
         # WebSocket will provide real-time updates when session actually starts
         return SessionResponse(
             session_id="pending",  # Will be updated via WebSocket
-            project_id=str(project_uuid),
+            project_id=str(project_id),
             session_number=next_session_num,
             session_type="coding" if next_session_num > 0 else "initializer",
             model=initializer_model if next_session_num == 0 else coding_model,
@@ -1839,41 +1905,13 @@ async def start_session(project_id: str, session_config: SessionStart, backgroun
 
 
 @app.get("/api/projects/{project_id}/sessions")
-async def list_sessions(project_id: str):
+async def list_sessions(project_id: UUID):
     """List all sessions for a project."""
     try:
-        project_uuid = UUID(project_id)
-        sessions = await orchestrator.list_sessions(project_uuid)
-
-        # Convert UUIDs and timestamps for response
-        response_sessions = []
-        for session in sessions:
-            session_dict = dict(session)
-            # Map 'id' to 'session_id' for frontend compatibility
-            session_dict['session_id'] = str(session_dict.get('id', ''))
-            session_dict['project_id'] = str(session_dict.get('project_id', ''))
-
-            # Convert timestamps
-            for field in ['created_at', 'started_at', 'ended_at']:
-                if field in session_dict and session_dict[field]:
-                    if hasattr(session_dict[field], 'isoformat'):
-                        session_dict[field] = session_dict[field].isoformat()
-                    else:
-                        session_dict[field] = str(session_dict[field])
-
-            # Parse metrics JSONB field (comes as string from asyncpg)
-            if 'metrics' in session_dict:
-                if isinstance(session_dict['metrics'], str):
-                    try:
-                        session_dict['metrics'] = json.loads(session_dict['metrics'])
-                    except (json.JSONDecodeError, TypeError):
-                        session_dict['metrics'] = {}
-                elif session_dict['metrics'] is None:
-                    session_dict['metrics'] = {}
-
-            response_sessions.append(session_dict)
-
-        return response_sessions
+        db = await get_db()
+        # Rows are shaped and serialized by PostgreSQL; pass the JSON through
+        content = await db.get_session_history_json(project_id, limit=100)
+        return Response(content=content, media_type="application/json")
 
     except Exception as e:
         logger.error(f"Failed to list sessions for project {project_id}: {e}")
@@ -1881,94 +1919,78 @@ async def list_sessions(project_id: str):
 
 
 @app.get("/api/projects/{project_id}/sessions/{session_id}")
-async def get_session(project_id: str, session_id: str):
+async def get_session(project_id: str, session_id: UUID):
     """Get session details."""
     try:
-        session_uuid = UUID(session_id)
-        session_info = await orchestrator.get_session_info(session_uuid)
+        session_info = await orchestrator.get_session_info(session_id)
 
         if not session_info:
             raise HTTPException(status_code=404, detail="Session not found")
 
-        # Convert for response
+        # Convert for response (orjson serializes UUIDs and timestamps natively)
         session_dict = dict(session_info)
         # Map 'id' to 'session_id' for frontend compatibility
-        session_dict['session_id'] = str(session_dict.get('id', ''))
-        session_dict['project_id'] = str(session_dict.get('project_id', ''))
-
-        # Convert timestamps
-        for field in ['created_at', 'started_at', 'ended_at']:
-            if field in session_dict and session_dict[field]:
-                if hasattr(session_dict[field], 'isoformat'):
-                    session_dict[field] = session_dict[field].isoformat()
-                else:
-                    session_dict[field] = str(session_dict[field])
+        session_dict['session_id'] = session_dict.get('id', '')
 
-        return session_dict
+        return ORJSONResponse(session_dict)
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid session ID format")
     except Exception as e:
         logger.error(f"Failed to get session {session_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Fixed bodies for the session control endpoints, serialized once at import
+SESSION_STOPPED_BODY = orjson.dumps({"status": "stopped", "message": "Session stopped successfully"})
+SESSION_NOT_RUNNING_BODY = orjson.dumps({"status": "not_running", "message": "Session was not running"})
+STOP_AFTER_CURRENT_SET_BODY = orjson.dumps({
+    "status": "set",
+    "message": "Will stop after current session completes"
+})
+STOP_AFTER_CURRENT_CLEARED_BODY = orjson.dumps({
+    "status": "cleared",
+    "message": "Auto-continue will resume"
+})
+
+
 @app.post("/api/projects/{project_id}/sessions/{session_id}/stop")
-async def stop_session(project_id: str, session_id: str):
+async def stop_session(project_id: str, session_id: UUID):
     """Stop a running session immediately."""
     try:
-        session_uuid = UUID(session_id)
-        stopped = await orchestrator.stop_session(session_uuid, reason="User requested immediate stop")
+        stopped = await orchestrator.stop_session(session_id, reason="User requested immediate stop")
 
-        if stopped:
-            return {"status": "stopped", "message": "Session stopped successfully"}
-        else:
-            return {"status": "not_running", "message": "Session was not running"}
+        body = SESSION_STOPPED_BODY if stopped else SESSION_NOT_RUNNING_BODY
+        return Response(content=body, media_type="application/json")
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid session ID format")
     except Exception as e:
         logger.error(f"Failed to stop session {session_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/projects/{project_id}/stop-after-current")
-async def stop_after_current_session(project_id: str):
+async def stop_after_current_session(project_id: UUID):
     """
     Stop auto-continue after current session completes.
 
     The current session will finish normally, but no new session will start.
     """
     try:
-        project_uuid = UUID(project_id)
-        orchestrator.set_stop_after_current(project_uuid, stop=True)
+        orchestrator.set_stop_after_current(project_id, stop=True)
 
-        return {
-            "status": "set",
-            "message": "Will stop after current session completes"
-        }
+        return Response(content=STOP_AFTER_CURRENT_SET_BODY, media_type="application/json")
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID format")
     except Exception as e:
         logger.error(f"Failed to set stop-after-current for project {project_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.delete("/api/projects/{project_id}/stop-after-current")
-async def cancel_stop_after_current(project_id: str):
+async def cancel_stop_after_current(project_id: UUID):
     """Cancel the stop-after-current flag, allowing auto-continue to resume."""
     try:
-        project_uuid = UUID(project_id)
-        orchestrator.set_stop_after_current(project_uuid, stop=False)
+        orchestrator.set_stop_after_current(project_id, stop=False)
 
-        return {
-            "status": "cleared",
-            "message": "Auto-continue will resume"
-        }
+        return Response(content=STOP_AFTER_CURRENT_CLEARED_BODY, media_type="application/json")
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID format")
     except Exception as e:
         logger.error(f"Failed to clear stop-after-current for project {project_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1978,176 +2000,352 @@ async def cancel_stop_after_current(project_id: str):
 # WebSocket for Real-time Updates
 # =============================================================================
 
-async def notify_project_update(project_id: str, data: Dict[str, Any]):
-    """Send update to all WebSocket connections for a project."""
-    if project_id in active_connections:
-        disconnected = []
-        for websocket in active_connections[project_id]:
-            try:
-                await websocket.send_json(data)
-            except Exception:
-                disconnected.append(websocket)
+def _serialize_ws_messages(messages: List[Dict[str, Any]]) -> str:
+    """Serialize queued messages into a single frame (array only when batched)."""
+    payload = messages[0] if len(messages) == 1 else messages
+    return orjson.dumps(payload, default=_orjson_default).decode()
 
-        # Remove disconnected websockets
-        for ws in disconnected:
-            active_connections[project_id].remove(ws)
 
-        # Clean up empty lists
-        if not active_connections[project_id]:
+def _remove_connection(project_id: str, websocket: WebSocket):
+    """Forget a WebSocket and drop the project entry once it has none left."""
+    connections = active_connections.get(project_id)
+    if connections is not None:
+        connections.discard(websocket)
+        if not connections:
             del active_connections[project_id]
 
 
+def _enqueue_to_client(websocket: WebSocket, text: str):
+    """
+    Queue a pre-serialized frame for one client.
+
+    The client's writer task is the only sender on its socket, so every
+    outbound frame goes through here.
+    """
+    queue = ws_client_queues.get(websocket)
+    if queue is None:
+        return
+    if queue.full():
+        # Drop the oldest frame rather than block the producer
+        queue.get_nowait()
+    queue.put_nowait(text)
+
+
+def _enqueue_to_project_connections(project_id: str, text: str):
+    """Queue a pre-serialized frame for every WebSocket connected to a project."""
+    for websocket in list(active_connections.get(project_id, ())):
+        _enqueue_to_client(websocket, text)
+
+
+async def _client_ws_writer(project_id: str, websocket: WebSocket, queue: asyncio.Queue):
+    """Send queued frames to one client until its connection fails."""
+    try:
+        while True:
+            await websocket.send_text(await queue.get())
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        # Dead connection; the receive loop finishes the cleanup
+        _remove_connection(project_id, websocket)
+
+
+async def _project_ws_writer(project_id: str, queue: asyncio.Queue):
+    """
+    Drain a project's outbound queue and send messages in batches.
+
+    A lone message is sent immediately unless it is a progress event. When
+    more are already waiting (or a progress event opens the batch), the
+    writer keeps collecting for up to WS_BATCH_MAX_WAIT_SECONDS (or
+    WS_BATCH_MAX_MESSAGES) and ships them as one JSON array frame.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            messages = [await queue.get()]
+
+            if not queue.empty() or messages[0].get("type") in WS_BATCH_WAIT_MESSAGE_TYPES:
+                deadline = loop.time() + WS_BATCH_MAX_WAIT_SECONDS
+                while len(messages) < WS_BATCH_MAX_MESSAGES:
+                    if not queue.empty():
+                        messages.append(queue.get_nowait())
+                        continue
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        messages.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+            try:
+                _enqueue_to_project_connections(project_id, _serialize_ws_messages(messages))
+            except Exception as e:
+                logger.error(f"Failed to send WebSocket batch for project {project_id}: {e}")
+
+            # Exit once nobody is listening and nothing is pending
+            if not active_connections.get(project_id) and queue.empty():
+                break
+    finally:
+        if ws_writer_tasks.get(project_id) is asyncio.current_task():
+            del ws_writer_tasks[project_id]
+            ws_outbound_queues.pop(project_id, None)
+
+
+async def notify_project_update(project_id: str, data: Dict[str, Any]):
+    """Queue an update for all WebSocket connections for a project."""
+    if not active_connections.get(project_id):
+        return
+
+    queue = ws_outbound_queues.get(project_id)
+    if queue is None:
+        queue = asyncio.Queue()
+        ws_outbound_queues[project_id] = queue
+    queue.put_nowait(data)
+
+    writer = ws_writer_tasks.get(project_id)
+    if writer is None or writer.done():
+        ws_writer_tasks[project_id] = asyncio.create_task(_project_ws_writer(project_id, queue))
+
+
+async def _broadcast_progress(project_id: str, event: Dict[str, Any]):
+    """
+    Broadcast an agent progress event to a project's WebSocket clients.
+
+    Passed to the orchestrator as partial(_broadcast_progress, project_id).
+    """
+    await notify_project_update(project_id, {
+        "type": "progress",
+        "event": event
+    })
+
+
+@lru_cache(maxsize=4096)
+def _project_uuid(project_id: str) -> UUID:
+    """
+    Parse a WebSocket project id, reusing earlier parses.
+
+    Dashboards reconnect with the same few ids; invalid ids still raise
+    ValueError (failures are not cached).
+    """
+    return UUID(project_id)
+
+
+@lru_cache(maxsize=4096)
+def _connected_frame_prefix(project_id: str) -> str:
+    """Serialized start of a project's "connected" frame, up to the timestamp."""
+    return '{"type":"connected","project_id":' + orjson.dumps(project_id).decode() + ',"timestamp":"'
+
+
+def _connected_frame(project_id: str) -> str:
+    """Handshake frame for a new connection; only the timestamp is spliced in."""
+    return _connected_frame_prefix(project_id) + datetime.now().isoformat() + '"}'
+
+
+async def _queue_initial_state(websocket: WebSocket, project_id: str):
+    """Queue a project's current progress for one WebSocket client."""
+    try:
+        project_uuid = _project_uuid(project_id)
+        db = await get_db()
+        project = await db.get_project(project_uuid)
+        if not project:
+            return
+
+        # UUIDs and Decimals are handled by the orjson serializer
+        progress = await db.get_progress(project_uuid)
+
+        # JSONB is decoded by the pool's codec
+        metadata = project.get('metadata') or {}
+        is_initialized = metadata.get('is_initialized', False)
+
+        _enqueue_to_client(websocket, orjson.dumps({
+            "type": "initial_state",
+            "progress": progress,
+            "is_initialized": is_initialized
+        }, default=_orjson_default).decode())
+        logger.debug(f"Queued initial state to WebSocket client for project {project_id}")
+    except Exception as e:
+        logger.error(f"Failed to load initial state: {e}", exc_info=True)
+        # Don't fail the whole connection, just log the error
+
+
 @app.websocket("/api/ws/{project_id}")
 async def websocket_endpoint(websocket: WebSocket, project_id: str):
     """WebSocket endpoint for real-time project updates."""
     await websocket.accept()
 
-    # Add to active connections
-    if project_id not in active_connections:
-        active_connections[project_id] = []
-    active_connections[project_id].append(websocket)
+    # The writer task is the only sender on this socket; the connection
+    # message is queued before the socket can receive any broadcast
+    client_queue: asyncio.Queue = asyncio.Queue(maxsize=WS_CLIENT_QUEUE_SIZE)
+    client_queue.put_nowait(_connected_frame(project_id))
+    ws_client_queues[websocket] = client_queue
+    active_connections.setdefault(project_id, weakref.WeakSet()).add(websocket)
+    client_writer = asyncio.create_task(_client_ws_writer(project_id, websocket, client_queue))
 
     try:
-        # Send initial connection message
-        try:
-            await websocket.send_json({
-                "type": "connected",
-                "project_id": project_id,
-                "timestamp": datetime.now().isoformat()
-            })
-        except (WebSocketDisconnect, RuntimeError) as e:
-            # Client disconnected before we could send initial message
-            logger.debug(f"WebSocket disconnected during initial message: {e}")
-            # Clean up connection
-            if project_id in active_connections and websocket in active_connections[project_id]:
-                active_connections[project_id].remove(websocket)
-                if not active_connections[project_id]:
-                    del active_connections[project_id]
-            return
-
-        # Send initial state with progress
-        try:
-            project_uuid = UUID(project_id)
-            async with DatabaseManager() as db:
-                project = await db.get_project(project_uuid)
-                if project:
-                    progress = await db.get_progress(project_uuid)
-
-                    # Convert UUIDs and Decimals to JSON-serializable types
-                    if progress:
-                        if 'project_id' in progress:
-                            progress['project_id'] = str(progress['project_id'])
-                        # Convert Decimal to float
-                        for key in ['task_completion_pct', 'test_pass_pct']:
-                            if key in progress and progress[key] is not None:
-                                progress[key] = float(progress[key])
-
-                    # Parse metadata - asyncpg may return JSONB as string or dict
-                    metadata = project.get('metadata', {})
-                    if isinstance(metadata, str):
-                        try:
-                            import json
-                            metadata = json.loads(metadata)
-                        except json.JSONDecodeError:
-                            logger.warning(f"Failed to parse metadata as JSON: {metadata}")
-                            metadata = {}
-                    elif metadata is None:
-                        metadata = {}
-
-                    # Ensure metadata is a dict
-                    if not isinstance(metadata, dict):
-                        logger.warning(f"Metadata is not a dict after parsing: {type(metadata)}")
-                        metadata = {}
-
-                    is_initialized = metadata.get('is_initialized', False)
-
-                    await websocket.send_json({
-                        "type": "initial_state",
-                        "progress": progress,
-                        "is_initialized": is_initialized
-                    })
-                    logger.debug(f"Sent initial state to WebSocket client for project {project_id}")
-        except (WebSocketDisconnect, RuntimeError) as e:
-            # Client disconnected before we could send initial state
-            logger.debug(f"WebSocket disconnected during initial state: {e}")
-            # Clean up connection
-            if project_id in active_connections and websocket in active_connections[project_id]:
-                active_connections[project_id].remove(websocket)
-                if not active_connections[project_id]:
-                    del active_connections[project_id]
-            return
-        except Exception as e:
-            logger.error(f"Failed to send initial state: {e}", exc_info=True)
-            # Don't fail the whole connection, just log the error
-
         # Keep connection alive and handle messages
         while True:
             try:
-                # Wait for messages (ping/pong or commands)
+                # Wait for client commands; keepalive is handled by the
+                # server with protocol-level ping frames
                 data = await websocket.receive_text()
 
-                # Echo back or handle commands
-                if data == "ping":
-                    await websocket.send_text("pong")
+                if data == "get_initial_state":
+                    # Requested by the client once it is ready, so connections
+                    # dropped straight away (reload storms) never hit the DB
+                    await _queue_initial_state(websocket, project_id)
             except (WebSocketDisconnect, RuntimeError):
                 # Connection closed normally
                 break
 
     except WebSocketDisconnect:
-        # Remove from active connections
-        if project_id in active_connections:
-            active_connections[project_id].remove(websocket)
-            if not active_connections[project_id]:
-                del active_connections[project_id]
+        pass
+    finally:
+        # Remove from active connections however the connection ended
+        client_writer.cancel()
+        ws_client_queues.pop(websocket, None)
+        _remove_connection(project_id, websocket)
 
 
 # =============================================================================
 # Log Endpoints (Compatibility - logs are file-based)
 # =============================================================================
 
+# The UI polls the log list while a session runs; serve repeats briefly from
+# memory (sizes/mtimes can lag by at most this long)
+LOG_LIST_CACHE_SECONDS = 2.0
+_log_list_cache: Dict[UUID, Tuple[float, List[Dict[str, Any]]]] = {}
+
+
+def _prune_log_list_cache(now: float):
+    """Drop expired log list entries so projects listed once don't linger."""
+    for project_id in [pid for pid, (expires, _) in _log_list_cache.items() if expires <= now]:
+        del _log_list_cache[project_id]
+
+
+async def _get_project_path(project_id: UUID) -> Path:
+    """
+    Resolve a project's directory with a single primary-key lookup.
+
+    Same derivation as orchestrator.get_project_info() (generations dir +
+    project name) without its progress/next-task/session queries.
+    """
+    db = await get_db()
+    project = await db.get_project(project_id)
+    if not project:
+        raise ValueError(f"Project not found: {project_id}")
+    return Path(config.project.default_generations_dir) / project['name']
+
+
+LOG_FILE_TYPES = {"txt": "human", "jsonl": "events"}
+LOG_TYPE_EXTENSIONS = {"human": "txt", "events": "jsonl"}
+
+# session_NNN_<timestamp>.txt|jsonl - shared by the listing and prefix lookups
+SESSION_LOG_RE = re.compile(r"^session_(\d+)_.*\.(txt|jsonl)$")
+
+
+def _find_session_log(logs_dir: Path, prefix: str, log_type: str) -> Optional[Path]:
+    """Return the first log matching ``<prefix>_*.<ext>`` for the given type."""
+    ext = LOG_TYPE_EXTENSIONS[log_type]
+    head = prefix + "_"
+    with os.scandir(logs_dir) as entries:
+        for entry in entries:
+            match = SESSION_LOG_RE.match(entry.name)
+            if match and match.group(2) == ext and entry.name.startswith(head):
+                return Path(entry.path)
+    return None
+
+
+# logs dir -> (dir mtime_ns, {session digits: {log_type: path}}); adding or
+# removing a log bumps the directory mtime, which invalidates the entry.
+# Two files created within one timestamp tick can leave the index stale, so
+# lookups that miss fall back to a directory scan.
+SESSION_PREFIX_RE = re.compile(r"^session_(\d+)$")
+_session_log_index: Dict[Path, Tuple[int, Dict[str, Dict[str, Path]]]] = {}
+
+
+def _get_session_log_index(logs_dir: Path) -> Dict[str, Dict[str, Path]]:
+    """
+    Return the session digits -> log path index, rebuilding it on change.
+
+    Keyed on the digits exactly as written, so "session_7" only matches
+    session_7_* files (not session_007_*), as the prefix glob did.
+    """
+    mtime = logs_dir.stat().st_mtime_ns
+    cached = _session_log_index.get(logs_dir)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    index: Dict[str, Dict[str, Path]] = {}
+    with os.scandir(logs_dir) as entries:
+        for entry in entries:
+            match = SESSION_LOG_RE.match(entry.name)
+            if match:
+                # Keep the first file seen per session/type, as glob did
+                index.setdefault(match.group(1), {}).setdefault(
+                    LOG_FILE_TYPES[match.group(2)], Path(entry.path)
+                )
+    _session_log_index[logs_dir] = (mtime, index)
+    return index
+
+
+def _resolve_session_log(logs_dir: Path, prefix: str, log_type: str) -> Optional[Path]:
+    """Resolve a ``session_NNN`` prefix via the index, else scan the directory."""
+    match = SESSION_PREFIX_RE.match(prefix)
+    if match is None:
+        return _find_session_log(logs_dir, prefix, log_type)
+    index = _get_session_log_index(logs_dir)
+    path = index.get(match.group(1), {}).get(log_type)
+    if path is None:
+        path = _find_session_log(logs_dir, prefix, log_type)
+        if path is not None:
+            # Only record hits, so unknown sessions never grow the index
+            index.setdefault(match.group(1), {})[log_type] = path
+    return path
+
+
+def _scan_log_files(logs_path: Path) -> List[Dict[str, Any]]:
+    """
+    List session_NNN_*.txt / .jsonl logs in one directory pass.
+
+    Uses os.scandir so each entry costs a single stat; ordered newest
+    session first, with a session's human log ahead of its event log.
+    """
+    log_files = []
+    with os.scandir(logs_path) as entries:
+        for entry in entries:
+            match = SESSION_LOG_RE.match(entry.name)
+            if not match:
+                continue
+            st = entry.stat()
+            log_files.append({
+                "filename": entry.name,
+                "session_number": int(match.group(1)),
+                "type": LOG_FILE_TYPES[match.group(2)],
+                "size": st.st_size,
+                "modified": datetime.fromtimestamp(st.st_mtime)
+            })
+
+    log_files.sort(key=itemgetter("session_number", "type", "filename"), reverse=True)
+    return log_files
+
+
 @app.get("/api/projects/{project_id}/logs")
-async def list_logs(project_id: str):
+async def list_logs(project_id: UUID):
     """List available log files for a project."""
     try:
-        project_uuid = UUID(project_id)
-        project_info = await orchestrator.get_project_info(project_uuid)
-
-        project_path = Path(project_info.get('local_path', ''))
-        if not project_path or not project_path.exists():
-            return []
+        now = time.monotonic()
+        cached = _log_list_cache.get(project_id)
+        if cached and cached[0] > now:
+            return cached[1]
+        _prune_log_list_cache(now)
 
-        logs_path = project_path / "logs"
+        logs_path = (await _get_project_path(project_id)) / "logs"
         if not logs_path.exists():
             return []
 
-        # Find all session log files
-        log_files = []
-        for log_file in sorted(logs_path.glob("session_*.txt")):
-            # Parse session number from filename
-            parts = log_file.stem.split('_')
-            if len(parts) >= 2 and parts[1].isdigit():
-                session_num = int(parts[1])
-                log_files.append({
-                    "filename": log_file.name,
-                    "session_number": session_num,
-                    "type": "human",
-                    "size": log_file.stat().st_size,
-                    "modified": datetime.fromtimestamp(log_file.stat().st_mtime).isoformat()
-                })
-
-        # Also find JSONL logs
-        for log_file in sorted(logs_path.glob("session_*.jsonl")):
-            parts = log_file.stem.split('_')
-            if len(parts) >= 2 and parts[1].isdigit():
-                session_num = int(parts[1])
-                log_files.append({
-                    "filename": log_file.name,
-                    "session_number": session_num,
-                    "type": "events",
-                    "size": log_file.stat().st_size,
-                    "modified": datetime.fromtimestamp(log_file.stat().st_mtime).isoformat()
-                })
+        log_files = await asyncio.to_thread(_scan_log_files, logs_path)
 
+        _log_list_cache[project_id] = (time.monotonic() + LOG_LIST_CACHE_SECONDS, log_files)
         return log_files
 
     except Exception as e:
@@ -2156,7 +2354,7 @@ async def list_logs(project_id: str):
 
 
 @app.get("/api/projects/{project_id}/logs/human/{filename}")
-async def get_human_log(project_id: str, filename: str):
+async def get_human_log(project_id: UUID, filename: str, stream: bool = Query(False)):
     """
     Get human-readable log file content.
 
@@ -2165,14 +2363,12 @@ async def get_human_log(project_id: str, filename: str):
     - Session number prefix: session_027
 
     If prefix is provided, finds the matching log file.
+
+    With ?stream=true the file is streamed as text/plain instead of being
+    wrapped in a JSON {"content", "filename"} body.
     """
     try:
-        project_uuid = UUID(project_id)
-        project_info = await orchestrator.get_project_info(project_uuid)
-
-        project_path = Path(project_info.get('local_path', ''))
-        if not project_path:
-            raise HTTPException(status_code=404, detail="Project path not found")
+        project_path = await _get_project_path(project_id)
 
         # Security check
         if ".." in filename or "/" in filename:
@@ -2186,13 +2382,11 @@ async def get_human_log(project_id: str, filename: str):
         # If not found and filename looks like a session prefix (e.g., "session_027")
         # find the matching log file
         if not log_path.exists() and filename.startswith("session_"):
-            # Look for files matching the pattern: session_NNN_*.txt
-            pattern = f"{filename}_*.txt"
-            matching_files = list(logs_dir.glob(pattern))
+            # Look for a file matching the pattern: session_NNN_*.txt
+            match_path = await asyncio.to_thread(_resolve_session_log, logs_dir, filename, "human")
 
-            if matching_files:
-                # Use the first match (should only be one)
-                log_path = matching_files[0]
+            if match_path:
+                log_path = match_path
                 filename = log_path.name  # Update filename to actual file
             else:
                 raise HTTPException(status_code=404, detail=f"Log file not found for {filename}")
@@ -2200,7 +2394,10 @@ async def get_human_log(project_id: str, filename: str):
         if not log_path.exists():
             raise HTTPException(status_code=404, detail="Log file not found")
 
-        content = log_path.read_text()
+        if stream:
+            return FileResponse(log_path, media_type="text/plain; charset=utf-8")
+
+        content = await asyncio.to_thread(log_path.read_text)
         return {"content": content, "filename": filename}
 
     except Exception as e:
@@ -2209,7 +2406,7 @@ async def get_human_log(project_id: str, filename: str):
 
 
 @app.get("/api/projects/{project_id}/logs/events/{filename}")
-async def get_events_log(project_id: str, filename: str):
+async def get_events_log(project_id: UUID, filename: str, stream: bool = Query(False)):
     """
     Get JSONL events log file content.
 
@@ -2218,16 +2415,12 @@ async def get_events_log(project_id: str, filename: str):
     - Session number prefix: session_027
 
     If prefix is provided, finds the matching log file.
-    """
-    import json
 
+    With ?stream=true the file is streamed as application/x-ndjson instead
+    of being wrapped in a JSON {"content", "filename"} body.
+    """
     try:
-        project_uuid = UUID(project_id)
-        project_info = await orchestrator.get_project_info(project_uuid)
-
-        project_path = Path(project_info.get('local_path', ''))
-        if not project_path:
-            raise HTTPException(status_code=404, detail="Project path not found")
+        project_path = await _get_project_path(project_id)
 
         # Security check
         if ".." in filename or "/" in filename:
@@ -2241,13 +2434,11 @@ async def get_events_log(project_id: str, filename: str):
         # If not found and filename looks like a session prefix (e.g., "session_027")
         # find the matching log file
         if not log_path.exists() and filename.startswith("session_"):
-            # Look for files matching the pattern: session_NNN_*.jsonl
-            pattern = f"{filename}_*.jsonl"
-            matching_files = list(logs_dir.glob(pattern))
+            # Look for a file matching the pattern: session_NNN_*.jsonl
+            match_path = await asyncio.to_thread(_resolve_session_log, logs_dir, filename, "events")
 
-            if matching_files:
-                # Use the first match (should only be one)
-                log_path = matching_files[0]
+            if match_path:
+                log_path = match_path
                 filename = log_path.name  # Update filename to actual file
             else:
                 raise HTTPException(status_code=404, detail=f"Log file not found for {filename}")
@@ -2255,10 +2446,11 @@ async def get_events_log(project_id: str, filename: str):
         if not log_path.exists():
             raise HTTPException(status_code=404, detail="Log file not found")
 
-        # Return raw JSONL content as text (don't parse)
-        with open(log_path, 'r') as f:
-            content = f.read()
+        if stream:
+            return FileResponse(log_path, media_type="application/x-ndjson")
 
+        # Return raw JSONL content as text (don't parse)
+        content = await asyncio.to_thread(log_path.read_text)
         return {"content": content, "filename": filename}
 
     except Exception as e:
@@ -2271,7 +2463,7 @@ async def get_events_log(project_id: str, filename: str):
 # =============================================================================
 
 @app.get("/api/projects/{project_id}/screenshots")
-async def list_screenshots(project_id: str):
+async def list_screenshots(project_id: UUID):
     """
     List all screenshots for a project from the .playwright-mcp directory.
 
@@ -2279,92 +2471,83 @@ async def list_screenshots(project_id: str):
         List of screenshots with metadata (filename, size, modified time, task_id if parseable)
     """
     try:
-        project_uuid = UUID(project_id)
-        async with DatabaseManager() as db:
-            project = await db.get_project(project_uuid)
-            if not project:
-                raise HTTPException(status_code=404, detail="Project not found")
+        db = await get_db()
+        project = await db.get_project(project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
 
-            # Construct project path from generations directory + project name
-            config = Config.load_default()
-            generations_dir = Path(config.project.default_generations_dir)
-            project_path = generations_dir / project["name"]
-            screenshots_dir = project_path / ".playwright-mcp"
+        # Construct project path from generations directory + project name
+        screenshots_dir = Path(config.project.default_generations_dir) / project["name"] / ".playwright-mcp"
 
-            if not screenshots_dir.exists():
-                return []
+        if not screenshots_dir.exists():
+            return []
 
-            screenshots = []
-            for filepath in screenshots_dir.glob("*.png"):
-                stat = filepath.stat()
+        screenshots = []
+        for filepath in screenshots_dir.glob("*.png"):
+            stat = filepath.stat()
 
-                # Try to extract task ID from filename (format: task_NNN_*.png)
-                task_id = None
-                if filepath.name.startswith("task_"):
-                    try:
-                        parts = filepath.name.split("_")
-                        if len(parts) >= 2:
-                            task_id = int(parts[1])
-                    except (ValueError, IndexError):
-                        pass
-
-                screenshots.append({
-                    "filename": filepath.name,
-                    "size": stat.st_size,
-                    "modified_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "task_id": task_id,
-                    "url": f"/api/projects/{project_id}/screenshots/{filepath.name}"
-                })
+            # Try to extract task ID from filename (format: task_NNN_*.png)
+            task_id = None
+            if filepath.name.startswith("task_"):
+                try:
+                    parts = filepath.name.split("_")
+                    if len(parts) >= 2:
+                        task_id = int(parts[1])
+                except (ValueError, IndexError):
+                    pass
+
+            screenshots.append({
+                "filename": filepath.name,
+                "size": stat.st_size,
+                "modified_at": datetime.fromtimestamp(stat.st_mtime),
+                "task_id": task_id,
+                "url": f"/api/projects/{project_id}/screenshots/{filepath.name}"
+            })
 
-            # Sort by modified time (newest first)
-            screenshots.sort(key=lambda x: x["modified_at"], reverse=True)
+        # Sort by modified time (newest first)
+        screenshots.sort(key=lambda x: x["modified_at"], reverse=True)
 
-            return screenshots
+        return screenshots
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID format")
     except Exception as e:
         logger.error(f"Failed to list screenshots for project {project_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/projects/{project_id}/screenshots/{filename}")
-async def get_screenshot(project_id: str, filename: str):
+async def get_screenshot(project_id: UUID, filename: str):
     """
     Get a specific screenshot file.
 
     Returns the PNG file as a binary response.
     """
     try:
-        project_uuid = UUID(project_id)
-        async with DatabaseManager() as db:
-            project = await db.get_project(project_uuid)
-            if not project:
-                raise HTTPException(status_code=404, detail="Project not found")
-
-            # Construct project path from generations directory + project name
-            config = Config.load_default()
-            generations_dir = Path(config.project.default_generations_dir)
-            project_path = generations_dir / project["name"]
-            screenshot_path = project_path / ".playwright-mcp" / filename
-
-            # Security: Ensure the file is within the playwright directory
-            if not screenshot_path.resolve().is_relative_to((project_path / ".playwright-mcp").resolve()):
-                raise HTTPException(status_code=403, detail="Access denied")
-
-            if not screenshot_path.exists() or not screenshot_path.is_file():
-                raise HTTPException(status_code=404, detail="Screenshot not found")
-
-            # Import Response for returning binary data
-            from fastapi.responses import FileResponse
-            return FileResponse(
-                path=screenshot_path,
-                media_type="image/png",
-                filename=filename
-            )
+        db = await get_db()
+        project = await db.get_project(project_id)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+
+        # Construct project path from generations directory + project name
+        screenshots_dir = (
+            Path(config.project.default_generations_dir) / project["name"] / ".playwright-mcp"
+        ).resolve()
+        screenshot_path = (screenshots_dir / filename).resolve()
+
+        # Security: Ensure the file is within the playwright directory
+        if not screenshot_path.is_relative_to(screenshots_dir):
+            raise HTTPException(status_code=403, detail="Access denied")
+
+        if not screenshot_path.is_file():
+            raise HTTPException(status_code=404, detail="Screenshot not found")
+
+        # Import Response for returning binary data
+        from fastapi.responses import FileResponse
+        return FileResponse(
+            path=screenshot_path,
+            media_type="image/png",
+            filename=filename
+        )
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID format")
     except HTTPException:
         raise
     except Exception as e:
@@ -2377,36 +2560,32 @@ async def get_screenshot(project_id: str, filename: str):
 # =============================================================================
 
 @app.get("/api/projects/{project_id}/quality")
-async def get_project_quality(project_id: str):
+async def get_project_quality(project_id: UUID):
     """
     Get overall quality summary for a project.
 
     Returns aggregate quality metrics across all sessions.
     """
     try:
-        project_uuid = UUID(project_id)
         db = await get_db()
-        summary = await db.get_project_quality_summary(project_uuid)
+        summary = await db.get_project_quality_summary(project_id)
         return summary
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID format")
     except Exception as e:
         logger.error(f"Failed to get quality summary for project {project_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/projects/{project_id}/sessions/{session_id}/quality")
-async def get_session_quality(project_id: str, session_id: str):
+async def get_session_quality(project_id: str, session_id: UUID):
     """
     Get quality check results for a specific session.
 
     Returns quick quality check metrics and any deep review results.
     """
     try:
-        session_uuid = UUID(session_id)
         db = await get_db()
-        quality = await db.get_session_quality(session_uuid)
+        quality = await db.get_session_quality(session_id)
 
         if not quality:
             raise HTTPException(status_code=404, detail="Quality check not found for this session")
@@ -2416,15 +2595,13 @@ async def get_session_quality(project_id: str, session_id: str):
     except HTTPException:
         # Re-raise HTTP exceptions (like 404) without wrapping
         raise
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid session ID format")
     except Exception as e:
         logger.error(f"Failed to get quality for session {session_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/projects/{project_id}/quality/issues")
-async def get_quality_issues(project_id: str, limit: int = 10):
+async def get_quality_issues(project_id: UUID, limit: int = 10):
     """
     Get recent sessions with quality issues for a project.
 
@@ -2432,20 +2609,17 @@ async def get_quality_issues(project_id: str, limit: int = 10):
         limit: Maximum number of sessions to return (default: 10)
     """
     try:
-        project_uuid = UUID(project_id)
         db = await get_db()
-        issues = await db.get_sessions_with_quality_issues(project_uuid, limit)
+        issues = await db.get_sessions_with_quality_issues(project_id, limit)
         return {"issues": issues, "count": len(issues)}
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID format")
     except Exception as e:
         logger.error(f"Failed to get quality issues for project {project_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/projects/{project_id}/quality/browser-verification")
-async def get_browser_verification_compliance(project_id: str):
+async def get_browser_verification_compliance(project_id: UUID):
     """
     Get browser verification compliance statistics for a project.
 
@@ -2453,53 +2627,44 @@ async def get_browser_verification_compliance(project_id: str):
     Critical quality metric (r=0.98 correlation with session quality).
     """
     try:
-        project_uuid = UUID(project_id)
         db = await get_db()
-        compliance = await db.get_browser_verification_compliance(project_uuid)
+        compliance = await db.get_browser_verification_compliance(project_id)
         return compliance
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID format")
     except Exception as e:
         logger.error(f"Failed to get browser verification compliance for project {project_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/projects/{project_id}/deep-reviews")
-async def list_deep_reviews(project_id: str):
+async def list_deep_reviews(project_id: UUID):
     """
     Get all deep reviews for a project.
 
     Returns list of deep review results with session info and review_text.
     """
     try:
-        project_uuid = UUID(project_id)
         db = await get_db()
-        reviews = await db.list_deep_reviews(project_uuid)
+        reviews = await db.list_deep_reviews(project_id)
         return {"reviews": reviews, "count": len(reviews)}
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID format")
     except Exception as e:
         logger.error(f"Failed to get deep reviews for project {project_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/projects/{project_id}/review-stats")
-async def get_project_review_stats(project_id: str):
+async def get_project_review_stats(project_id: UUID):
     """
     Get project review statistics including coverage.
 
     Returns total sessions, sessions with reviews, and coverage percentage.
     """
     try:
-        project_uuid = UUID(project_id)
         db = await get_db()
-        stats = await db.get_project_review_stats(project_uuid)
+        stats = await db.get_project_review_stats(project_id)
         return stats
 
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid project ID format")
     except Exception as e:
         logger.error(f"Failed to get review stats for project {project_id}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -2507,8 +2672,8 @@ async def get_project_review_stats(project_id: str):
 
 @app.post("/api/projects/{project_id}/sessions/{session_id}/review")
 async def trigger_deep_review(
-    project_id: str,
-    session_id: str,
+    project_id: UUID,
+    session_id: UUID,
     background_tasks: BackgroundTasks,
     model: Optional[str] = None
 ):
@@ -2529,9 +2694,6 @@ async def trigger_deep_review(
     try:
         from review.review_client import run_deep_review
 
-        project_uuid = UUID(project_id)
-        session_uuid = UUID(session_id)
-
         # Get project and session info
         db = await get_db()
         # Verify session exists
@@ -2543,8 +2705,8 @@ async def trigger_deep_review(
                 JOIN projects p ON s.project_id = p.id
                 WHERE s.id = $1 AND s.project_id = $2
                 """,
-                session_uuid,
-                project_uuid
+                session_id,
+                project_id
             )
 
             if not session:
@@ -2563,12 +2725,11 @@ async def trigger_deep_review(
             # Check if session already has a review
             existing_review = await conn.fetchrow(
                 "SELECT id, created_at, overall_rating FROM session_deep_reviews WHERE session_id = $1",
-                session_uuid
+                session_id
             )
             is_rereview = existing_review is not None
 
         # Get project path
-        config = Config.load_default()
         project_path = Path(config.project.default_generations_dir) / project_name
 
         if not project_path.exists():
@@ -2581,15 +2742,15 @@ async def trigger_deep_review(
         # Run review in background
         async def _run_review_task():
             try:
-                logger.info(f"Starting manual deep review for session {session_uuid} (project: {project_name}, session {session_number})")
+                logger.info(f"Starting manual deep review for session {session_id} (project: {project_name}, session {session_number})")
                 result = await run_deep_review(
-                    session_id=session_uuid,
+                    session_id=session_id,
                     project_path=project_path,
                     model=model
                 )
                 logger.info(f"Deep review completed: {result['check_id']} (rating: {result['overall_rating']}/10)")
             except Exception as e:
-                logger.error(f"Deep review failed for session {session_uuid}: {e}", exc_info=True)
+                logger.error(f"Deep review failed for session {session_id}: {e}", exc_info=True)
 
         # Add to background tasks
         background_tasks.add_task(_run_review_task)
@@ -2610,8 +2771,6 @@ async def trigger_deep_review(
 
     except HTTPException:
         raise
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid UUID format")
     except Exception as e:
         logger.error(f"Failed to trigger deep review: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -2619,7 +2778,7 @@ async def trigger_deep_review(
 
 @app.post("/api/projects/{project_id}/trigger-reviews")
 async def trigger_bulk_reviews(
-    project_id: str,
+    project_id: UUID,
     background_tasks: BackgroundTasks,
     request: dict
 ):
@@ -2636,7 +2795,6 @@ async def trigger_bulk_reviews(
     try:
         from review.review_client import run_deep_review
 
-        project_uuid = UUID(project_id)
         mode = request.get('mode', 'unreviewed')
 
         db = await get_db()
@@ -2644,7 +2802,7 @@ async def trigger_bulk_reviews(
         async with db.acquire() as conn:
             project = await conn.fetchrow(
                 "SELECT * FROM projects WHERE id = $1",
-                project_uuid
+                project_id
             )
             if not project:
                 raise HTTPException(status_code=404, detail="Project not found")
@@ -2659,7 +2817,7 @@ async def trigger_bulk_reviews(
                     WHERE s.project_id = $1 AND s.status = 'completed' AND s.type = 'coding'
                     ORDER BY s.session_number
                 """
-                params = [project_uuid]
+                params = [project_id]
             elif mode == 'unreviewed':
                 query = """
                     SELECT s.id, s.session_number
@@ -2668,7 +2826,7 @@ async def trigger_bulk_reviews(
                     WHERE s.project_id = $1 AND s.status = 'completed' AND s.type = 'coding' AND dr.id IS NULL
                     ORDER BY s.session_number
                 """
-                params = [project_uuid]
+                params = [project_id]
             elif mode == 'last_n':
                 last_n = request.get('last_n', 5)
                 query = """
@@ -2679,7 +2837,7 @@ async def trigger_bulk_reviews(
                     ORDER BY s.session_number DESC
                     LIMIT $2
                 """
-                params = [project_uuid, last_n]
+                params = [project_id, last_n]
             elif mode == 'single':
                 session_number = request.get('session_number')
                 if session_number is None:
@@ -2689,7 +2847,7 @@ async def trigger_bulk_reviews(
                     FROM sessions s
                     WHERE s.project_id = $1 AND s.session_number = $2 AND s.status = 'completed' AND s.type = 'coding'
                 """
-                params = [project_uuid, session_number]
+                params = [project_id, session_number]
             elif mode == 'range':
                 session_ids = request.get('session_ids', [])
                 if not session_ids:
@@ -2701,7 +2859,7 @@ async def trigger_bulk_reviews(
                     WHERE s.project_id = $1 AND s.id = ANY($2::uuid[]) AND s.status = 'completed' AND s.type = 'coding'
                     ORDER BY s.session_number
                 """
-                params = [project_uuid, session_uuids]
+                params = [project_id, session_uuids]
             else:
                 raise HTTPException(status_code=400, detail=f"Invalid mode: {mode}")
 
@@ -2715,7 +2873,6 @@ async def trigger_bulk_reviews(
                 }
 
         # Get project path
-        config = Config.load_default()
         project_path = Path(config.project.default_generations_dir) / project_name
 
         # Trigger reviews for each session
@@ -2761,15 +2918,15 @@ async def trigger_bulk_reviews(
 
 class InterventionResponse(BaseModel):
     """Response model for intervention information."""
-    id: str  # UUID as string
-    session_id: str
-    project_id: str
+    id: UUID
+    session_id: UUID
+    project_id: UUID
     project_name: str
     pause_reason: str
     pause_type: str
-    paused_at: str
+    paused_at: datetime
     resolved: bool
-    resolved_at: Optional[str] = None
+    resolved_at: Optional[datetime] = None
     resolved_by: Optional[str] = None
     resolution_notes: Optional[str] = None
     blocker_info: Dict = {}
@@ -2799,15 +2956,15 @@ async def get_active_interventions(
 
         return [
             InterventionResponse(
-                id=str(i["id"]),
-                session_id=str(i["session_id"]),
-                project_id=str(i["project_id"]),
+                id=i["id"],
+                session_id=i["session_id"],
+                project_id=i["project_id"],
                 project_name=i["project_name"],
                 pause_reason=i["pause_reason"],
                 pause_type=i["pause_type"],
-                paused_at=i["paused_at"].isoformat() if hasattr(i["paused_at"], "isoformat") else str(i["paused_at"]),
+                paused_at=i["paused_at"],
                 resolved=i["resolved"],
-                resolved_at=i["resolved_at"].isoformat() if i.get("resolved_at") and hasattr(i["resolved_at"], "isoformat") else None,
+                resolved_at=i.get("resolved_at"),
                 resolved_by=i.get("resolved_by"),
                 resolution_notes=i.get("resolution_notes"),
                 blocker_info=i.get("blocker_info", {}),
@@ -2844,7 +3001,6 @@ async def resume_paused_session(
         # Schedule the session to be resumed in the background
         async def resume_in_background():
             try:
-                orchestrator = AgentOrchestrator()
                 # Start a new coding session with the resume context
                 session_info = await orchestrator.start_session(
                     project_id=resume_context["project_id"],
@@ -2886,15 +3042,15 @@ async def get_intervention_history(
 
         return [
             InterventionResponse(
-                id=str(i["id"]),
-                session_id=str(i["session_id"]),
-                project_id=str(i["project_id"]),
+                id=i["id"],
+                session_id=i["session_id"],
+                project_id=i["project_id"],
                 project_name=i["project_name"],
                 pause_reason=i["pause_reason"],
                 pause_type=i["pause_type"],
-                paused_at=i["paused_at"].isoformat() if hasattr(i["paused_at"], "isoformat") else str(i["paused_at"]),
+                paused_at=i["paused_at"],
                 resolved=i["resolved"],
-                resolved_at=i["resolved_at"].isoformat() if i.get("resolved_at") and hasattr(i["resolved_at"], "isoformat") else None,
+                resolved_at=i.get("resolved_at"),
                 resolved_by=i.get("resolved_by"),
                 resolution_notes=i.get("resolution_notes"),
                 blocker_info=i.get("blocker_info", {}),
@@ -2912,15 +3068,14 @@ async def get_intervention_history(
 
 @app.get("/api/projects/{project_id}/notifications/preferences")
 async def get_notification_preferences(
-    project_id: str,
+    project_id: UUID,
     db=Depends(get_db)
 ) -> Dict:
     """Get notification preferences for a project."""
     try:
         from core.notifications import NotificationPreferencesManager
 
-        project_uuid = UUID(project_id)
-        prefs = await NotificationPreferencesManager.get_preferences(project_id)
+        prefs = await NotificationPreferencesManager.get_preferences(str(project_id))
         return prefs
     except Exception as e:
         logger.error(f"Error getting notification preferences: {e}")
@@ -2929,7 +3084,7 @@ async def get_notification_preferences(
 
 @app.post("/api/projects/{project_id}/notifications/preferences")
 async def update_notification_preferences(
-    project_id: str,
+    project_id: UUID,
     preferences: Dict = Body(...),
     db=Depends(get_db)
 ) -> Dict:
@@ -2937,8 +3092,7 @@ async def update_notification_preferences(
     try:
         from core.notifications import NotificationPreferencesManager
 
-        project_uuid = UUID(project_id)
-        success = await NotificationPreferencesManager.update_preferences(project_id, preferences)
+        success = await NotificationPreferencesManager.update_preferences(str(project_id), preferences)
 
         if success:
             return {"status": "success", "message": "Preferences updated"}
@@ -8,11 +8,15 @@ Handles cross-project analysis and prompt proposal management.
 Created: December 21, 2025
 """
 
+import hashlib
 import logging
-from typing import List, Optional
+import time
+from datetime import datetime
+from functools import wraps
+from typing import List, Optional, Tuple
 from uuid import UUID
-from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Query, BackgroundTasks, Request, Response
+from pydantic import BaseModel, Field, TypeAdapter
 
 from core.database_connection import get_db
 from review.prompt_improvement_analyzer import PromptImprovementAnalyzer
@@ -47,9 +51,9 @@ class TriggerAnalysisRequest(BaseModel):
 
 class AnalysisSummary(BaseModel):
     """Summary of an analysis."""
-    id: str
-    created_at: str
-    completed_at: Optional[str]
+    id: UUID
+    created_at: datetime
+    completed_at: Optional[datetime]
     status: str
     sandbox_type: str  # Required: 'docker' or 'local' - determines which prompt file to modify
     num_projects: int
@@ -63,9 +67,9 @@ class AnalysisSummary(BaseModel):
 
 class AnalysisDetail(BaseModel):
     """Detailed analysis with patterns."""
-    id: str
-    created_at: str
-    completed_at: Optional[str]
+    id: UUID
+    created_at: datetime
+    completed_at: Optional[datetime]
     status: str
     sandbox_type: str  # Required: 'docker' or 'local' - determines which prompt file to modify
     projects_analyzed: List[str]
@@ -79,8 +83,8 @@ class AnalysisDetail(BaseModel):
 
 class Proposal(BaseModel):
     """Prompt change proposal."""
-    id: str
-    created_at: str
+    id: UUID
+    created_at: datetime
     prompt_file: str
     section_name: str
     change_type: str
@@ -90,7 +94,7 @@ class Proposal(BaseModel):
     evidence: dict  # Changed from List[dict] to dict - stores aggregated evidence
     confidence_level: int
     status: str
-    applied_at: Optional[str]
+    applied_at: Optional[datetime]
     applied_by: Optional[str]
 
 
@@ -121,180 +125,305 @@ class ImprovementMetrics(BaseModel):
     most_common_issues: List[dict]
 
 
+# Rows come from our own tables with matching column types, so response models
+# are built with model_construct() instead of re-validating every field. The
+# two fields whose stored values aren't guaranteed by the column type are
+# coerced explicitly.
+def _proposal_from_row(p: dict) -> Proposal:
+    """Build a Proposal response model from a prompt_proposals row."""
+    # JSONB column: may hold a list or scalar written by older analyzers
+    evidence = p.get('evidence')
+    if not isinstance(evidence, dict):
+        evidence = {}
+
+    try:
+        confidence_level = int(p.get('confidence_level') or 5)
+    except (TypeError, ValueError):
+        confidence_level = 5
+
+    return Proposal.model_construct(
+        id=p['id'],
+        created_at=p['created_at'],
+        prompt_file=p['prompt_file'],
+        section_name=p.get('section_name') or '',
+        change_type=p['change_type'],
+        original_text=p.get('original_text') or '',
+        proposed_text=p['proposed_text'],
+        rationale=p['rationale'],
+        evidence=evidence,
+        confidence_level=confidence_level,
+        status=p['status'],
+        applied_at=p.get('applied_at'),
+        applied_by=p.get('applied_by')
+    )
+
+
 # =============================================================================
-# Endpoints
+# Error Handling
 # =============================================================================
 
-@router.post("", response_model=dict)
-async def trigger_analysis(request: TriggerAnalysisRequest, background_tasks: BackgroundTasks):
+def _endpoint_errors(message: str):
     """
-    Trigger a new cross-project prompt improvement analysis.
+    Log unexpected handler errors and turn them into 500 responses.
 
-    Analyzes session patterns across projects to identify
-    common issues and generate concrete prompt improvements.
+    HTTPExceptions raised by the handler (400/404) pass through unchanged.
+    ``message`` is formatted with the handler's keyword arguments, so path
+    parameters such as ``{proposal_id}`` can be referenced.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(**kwargs):
+            try:
+                return await func(**kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.error(f"{message.format(**kwargs)}: {e}")
+                raise HTTPException(status_code=500, detail=str(e))
+        return wrapper
+    return decorator
+
+
+# =============================================================================
+# Conditional GET
+# =============================================================================
 
-    This now runs in the background to avoid timeouts when using Opus.
+# Read endpoints polled by the dashboard answer If-None-Match with 304. The
+# ETag hashes the serialized body, so it stays correct for writes made outside
+# this router (e.g. the analyzer CLI); no-cache makes clients revalidate
+# instead of serving a stale copy after a PATCH.
+_ANALYSIS_LIST_ADAPTER = TypeAdapter(List[AnalysisSummary])
+_ANALYSIS_DETAIL_ADAPTER = TypeAdapter(AnalysisDetail)
+_PROPOSAL_LIST_ADAPTER = TypeAdapter(List[Proposal])
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
     """
-    try:
-        db = await get_db()
+    Check an If-None-Match header against an ETag (weak comparison).
 
-        # Get configured minimum reviews requirement
-        from core.config import Config
-        config = Config.load_default()
-        min_reviews_required = config.review.min_reviews_for_analysis
+    Accepts '*', comma-separated lists and W/-prefixed tags, which proxies
+    and compressing middleware produce.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
+def _conditional_json_response(request: Request, adapter: TypeAdapter, payload) -> Response:
+    """Serialize payload once and return 304 if the client's ETag matches."""
+    body = adapter.dump_json(payload)
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
-        # Get project ID - only single project analysis supported
-        if not request.project_ids or len(request.project_ids) == 0:
-            # Auto-discover first eligible project
-            async with db.acquire() as conn:
-                # Get projects with sandbox_type matching request
-                # that have deep reviews with recommendations in the date range
-                query = """
-                    SELECT p.id, p.name, COUNT(DISTINCT dr.id) as review_count
-                    FROM projects p
-                    JOIN sessions s ON s.project_id = p.id
-                    JOIN session_deep_reviews dr ON dr.session_id = s.id
-                    WHERE (
-                        (p.metadata::jsonb->'settings'->>'sandbox_type' = $1)
-                        OR (p.metadata::jsonb->'settings' IS NULL AND $1 = 'docker')
-                    )
-                    AND s.created_at >= NOW() - $2::text::interval
-                    AND jsonb_array_length(dr.prompt_improvements) > 0
-                    GROUP BY p.id, p.name
-                    HAVING COUNT(DISTINCT dr.id) >= $3
-                    ORDER BY review_count DESC, p.created_at DESC
-                    LIMIT 1
-                """
 
-                row = await conn.fetchrow(
-                    query,
-                    request.sandbox_type,
-                    f'{request.last_n_days} days',
-                    min_reviews_required
-                )
+# =============================================================================
+# Metrics Cache
+# =============================================================================
+
+# The dashboard re-requests /metrics on every refresh while the underlying data
+# changes on human timescales; writes made through this router invalidate the
+# cache, the TTL bounds staleness for analyses completed in the background
+METRICS_CACHE_SECONDS = 30.0
+_metrics_cache: Optional[Tuple[float, ImprovementMetrics]] = None
 
-                if not row:
-                    return {
-                        "success": False,
-                        "message": f"No eligible projects found with {min_reviews_required}+ deep reviews in last {request.last_n_days} days"
-                    }
-
-                project_id = row['id']
-                project_name = row['name']
-                logger.info(f"Auto-selected project {project_name} ({project_id}) for analysis")
-        else:
-            # Use provided project_id (first one if multiple provided)
-            try:
-                project_id = UUID(request.project_ids[0])
-                # Get project name
-                async with db.acquire() as conn:
-                    project = await conn.fetchrow("SELECT name FROM projects WHERE id = $1", project_id)
-                    project_name = project['name'] if project else str(project_id)
-            except ValueError as e:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid project ID format: {e}"
-                )
 
-        # Create analysis record immediately with 'running' status
-        from uuid import uuid4
-        from datetime import datetime
+def _invalidate_metrics_cache():
+    """Drop cached metrics after analyses or proposals change."""
+    global _metrics_cache
+    _metrics_cache = None
 
-        analysis_id = uuid4()
 
+# =============================================================================
+# Endpoints
+# =============================================================================
+
+@router.post("", response_model=dict)
+@_endpoint_errors("Failed to trigger analysis")
+async def trigger_analysis(
+    request: TriggerAnalysisRequest,
+    background_tasks: BackgroundTasks,
+    response: Response
+):
+    """
+    Trigger a new cross-project prompt improvement analysis.
+
+    Analyzes session patterns across projects to identify
+    common issues and generate concrete prompt improvements.
+
+    This now runs in the background to avoid timeouts when using Opus:
+    the analysis row is created with status 'running' and the endpoint
+    answers 202 Accepted; poll GET /{analysis_id} for the result.
+    """
+    db = await get_db()
+
+    # Get configured minimum reviews requirement
+    from core.config import Config
+    config = Config.load_default()
+    min_reviews_required = config.review.min_reviews_for_analysis
+
+    # Get project ID - only single project analysis supported
+    if not request.project_ids or len(request.project_ids) == 0:
+        # Auto-discover first eligible project
         async with db.acquire() as conn:
-            await conn.execute(
-                """
-                INSERT INTO prompt_improvement_analyses (
-                    id,
-                    created_at,
-                    status,
-                    sandbox_type,
-                    projects_analyzed,
-                    triggered_by,
-                    notes
+            # Get projects with sandbox_type matching request
+            # that have deep reviews with recommendations in the date range
+            query = """
+                SELECT p.id, p.name, COUNT(DISTINCT dr.id) as review_count
+                FROM projects p
+                JOIN sessions s ON s.project_id = p.id
+                JOIN session_deep_reviews dr ON dr.session_id = s.id
+                WHERE (
+                    (p.metadata::jsonb->'settings'->>'sandbox_type' = $1)
+                    OR (p.metadata::jsonb->'settings' IS NULL AND $1 = 'docker')
                 )
-                VALUES ($1, $2, 'running', $3, $4, $5, $6)
-                """,
-                analysis_id,
-                datetime.now(),
+                AND s.created_at >= NOW() - $2::text::interval
+                AND jsonb_array_length(dr.prompt_improvements) > 0
+                GROUP BY p.id, p.name
+                HAVING COUNT(DISTINCT dr.id) >= $3
+                ORDER BY review_count DESC, p.created_at DESC
+                LIMIT 1
+            """
+
+            row = await conn.fetchrow(
+                query,
                 request.sandbox_type,
-                [project_id],  # Pass as UUID array
-                "manual",
-                f"Analyzing project: {project_name}"
+                f'{request.last_n_days} days',
+                min_reviews_required
             )
 
-        # Run analysis in background
-        async def _run_analysis():
-            """Background task to run the analysis."""
-            try:
-                db = await get_db()
-                analyzer = PromptImprovementAnalyzer(db)
-
-                logger.info(f"Starting background analysis {analysis_id} for project {project_id}")
+            if not row:
+                return {
+                    "success": False,
+                    "message": f"No eligible projects found with {min_reviews_required}+ deep reviews in last {request.last_n_days} days"
+                }
+
+            project_id = row['id']
+            project_name = row['name']
+            logger.info(f"Auto-selected project {project_name} ({project_id}) for analysis")
+    else:
+        # Use provided project_id (first one if multiple provided)
+        try:
+            project_id = UUID(request.project_ids[0])
+            # Get project name
+            async with db.acquire() as conn:
+                project = await conn.fetchrow("SELECT name FROM projects WHERE id = $1", project_id)
+                project_name = project['name'] if project else str(project_id)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid project ID format: {e}"
+            )
 
-                result = await analyzer.analyze_project(
-                    project_id=project_id,
-                    min_reviews=min_reviews_required,
-                    store_in_db=True,
-                    triggered_by="manual",
-                    analysis_id=analysis_id  # Pass the pre-created ID
-                )
+    # Create analysis record immediately with 'running' status
+    from uuid import uuid4
+    from datetime import datetime
+
+    analysis_id = uuid4()
+
+    async with db.acquire() as conn:
+        await conn.execute(
+            """
+            INSERT INTO prompt_improvement_analyses (
+                id,
+                created_at,
+                status,
+                sandbox_type,
+                projects_analyzed,
+                triggered_by,
+                notes
+            )
+            VALUES ($1, $2, 'running', $3, $4, $5, $6)
+            """,
+            analysis_id,
+            datetime.now(),
+            request.sandbox_type,
+            [project_id],  # Pass as UUID array
+            "manual",
+            f"Analyzing project: {project_name}"
+        )
+    _invalidate_metrics_cache()
+
+    # Run analysis in background
+    async def _run_analysis():
+        """Background task to run the analysis."""
+        try:
+            db = await get_db()
+            analyzer = PromptImprovementAnalyzer(db)
+
+            logger.info(f"Starting background analysis {analysis_id} for project {project_id}")
+
+            result = await analyzer.analyze_project(
+                project_id=project_id,
+                min_reviews=min_reviews_required,
+                store_in_db=True,
+                triggered_by="manual",
+                analysis_id=analysis_id  # Pass the pre-created ID
+            )
 
-                logger.info(f"Completed background analysis {analysis_id}")
+            logger.info(f"Completed background analysis {analysis_id}")
+            _invalidate_metrics_cache()
+
+            # Send WebSocket notification to project
+            from api.main import notify_project_update
+            await notify_project_update(str(project_id), {
+                "type": "prompt_improvement_complete",
+                "analysis_id": str(analysis_id),
+                "status": result.get("status", "completed"),
+                "proposals_count": len(result.get("proposals", [])),
+                "message": f"Prompt improvement analysis completed with {len(result.get('proposals', []))} proposals"
+            })
+
+        except Exception as e:
+            logger.error(f"Failed to run background analysis {analysis_id}: {e}", exc_info=True)
+            # Update status to failed
+            try:
+                async with db.acquire() as conn:
+                    await conn.execute(
+                        """
+                        UPDATE prompt_improvement_analyses
+                        SET status = 'failed', completed_at = NOW()
+                        WHERE id = $1
+                        """,
+                        analysis_id
+                    )
+                _invalidate_metrics_cache()
 
-                # Send WebSocket notification to project
+                # Send WebSocket notification about failure
                 from api.main import notify_project_update
                 await notify_project_update(str(project_id), {
-                    "type": "prompt_improvement_complete",
+                    "type": "prompt_improvement_failed",
                     "analysis_id": str(analysis_id),
-                    "status": result.get("status", "completed"),
-                    "proposals_count": len(result.get("proposals", [])),
-                    "message": f"Prompt improvement analysis completed with {len(result.get('proposals', []))} proposals"
+                    "error": str(e),
+                    "message": "Prompt improvement analysis failed"
                 })
+            except Exception as update_error:
+                logger.error(f"Failed to update analysis status: {update_error}")
 
-            except Exception as e:
-                logger.error(f"Failed to run background analysis {analysis_id}: {e}", exc_info=True)
-                # Update status to failed
-                try:
-                    async with db.acquire() as conn:
-                        await conn.execute(
-                            """
-                            UPDATE prompt_improvement_analyses
-                            SET status = 'failed', completed_at = NOW()
-                            WHERE id = $1
-                            """,
-                            analysis_id
-                        )
-
-                    # Send WebSocket notification about failure
-                    from api.main import notify_project_update
-                    await notify_project_update(str(project_id), {
-                        "type": "prompt_improvement_failed",
-                        "analysis_id": str(analysis_id),
-                        "error": str(e),
-                        "message": "Prompt improvement analysis failed"
-                    })
-                except Exception as update_error:
-                    logger.error(f"Failed to update analysis status: {update_error}")
-
-        background_tasks.add_task(_run_analysis)
+    background_tasks.add_task(_run_analysis)
 
-        return {
-            "success": True,
-            "message": f"Analysis started for project {project_name}",
-            "analysis_id": str(analysis_id),
-            "status": "running",
-            "note": "This analysis is running in the background. Refresh the page to see results."
-        }
-
-    except Exception as e:
-        logger.error(f"Failed to trigger analysis: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    response.status_code = 202
+    return {
+        "success": True,
+        "message": f"Analysis started for project {project_name}",
+        "analysis_id": str(analysis_id),
+        "status": "running",
+        "note": "This analysis is running in the background. Refresh the page to see results."
+    }
 
 
 @router.get("", response_model=List[AnalysisSummary])
+@_endpoint_errors("Failed to list analyses")
 async def list_analyses(
+    request: Request,
     status: Optional[str] = Query(None, description="Filter by status"),
     limit: int = Query(20, description="Maximum number to return", ge=1, le=100)
 ):
@@ -303,32 +432,28 @@ async def list_analyses(
 
     Returns summaries with proposal counts.
     """
-    try:
-        db = await get_db()
-        analyses = await db.list_prompt_analyses(limit=limit, status=status)
-
-        # Convert to response models
-        return [
-            AnalysisSummary(
-                id=str(a['id']),
-                created_at=a['created_at'].isoformat() if a.get('created_at') else None,
-                completed_at=a['completed_at'].isoformat() if a.get('completed_at') else None,
-                status=a['status'],
-                sandbox_type=a['sandbox_type'],  # Required field, no default
-                num_projects=a.get('num_projects', 0),
-                sessions_analyzed=a.get('sessions_analyzed', 0),
-                quality_impact_estimate=float(a['quality_impact_estimate']) if a.get('quality_impact_estimate') else None,
-                total_proposals=a.get('total_proposals', 0),
-                pending_proposals=a.get('pending_proposals', 0),
-                accepted_proposals=a.get('accepted_proposals', 0),
-                implemented_proposals=a.get('implemented_proposals', 0)
-            )
-            for a in analyses
-        ]
-
-    except Exception as e:
-        logger.error(f"Failed to list analyses: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    db = await get_db()
+    analyses = await db.list_prompt_analyses(limit=limit, status=status)
+
+    # Convert to response models
+    summaries = [
+        AnalysisSummary.model_construct(
+            id=a['id'],
+            created_at=a.get('created_at'),
+            completed_at=a.get('completed_at'),
+            status=a['status'],
+            sandbox_type=a['sandbox_type'],  # Required field, no default
+            num_projects=a.get('num_projects') or 0,
+            sessions_analyzed=a.get('sessions_analyzed') or 0,
+            quality_impact_estimate=float(a['quality_impact_estimate']) if a.get('quality_impact_estimate') else None,
+            total_proposals=a.get('total_proposals') or 0,
+            pending_proposals=a.get('pending_proposals') or 0,
+            accepted_proposals=a.get('accepted_proposals') or 0,
+            implemented_proposals=a.get('implemented_proposals') or 0
+        )
+        for a in analyses
+    ]
+    return _conditional_json_response(request, _ANALYSIS_LIST_ADAPTER, summaries)
 
 
 @router.get("/config", response_model=dict)
@@ -355,70 +480,25 @@ async def get_config():
 
 
 @router.get("/metrics", response_model=ImprovementMetrics)
+@_endpoint_errors("Failed to get improvement metrics")
 async def get_improvement_metrics():
     """
     Get overall prompt improvement metrics.
 
     Shows impact of improvements over time.
     """
-    try:
-        db = await get_db()
+    global _metrics_cache
 
-        # Get all analyses
-        analyses = await db.list_prompt_analyses(limit=100)
-
-        # Get all proposals
-        proposals = await db.list_prompt_proposals(limit=500)
-
-        # Calculate metrics
-        total_analyses = len(analyses)
-        total_proposals = len(proposals)
-        accepted_proposals = sum(1 for p in proposals if p['status'] == 'accepted')
-        implemented_proposals = sum(1 for p in proposals if p['status'] == 'implemented')
-
-        # Calculate average quality improvement
-        completed_analyses = [a for a in analyses if a.get('status') == 'completed']
-        avg_improvement = 0.0
-        if completed_analyses:
-            improvements = [
-                float(a.get('quality_impact_estimate', 0))
-                for a in completed_analyses
-                if a.get('quality_impact_estimate')
-            ]
-            avg_improvement = sum(improvements) / len(improvements) if improvements else 0.0
-
-        # Find most common issues
-        issue_counts = {}
-        for analysis in completed_analyses:
-            patterns = analysis.get('patterns_identified', {})
-            for issue in patterns.get('issues', []):
-                issue_type = issue.get('type', 'unknown')
-                if issue_type not in issue_counts:
-                    issue_counts[issue_type] = {
-                        'type': issue_type,
-                        'count': 0,
-                        'severity': issue.get('severity', 'unknown')
-                    }
-                issue_counts[issue_type]['count'] += 1
-
-        most_common = sorted(
-            issue_counts.values(),
-            key=lambda x: x['count'],
-            reverse=True
-        )[:5]
-
-        return ImprovementMetrics(
-            total_analyses=total_analyses,
-            total_proposals=total_proposals,
-            accepted_proposals=accepted_proposals,
-            implemented_proposals=implemented_proposals,
-            avg_quality_improvement=avg_improvement,
-            most_common_issues=most_common
-        )
+    if _metrics_cache and _metrics_cache[0] > time.monotonic():
+        return _metrics_cache[1]
 
-    except Exception as e:
-        logger.error(f"Failed to get improvement metrics: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    db = await get_db()
+
+    # Counts, average and issue histogram are aggregated in the database
+    metrics = ImprovementMetrics(**await db.get_prompt_improvement_metrics(issue_limit=5))
+
+    _metrics_cache = (time.monotonic() + METRICS_CACHE_SECONDS, metrics)
+    return metrics
 
 
 # ============================================================================
@@ -426,8 +506,9 @@ async def get_improvement_metrics():
 # ============================================================================
 
 @router.patch("/proposals/{proposal_id}", response_model=Proposal)
+@_endpoint_errors("Failed to update proposal {proposal_id}")
 async def update_proposal_status(
-    proposal_id: str,
+    proposal_id: UUID,
     request: UpdateProposalRequest
 ):
     """
@@ -435,72 +516,31 @@ async def update_proposal_status(
 
     Status values: 'proposed', 'accepted', 'rejected', 'implemented'
     """
-    logger.info(f"PATCH /proposals/{proposal_id} - Received proposal_id type={type(proposal_id)}, value={proposal_id}")
-    try:
-        logger.info(f"Attempting to parse UUID from: {repr(proposal_id)}")
-        proposal_uuid = UUID(proposal_id)
-        logger.info(f"Successfully parsed UUID: {proposal_uuid}")
-
-        # Validate status
-        valid_statuses = ['proposed', 'accepted', 'rejected', 'implemented']
-        if request.status not in valid_statuses:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
-            )
-
-        db = await get_db()
-        # Get current proposal
-        proposal = await db.get_prompt_proposal(proposal_uuid)
-        if not proposal:
-            raise HTTPException(status_code=404, detail="Proposal not found")
-
-        # Update status
-        await db.update_prompt_proposal_status(
-            proposal_uuid,
-            request.status
+    # Validate status
+    valid_statuses = ['proposed', 'accepted', 'rejected', 'implemented']
+    if request.status not in valid_statuses:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
         )
 
-        # Get updated proposal
-        updated = await db.get_prompt_proposal(proposal_uuid)
-
-        # Parse evidence if it's a JSON string
-        evidence = updated.get('evidence', [])
-        if isinstance(evidence, str):
-            import json
-            try:
-                evidence = json.loads(evidence)
-            except:
-                evidence = []
-
-        return Proposal(
-            id=str(updated['id']),
-            created_at=updated['created_at'].isoformat(),
-            prompt_file=updated['prompt_file'],
-            section_name=updated.get('section_name', ''),
-            change_type=updated['change_type'],
-            original_text=updated.get('original_text', ''),
-            proposed_text=updated['proposed_text'],
-            rationale=updated['rationale'],
-            evidence=evidence,
-            confidence_level=updated.get('confidence_level', 5),
-            status=updated['status'],
-            applied_at=updated['applied_at'].isoformat() if updated.get('applied_at') else None,
-            applied_by=updated.get('applied_by')
-        )
+    db = await get_db()
+    # Update status and get the updated proposal in one round trip
+    # (JSONB columns are decoded by the pool codec)
+    updated = await db.update_prompt_proposal_status(
+        proposal_id,
+        request.status
+    )
+    if not updated:
+        raise HTTPException(status_code=404, detail="Proposal not found")
+    _invalidate_metrics_cache()
 
-    except ValueError as ve:
-        logger.error(f"ValueError in update_proposal_status: {ve}")
-        raise HTTPException(status_code=400, detail="Invalid proposal ID format")
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to update proposal {proposal_id}: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    return _proposal_from_row(updated)
 
 
 @router.post("/proposals/{proposal_id}/apply", response_model=ApplyProposalResponse)
-async def apply_proposal(proposal_id: str):
+@_endpoint_errors("Failed to apply proposal {proposal_id}")
+async def apply_proposal(proposal_id: UUID):
     """
     Apply a proposal to the actual prompt file.
 
@@ -513,46 +553,38 @@ async def apply_proposal(proposal_id: str):
     NOTE: This endpoint is not yet fully implemented.
     For now, it only updates the proposal status.
     """
-    try:
-        proposal_uuid = UUID(proposal_id)
-        db = await get_db()
-        proposal = await db.get_prompt_proposal(proposal_uuid)
-        if not proposal:
+    db = await get_db()
+
+    # TODO: Implement actual file modification and git commit
+    # For now, just mark as implemented (only accepted proposals qualify)
+    updated = await db.update_prompt_proposal_status(
+        proposal_id,
+        'implemented',
+        applied_by='system',
+        applied_to_version='pending',
+        expected_status='accepted'
+    )
+    if not updated:
+        # Nothing changed; look up why only on this miss path
+        if not await db.get_prompt_proposal(proposal_id):
             raise HTTPException(status_code=404, detail="Proposal not found")
-
-        if proposal['status'] != 'accepted':
-            raise HTTPException(
-                status_code=400,
-                detail="Proposal must be 'accepted' before applying"
-            )
-
-        # TODO: Implement actual file modification and git commit
-        # For now, just mark as implemented
-        await db.update_prompt_proposal_status(
-            proposal_uuid,
-            'implemented',
-            applied_by='system',
-            applied_to_version='pending'
+        raise HTTPException(
+            status_code=400,
+            detail="Proposal must be 'accepted' before applying"
         )
+    _invalidate_metrics_cache()
 
-        return ApplyProposalResponse(
-            success=True,
-            message="Proposal marked as implemented (manual file changes required)",
-            git_commit_hash=None,
-            version_id=None
-        )
-
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid proposal ID format")
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to apply proposal {proposal_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return ApplyProposalResponse(
+        success=True,
+        message="Proposal marked as implemented (manual file changes required)",
+        git_commit_hash=None,
+        version_id=None
+    )
 
 
 @router.post("/proposals/{proposal_id}/generate-diff", response_model=dict)
-async def generate_diff(proposal_id: str):
+@_endpoint_errors("Failed to generate diff for proposal {proposal_id}")
+async def generate_diff(proposal_id: UUID):
     """
     Generate a precise diff for a proposal using Claude.
 
@@ -562,11 +594,10 @@ async def generate_diff(proposal_id: str):
     try:
         from review.diff_generator import generate_diff_for_proposal
 
-        proposal_uuid = UUID(proposal_id)
         db = await get_db()
 
         # Get proposal details
-        proposal = await db.get_prompt_proposal(proposal_uuid)
+        proposal = await db.get_prompt_proposal(proposal_id)
         if not proposal:
             raise HTTPException(status_code=404, detail="Proposal not found")
 
@@ -590,8 +621,8 @@ async def generate_diff(proposal_id: str):
                 )
                 WHERE id = $2
                 """,
-                json.dumps(diff_result),
-                proposal_uuid
+                diff_result,
+                proposal_id
             )
 
         return {
@@ -601,9 +632,6 @@ async def generate_diff(proposal_id: str):
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Failed to generate diff for proposal {proposal_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
 
 
 # ============================================================================
@@ -611,8 +639,10 @@ async def generate_diff(proposal_id: str):
 # ============================================================================
 
 @router.get("/{analysis_id}/proposals", response_model=List[Proposal])
+@_endpoint_errors("Failed to get proposals for analysis {analysis_id}")
 async def get_proposals(
-    analysis_id: str,
+    request: Request,
+    analysis_id: UUID,
     status: Optional[str] = Query(None, description="Filter by status")
 ):
     """
@@ -620,140 +650,76 @@ async def get_proposals(
 
     Proposals are sorted by confidence level (highest first).
     """
-    logger.info(f"get_proposals called with analysis_id={analysis_id} (type: {type(analysis_id)}, repr: {repr(analysis_id)})")
-    try:
-        logger.info(f"Attempting to parse UUID: {analysis_id}")
-        analysis_uuid = UUID(analysis_id)
-
-        logger.info(f"UUID parsed successfully: {analysis_uuid}")
-        db = await get_db()
-        proposals = await db.list_prompt_proposals(
-            analysis_id=analysis_uuid,
-            status=status
-        )
+    db = await get_db()
+    proposals = await db.list_prompt_proposals(
+        analysis_id=analysis_id,
+        status=status
+    )
 
-        result = []
-        for p in proposals:
-            # Parse evidence if it's a JSON string
-            evidence = p.get('evidence', [])
-            if isinstance(evidence, str):
-                import json
-                try:
-                    evidence = json.loads(evidence)
-                except:
-                    evidence = []
-
-            result.append(Proposal(
-                id=str(p['id']),
-                created_at=p['created_at'].isoformat(),
-                prompt_file=p['prompt_file'],
-                section_name=p.get('section_name', ''),
-                change_type=p['change_type'],
-                original_text=p.get('original_text', ''),
-                proposed_text=p['proposed_text'],
-                rationale=p['rationale'],
-                evidence=evidence,
-                confidence_level=p.get('confidence_level', 5),
-                status=p['status'],
-                applied_at=p['applied_at'].isoformat() if p.get('applied_at') else None,
-                applied_by=p.get('applied_by')
-            ))
-
-        return result
-
-    except ValueError as ve:
-        logger.error(f"ValueError parsing UUID '{analysis_id}': {ve}")
-        raise HTTPException(status_code=400, detail=f"Invalid analysis ID format: {str(ve)}")
-    except Exception as e:
-        logger.error(f"Failed to get proposals for analysis {analysis_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # JSONB columns (evidence) are decoded by the pool codec
+    return _conditional_json_response(
+        request, _PROPOSAL_LIST_ADAPTER, [_proposal_from_row(p) for p in proposals]
+    )
 
 
 @router.get("/{analysis_id}", response_model=AnalysisDetail)
-async def get_analysis(analysis_id: str):
+@_endpoint_errors("Failed to get analysis {analysis_id}")
+async def get_analysis(request: Request, analysis_id: UUID):
     """
     Get detailed analysis information.
 
     Includes identified patterns and proposals.
     """
-    try:
-        logger.info(f"get_analysis called with analysis_id={analysis_id}")
-        analysis_uuid = UUID(analysis_id)
-        db = await get_db()
-        analysis = await db.get_prompt_analysis(analysis_uuid)
-
-        if not analysis:
-            raise HTTPException(status_code=404, detail="Analysis not found")
-
-        # Parse patterns_identified if it's a JSON string
-        patterns = analysis.get('patterns_identified', {})
-        if isinstance(patterns, str):
-            import json
-            try:
-                patterns = json.loads(patterns)
-            except:
-                patterns = {}
-
-        # Convert quality_impact_estimate to float
-        quality_impact = analysis.get('quality_impact_estimate')
-        if quality_impact is not None:
-            quality_impact = float(quality_impact)
-
-        projects_analyzed = [str(pid) for pid in analysis.get('projects_analyzed', [])]
-
-        return AnalysisDetail(
-            id=str(analysis['id']),
-            created_at=analysis['created_at'].isoformat(),
-            completed_at=analysis['completed_at'].isoformat() if analysis.get('completed_at') else None,
-            status=analysis['status'],
-            sandbox_type=analysis['sandbox_type'],  # Required field - 'docker' or 'local'
-            projects_analyzed=projects_analyzed,
-            num_projects=len(projects_analyzed),  # Count of projects in the array
-            sessions_analyzed=analysis.get('sessions_analyzed', 0),
-            patterns_identified=patterns,
-            quality_impact_estimate=quality_impact,
-            triggered_by=analysis.get('triggered_by', 'unknown'),
-            notes=analysis.get('notes')
-        )
-
-    except ValueError as ve:
-        logger.error(f"ValueError in get_analysis for '{analysis_id}': {ve}")
-        raise HTTPException(status_code=400, detail=f"Invalid analysis ID format: {str(ve)}")
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get analysis {analysis_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
+    db = await get_db()
+    analysis = await db.get_prompt_analysis(analysis_id)
+
+    if not analysis:
+        raise HTTPException(status_code=404, detail="Analysis not found")
+
+    # patterns_identified is JSONB, decoded by the pool codec
+    patterns = analysis.get('patterns_identified') or {}
+
+    # Convert quality_impact_estimate to float
+    quality_impact = analysis.get('quality_impact_estimate')
+    if quality_impact is not None:
+        quality_impact = float(quality_impact)
+
+    projects_analyzed = [str(pid) for pid in analysis.get('projects_analyzed', [])]
+
+    detail = AnalysisDetail.model_construct(
+        id=analysis['id'],
+        created_at=analysis['created_at'],
+        completed_at=analysis.get('completed_at'),
+        status=analysis['status'],
+        sandbox_type=analysis['sandbox_type'],  # Required field - 'docker' or 'local'
+        projects_analyzed=projects_analyzed,
+        num_projects=len(projects_analyzed),  # Count of projects in the array
+        sessions_analyzed=analysis.get('sessions_analyzed') or 0,
+        patterns_identified=patterns,
+        quality_impact_estimate=quality_impact,
+        triggered_by=analysis.get('triggered_by') or 'unknown',
+        notes=analysis.get('notes')
+    )
+    return _conditional_json_response(request, _ANALYSIS_DETAIL_ADAPTER, detail)
 
 
 @router.delete("/{analysis_id}")
-async def delete_analysis(analysis_id: str):
+@_endpoint_errors("Failed to delete analysis {analysis_id}")
+async def delete_analysis(analysis_id: UUID):
     """
     Delete a prompt improvement analysis and all its proposals.
 
     This is a cascading delete - all proposals associated with this analysis
     will also be deleted.
     """
-    try:
-        analysis_uuid = UUID(analysis_id)
-        db = await get_db()
-        # Check if analysis exists
-        analysis = await db.get_prompt_analysis(analysis_uuid)
-        if not analysis:
-            raise HTTPException(status_code=404, detail="Analysis not found")
-
-        # Delete the analysis (proposals will cascade)
-        await db.delete_prompt_analysis(analysis_uuid)
-
-        return {"success": True, "message": "Analysis deleted successfully"}
-
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid analysis ID format")
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to delete analysis {analysis_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    db = await get_db()
+    # Check if analysis exists
+    analysis = await db.get_prompt_analysis(analysis_id)
+    if not analysis:
+        raise HTTPException(status_code=404, detail="Analysis not found")
 
+    # Delete the analysis (proposals will cascade)
+    await db.delete_prompt_analysis(analysis_id)
+    _invalidate_metrics_cache()
 
+    return {"success": True, "message": "Analysis deleted successfully"}
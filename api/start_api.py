@@ -43,5 +43,10 @@ uvicorn.run(
     host="0.0.0.0",
     port=8000,
     reload=False,  # DISABLED: Must manually restart to see code changes
-    log_level="error"
+    log_level="error",
+    loop="auto",  # uvloop when installed (uvicorn[standard]), else asyncio
+    http="auto",  # httptools when installed, else h11
+    ws="websockets",  # required dependency (requirements.txt)
+    ws_ping_interval=20.0,  # keepalive via protocol-level ping frames
+    ws_ping_timeout=20.0,
 )
@@ -62,9 +62,10 @@ class SessionManager:
 
     def restore_handlers(self):
         """Restore original signal handlers."""
-        if self._original_sigint:
+        # SIG_DFL is falsy, so compare against None rather than truthiness
+        if self._original_sigint is not None:
             signal.signal(signal.SIGINT, self._original_sigint)
-        if self._original_sigterm:
+        if self._original_sigterm is not None:
             signal.signal(signal.SIGTERM, self._original_sigterm)
 
     def _handle_interrupt(self, signum, frame):
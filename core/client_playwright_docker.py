@@ -82,7 +82,7 @@ def create_client(project_dir: Path, model: str, project_id: str = None, docker_
     # Ensure authentication is properly configured
     # The generated app may set ANTHROPIC_API_KEY in its environment, which can leak
     # into our agent process. We explicitly remove it and prefer CLAUDE_CODE_OAUTH_TOKEN.
-    from dotenv import load_dotenv
+    from core.config import load_agent_env
 
     # CRITICAL FIX: Remove any leaked ANTHROPIC_API_KEY BEFORE loading agent's .env
     # If we don't do this first, the leaked key persists in os.environ and gets picked up
@@ -92,9 +92,7 @@ def create_client(project_dir: Path, model: str, project_id: str = None, docker_
 
     # CRITICAL: Load .env from agent's root directory, NOT from project directory
     # The project directory may have its own .env file with ANTHROPIC_API_KEY for the generated app
-    agent_root = Path(__file__).parent.parent  # /path/to/yokeflow/ (parent of core/)
-    agent_env_file = agent_root / ".env"
-    load_dotenv(dotenv_path=agent_env_file)  # Load from agent's .env file only
+    load_agent_env()  # Load from agent's .env file only
 
     # Now check for authentication (after cleaning environment and loading our .env)
     api_key = os.getenv("ANTHROPIC_API_KEY")
@@ -6,22 +6,57 @@ Centralized configuration for YokeFlow.
 Supports YAML configuration files with sensible defaults.
 """
 
+import copy
 import os
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 import yaml
 
 # Load environment variables from .env file in agent root directory
 # CRITICAL: Do NOT load from CWD, which might be a generated project directory
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
 # Get agent root directory (parent of core/ where this config.py file is located)
 _agent_root = Path(__file__).parent.parent
 _agent_env_file = _agent_root / ".env"
 
+# Parsed agent .env with its (st_mtime_ns, st_size, st_ino) signature
+_agent_env_cache: Optional[Tuple[Tuple[int, int, int], Dict[str, Optional[str]]]] = None
+
+
+def load_agent_env() -> None:
+    """
+    Apply the agent's .env to os.environ without overriding existing values.
+
+    Same effect as load_dotenv(dotenv_path=<agent root>/.env), but the file
+    is only parsed again after it changes and a missing file costs one stat.
+    """
+    global _agent_env_cache
+    try:
+        stat = os.stat(_agent_env_file)
+    except FileNotFoundError:
+        return
+
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached = _agent_env_cache
+    if cached is None or cached[0] != signature:
+        cached = _agent_env_cache = (signature, dotenv_values(_agent_env_file))
+
+    for key, value in cached[1].items():
+        if value is not None and key not in os.environ:
+            os.environ[key] = value
+
+
 # Load from agent's .env only, not from any project directory
-load_dotenv(dotenv_path=_agent_env_file)
+load_agent_env()
+
+# Parsed config files keyed by absolute path. Each entry carries the file's
+# (st_mtime_ns, st_size, st_ino) signature so in-place edits and atomic
+# rewrites both force a reparse.
+_config_cache: Dict[str, Tuple[Tuple[int, int, int], 'Config']] = {}
+_config_cache_lock = threading.Lock()
 
 
 @dataclass
@@ -125,15 +160,36 @@ class Config:
         """
         Load configuration from YAML file.
 
+        Parsed files are cached per process and reused until the file's
+        mtime, size or inode changes.
+
         Args:
             config_path: Path to YAML config file
 
         Returns:
             Config instance with values from file merged with defaults
         """
-        if not config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
+        try:
+            stat = os.stat(config_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+        key = os.path.abspath(config_path)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        with _config_cache_lock:
+            cached = _config_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            # Callers may mutate their Config, so never hand out the cached one
+            return copy.deepcopy(cached[1])
+
+        config = cls._parse_file(config_path)
+        with _config_cache_lock:
+            _config_cache[key] = (signature, config)
+        return copy.deepcopy(config)
 
+    @classmethod
+    def _parse_file(cls, config_path: Path) -> 'Config':
+        """Parse a YAML config file and merge it over the defaults."""
         with open(config_path, 'r') as f:
             data = yaml.safe_load(f) or {}
 
@@ -210,15 +266,20 @@ class Config:
         Returns:
             Config instance
         """
+        # load_from_file stats the path itself, so attempt the load directly
+        # instead of probing with exists() first
+
         # Check current directory for new name
-        current_dir_config = Path('.yokeflow.yaml')
-        if current_dir_config.exists():
-            return cls.load_from_file(current_dir_config)
+        try:
+            return cls.load_from_file(Path('.yokeflow.yaml'))
+        except FileNotFoundError:
+            pass
 
         # Check home directory for new name
-        home_config = Path.home() / '.yokeflow.yaml'
-        if home_config.exists():
-            return cls.load_from_file(home_config)
+        try:
+            return cls.load_from_file(Path.home() / '.yokeflow.yaml')
+        except FileNotFoundError:
+            pass
 
         # Use defaults
         return cls()
@@ -11,12 +11,14 @@ implementation optimized for the new unified database structure.
 
 import asyncpg
 import json
+import orjson
 from pathlib import Path
-from typing import Optional, Dict, List, Any, Union
+from typing import Optional, Dict, List, Any, Tuple, Union
 from datetime import datetime
 from contextlib import asynccontextmanager
 from uuid import UUID, uuid4
 import hashlib
+import time
 
 from core.config import Config
 from core.database_retry import with_retry, RetryConfig
@@ -30,6 +32,106 @@ from core.errors import (
 
 logger = get_logger(__name__)
 
+# Primary-key project lookup behind nearly every project endpoint
+GET_PROJECT_SQL = "SELECT * FROM projects WHERE id = $1"
+
+# Session list for the API, shaped as a JSON array by PostgreSQL; polled by
+# the web UI on every project page
+SESSION_HISTORY_JSON_SQL = """
+    SELECT COALESCE(
+        jsonb_agg(
+            to_jsonb(s) || jsonb_build_object(
+                'session_id', s.id,
+                'metrics', COALESCE(s.metrics, '{}'::jsonb)
+            )
+            ORDER BY s.session_number DESC
+        ),
+        '[]'::jsonb
+    )::text
+    FROM (
+        SELECT * FROM sessions
+        WHERE project_id = $1
+        ORDER BY session_number DESC
+        LIMIT $2
+    ) s
+    """
+
+# Upper bound on waiting for a free pooled connection; an exhausted pool then
+# fails the request instead of queueing it indefinitely
+POOL_ACQUIRE_TIMEOUT_SECONDS = 30.0
+
+# How long get_project_settings() results are served from memory. Writes made
+# through this class invalidate immediately; the TTL bounds staleness for
+# writes made by other processes (CLI, MCP server).
+SETTINGS_CACHE_TTL_SECONDS = 60.0
+
+
+# JSONB binary wire format: a version byte followed by the JSON text
+JSONB_BINARY_VERSION = b'\x01'
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    """Encode a JSONB parameter, passing through already-serialized JSON text."""
+    if isinstance(value, str):
+        return JSONB_BINARY_VERSION + value.encode()
+    return JSONB_BINARY_VERSION + orjson.dumps(value, default=str)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    """Decode a binary JSONB value, skipping the version byte."""
+    return orjson.loads(data[1:])
+
+
+async def _register_jsonb_codec(conn: asyncpg.Connection) -> None:
+    """
+    Decode JSONB columns to Python objects on each new pooled connection.
+
+    Without a codec asyncpg returns JSONB as text, leaving every caller to
+    json.loads() it. Decoding happens once here with orjson instead, using
+    the binary format so orjson reads the raw bytes without a str round trip.
+    """
+    await conn.set_type_codec(
+        'jsonb',
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema='pg_catalog',
+        format='binary'
+    )
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Register codecs and warm the statement cache on a new connection."""
+    await _register_jsonb_codec(conn)
+    await _warm_statement_cache(conn)
+
+
+async def _warm_statement_cache(conn: asyncpg.Connection) -> None:
+    """
+    Prepare hot read statements on each new pooled connection.
+
+    asyncpg caches prepared statements per connection keyed by SQL text, so
+    running each once (a NULL key matches no rows) means request-path
+    calls only bind and execute. Cached plans are re-prepared automatically
+    if the table definition changes.
+    """
+    await conn.fetchrow(GET_PROJECT_SQL, None)
+    await conn.fetchval(SESSION_HISTORY_JSON_SQL, None, 0)
+
+
+def _empty_progress(project_id: UUID) -> Dict[str, Any]:
+    """Progress statistics for a project with no v_progress row."""
+    return {
+        "project_id": project_id,
+        "total_epics": 0,
+        "completed_epics": 0,
+        "total_tasks": 0,
+        "completed_tasks": 0,
+        "total_tests": 0,
+        "passing_tests": 0,
+        "task_completion_pct": 0.0,
+        "test_pass_pct": 0.0
+    }
+
 
 class TaskDatabase:
     """
@@ -49,9 +151,16 @@ class TaskDatabase:
         """
         self.connection_url = connection_url
         self.pool: Optional[asyncpg.Pool] = None
+        # project_id -> (expires_at monotonic, settings)
+        self._settings_cache: Dict[UUID, tuple] = {}
 
     @with_retry(RetryConfig(max_retries=5, base_delay=2.0, max_delay=60.0))
-    async def connect(self, min_size: int = 10, max_size: int = 20):
+    async def connect(
+        self,
+        min_size: int = 10,
+        max_size: int = 50,
+        max_inactive_connection_lifetime: float = 300.0
+    ):
         """
         Create connection pool to PostgreSQL with retry logic.
 
@@ -61,17 +170,28 @@ class TaskDatabase:
         Args:
             min_size: Minimum number of connections in pool
             max_size: Maximum number of connections in pool
+            max_inactive_connection_lifetime: Seconds before idle connections are closed
 
         Raises:
             asyncpg.PostgresError: If connection fails after all retries
         """
+        from core.database_connection import get_statement_cache_size
+
+        statement_cache_size = get_statement_cache_size()
         self.pool = await asyncpg.create_pool(
             self.connection_url,
             min_size=min_size,
             max_size=max_size,
-            command_timeout=60
+            max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+            command_timeout=60,
+            statement_cache_size=statement_cache_size,
+            # Nothing to warm when the cache is disabled (PgBouncer compatibility)
+            init=_init_connection if statement_cache_size else _register_jsonb_codec
+        )
+        logger.info(
+            f"Connected to PostgreSQL with pool size {min_size}-{max_size} "
+            f"(statement cache: {statement_cache_size})"
         )
-        logger.info(f"Connected to PostgreSQL with pool size {min_size}-{max_size}")
 
     async def disconnect(self):
         """Close connection pool."""
@@ -88,7 +208,7 @@ class TaskDatabase:
         """
         @with_retry(RetryConfig(max_retries=3, base_delay=1.0))
         async def _acquire_with_retry():
-            return await self.pool.acquire()
+            return await self.pool.acquire(timeout=POOL_ACQUIRE_TIMEOUT_SECONDS)
 
         conn = await _acquire_with_retry()
         try:
@@ -105,7 +225,7 @@ class TaskDatabase:
         """
         @with_retry(RetryConfig(max_retries=3, base_delay=1.0))
         async def _acquire_with_retry():
-            return await self.pool.acquire()
+            return await self.pool.acquire(timeout=POOL_ACQUIRE_TIMEOUT_SECONDS)
 
         conn = await _acquire_with_retry()
         try:
@@ -179,22 +299,60 @@ class TaskDatabase:
         Returns:
             Project record or None if not found
         """
+        async with self.acquire() as conn:
+            row = await conn.fetchrow(GET_PROJECT_SQL, project_id)
+            if not row:
+                return None
+
+            project = dict(row)
+
+            # Extract local_path from metadata JSONB if present
+            if project.get('metadata') and isinstance(project['metadata'], dict):
+                if 'local_path' in project['metadata']:
+                    project['local_path'] = project['metadata']['local_path']
+
+            return project
+
+    async def get_project_with_active_session(
+        self,
+        project_id: UUID
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Get a project and its running session (if any) in one query.
+
+        Args:
+            project_id: Project UUID
+
+        Returns:
+            Tuple of (project record, active session); project is None if not
+            found. The session's timestamps are ISO strings (built as JSONB).
+        """
         async with self.acquire() as conn:
             row = await conn.fetchrow(
-                "SELECT * FROM projects WHERE id = $1",
+                """
+                SELECT p.*, (
+                    SELECT to_jsonb(s) FROM sessions s
+                    WHERE s.project_id = p.id AND s.status = 'running'
+                    ORDER BY s.created_at DESC
+                    LIMIT 1
+                ) AS active_session
+                FROM projects p
+                WHERE p.id = $1
+                """,
                 project_id
             )
             if not row:
-                return None
+                return None, None
 
             project = dict(row)
+            active_session = project.pop('active_session')
 
             # Extract local_path from metadata JSONB if present
             if project.get('metadata') and isinstance(project['metadata'], dict):
                 if 'local_path' in project['metadata']:
                     project['local_path'] = project['metadata']['local_path']
 
-            return project
+            return project, active_session
 
     async def update_project(
         self,
@@ -217,21 +375,13 @@ class TaskDatabase:
                     project_id
                 )
 
-                # Parse metadata - asyncpg may return it as string or dict
-                if row and row['metadata']:
-                    if isinstance(row['metadata'], str):
-                        metadata = json.loads(row['metadata'])
-                    else:
-                        metadata = dict(row['metadata'])
-                else:
-                    metadata = {}
-
+                metadata = row['metadata'] if row and row['metadata'] else {}
                 metadata['local_path'] = kwargs['local_path']
 
                 # Update metadata
                 await conn.execute(
                     "UPDATE projects SET metadata = $1 WHERE id = $2",
-                    json.dumps(metadata), project_id
+                    metadata, project_id
                 )
             return
 
@@ -358,6 +508,8 @@ class TaskDatabase:
                 project_id
             )
 
+        self._settings_cache.pop(project_id, None)
+
     async def get_project_settings(self, project_id: UUID) -> Dict[str, Any]:
         """
         Get project settings from metadata JSONB field.
@@ -370,6 +522,19 @@ class TaskDatabase:
         Returns:
             Dictionary of settings with defaults applied
         """
+        cached = self._settings_cache.get(project_id)
+        if cached and cached[0] > time.monotonic():
+            return dict(cached[1])
+
+        settings = await self._load_project_settings(project_id)
+        self._settings_cache[project_id] = (
+            time.monotonic() + SETTINGS_CACHE_TTL_SECONDS,
+            settings
+        )
+        return dict(settings)
+
+    async def _load_project_settings(self, project_id: UUID) -> Dict[str, Any]:
+        """Read project settings from the database, bypassing the cache."""
         async with self.acquire() as conn:
             row = await conn.fetchrow(
                 "SELECT metadata FROM projects WHERE id = $1",
@@ -387,11 +552,6 @@ class TaskDatabase:
                 }
 
             metadata = row['metadata']
-            # asyncpg returns JSONB as string, parse if needed
-            if isinstance(metadata, str):
-                import json
-                metadata = json.loads(metadata)
-
             settings = metadata.get('settings', {})
 
             # Apply defaults for missing keys from Config
@@ -425,11 +585,6 @@ class TaskDatabase:
             )
 
             metadata = row['metadata'] if row and row['metadata'] else {}
-            # asyncpg returns JSONB as string, parse if needed
-            if isinstance(metadata, str):
-                import json
-                metadata = json.loads(metadata)
-
             current_settings = metadata.get('settings', {})
 
             # Merge with new settings
@@ -439,10 +594,12 @@ class TaskDatabase:
             # Update in database
             await conn.execute(
                 "UPDATE projects SET metadata = $1 WHERE id = $2",
-                json.dumps(metadata),
+                metadata,
                 project_id
             )
 
+        self._settings_cache.pop(project_id, None)
+
     async def store_test_coverage(
         self,
         project_id: UUID,
@@ -463,9 +620,6 @@ class TaskDatabase:
             )
 
             metadata = row['metadata'] if row and row['metadata'] else {}
-            # asyncpg returns JSONB as string, parse if needed
-            if isinstance(metadata, str):
-                metadata = json.loads(metadata)
 
             # Store coverage data with timestamp
             from datetime import datetime
@@ -477,7 +631,7 @@ class TaskDatabase:
             # Update metadata
             await conn.execute(
                 "UPDATE projects SET metadata = $1 WHERE id = $2",
-                json.dumps(metadata),
+                metadata,
                 project_id
             )
 
@@ -503,12 +657,7 @@ class TaskDatabase:
             if not row or not row['metadata']:
                 return None
 
-            metadata = row['metadata']
-            # asyncpg returns JSONB as string, parse if needed
-            if isinstance(metadata, str):
-                metadata = json.loads(metadata)
-
-            return metadata.get('test_coverage')
+            return row['metadata'].get('test_coverage')
 
     async def list_projects(
         self,
@@ -542,6 +691,84 @@ class TaskDatabase:
             rows = await conn.fetch(query, *params)
             return [dict(row) for row in rows]
 
+    async def list_projects_with_progress(
+        self,
+        user_id: Optional[UUID] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List projects together with their progress, next task and active session.
+
+        Set-based equivalent of calling get_progress(), get_next_task() and
+        get_active_session() per project: a fixed number of queries on one
+        connection however many projects there are.
+
+        Args:
+            user_id: Filter by user ID
+
+        Returns:
+            List of project records, each with 'progress', 'next_task' and
+            'active_session' keys
+        """
+        projects = await self.list_projects(user_id=user_id)
+        if not projects:
+            return []
+
+        project_ids = [project['id'] for project in projects]
+
+        async with self.acquire() as conn:
+            progress_rows = await conn.fetch(
+                "SELECT * FROM v_progress WHERE project_id = ANY($1::uuid[])",
+                project_ids
+            )
+            session_rows = await conn.fetch(
+                """
+                SELECT DISTINCT ON (project_id) * FROM sessions
+                WHERE project_id = ANY($1::uuid[]) AND status = 'running'
+                ORDER BY project_id, created_at DESC
+                """,
+                project_ids
+            )
+            task_rows = await conn.fetch(
+                """
+                SELECT DISTINCT ON (t.project_id)
+                    t.*,
+                    e.name as epic_name,
+                    e.description as epic_description
+                FROM tasks t
+                JOIN epics e ON t.epic_id = e.id
+                WHERE t.project_id = ANY($1::uuid[])
+                    AND t.done = false
+                    AND e.status != 'completed'
+                ORDER BY t.project_id, e.priority, t.priority, t.id
+                """,
+                project_ids
+            )
+
+            tests_by_task: Dict[int, List[Dict[str, Any]]] = {row['id']: [] for row in task_rows}
+            if tests_by_task:
+                test_rows = await conn.fetch(
+                    "SELECT * FROM tests WHERE task_id = ANY($1::int[]) ORDER BY id",
+                    list(tests_by_task)
+                )
+                for row in test_rows:
+                    tests_by_task[row['task_id']].append(dict(row))
+
+        progress_by_project = {row['project_id']: dict(row) for row in progress_rows}
+        session_by_project = {row['project_id']: dict(row) for row in session_rows}
+        task_by_project = {}
+        for row in task_rows:
+            task = dict(row)
+            task['tests'] = tests_by_task[task['id']]
+            task_by_project[task['project_id']] = task
+
+        for project in projects:
+            project_id = project['id']
+            project['progress'] = progress_by_project.get(project_id) or _empty_progress(project_id)
+            project['next_task'] = task_by_project.get(project_id)
+            project['active_session'] = session_by_project.get(project_id)
+
+        return projects
+
     # =========================================================================
     # Session Operations
     # =========================================================================
@@ -713,7 +940,6 @@ class TaskDatabase:
         Returns:
             List of session records
         """
-        import json
         async with self.acquire() as conn:
             rows = await conn.fetch(
                 """
@@ -724,18 +950,30 @@ class TaskDatabase:
                 """,
                 project_id, limit
             )
-            # Convert rows to dicts and parse JSONB fields
-            result = []
-            for row in rows:
-                session_dict = dict(row)
-                # Parse metrics JSONB field (asyncpg returns it as a string)
-                if 'metrics' in session_dict and isinstance(session_dict['metrics'], str):
-                    try:
-                        session_dict['metrics'] = json.loads(session_dict['metrics'])
-                    except (json.JSONDecodeError, TypeError):
-                        session_dict['metrics'] = {}
-                result.append(session_dict)
-            return result
+            # metrics arrives decoded by the pool's JSONB codec
+            return [dict(row) for row in rows]
+
+    async def get_session_history_json(
+        self,
+        project_id: UUID,
+        limit: int = 10
+    ) -> str:
+        """
+        Get session history for a project as a ready-to-send JSON array.
+
+        Same rows and ordering as get_session_history(), shaped by PostgreSQL
+        for the API: each object gains a 'session_id' alias for 'id' and a
+        NULL 'metrics' becomes {}.
+
+        Args:
+            project_id: Project UUID
+            limit: Maximum number of sessions to return
+
+        Returns:
+            JSON array text
+        """
+        async with self.acquire() as conn:
+            return await conn.fetchval(SESSION_HISTORY_JSON_SQL, project_id, limit)
 
     async def update_session_heartbeat(self, session_id: UUID) -> None:
         """
@@ -787,27 +1025,28 @@ class TaskDatabase:
         async with self.acquire() as conn:
             # Update stale sessions to 'interrupted' status
             # Use last_heartbeat if available, otherwise fall back to started_at
-            result = await conn.execute(
+            # Count updated rows in the same statement (no "UPDATE N" parsing)
+            count = await conn.fetchval(
                 """
-                UPDATE sessions
-                SET status = 'interrupted',
-                    ended_at = COALESCE(ended_at, NOW()),
-                    interruption_reason = 'Marked as stale (ungraceful shutdown detected)'
-                WHERE status = 'running'
-                  AND ended_at IS NULL
-                  AND (
-                    -- Use last_heartbeat if available, otherwise started_at (for backwards compatibility)
-                    (type = 'initializer' AND COALESCE(last_heartbeat, started_at) < NOW() - INTERVAL '35 minutes')
-                    OR (type = 'coding' AND COALESCE(last_heartbeat, started_at) < NOW() - INTERVAL '15 minutes')
-                    OR (type = 'review' AND COALESCE(last_heartbeat, started_at) < NOW() - INTERVAL '10 minutes')
-                    OR (type IS NULL AND COALESCE(last_heartbeat, started_at) < NOW() - INTERVAL '15 minutes')  -- Default
-                  )
+                WITH stale AS (
+                    UPDATE sessions
+                    SET status = 'interrupted',
+                        ended_at = COALESCE(ended_at, NOW()),
+                        interruption_reason = 'Marked as stale (ungraceful shutdown detected)'
+                    WHERE status = 'running'
+                      AND ended_at IS NULL
+                      AND (
+                        -- Use last_heartbeat if available, otherwise started_at (for backwards compatibility)
+                        (type = 'initializer' AND COALESCE(last_heartbeat, started_at) < NOW() - INTERVAL '35 minutes')
+                        OR (type = 'coding' AND COALESCE(last_heartbeat, started_at) < NOW() - INTERVAL '15 minutes')
+                        OR (type = 'review' AND COALESCE(last_heartbeat, started_at) < NOW() - INTERVAL '10 minutes')
+                        OR (type IS NULL AND COALESCE(last_heartbeat, started_at) < NOW() - INTERVAL '15 minutes')  -- Default
+                      )
+                    RETURNING 1
+                )
+                SELECT count(*) FROM stale
                 """
-            )
-
-            # Extract number of updated rows from result
-            # asyncpg returns "UPDATE N" where N is the count
-            count = int(result.split()[-1]) if result else 0
+            ) or 0
 
             if count > 0:
                 logger.info(f"Cleaned up {count} stale session(s)")
@@ -1019,7 +1258,8 @@ class TaskDatabase:
         project_id: UUID,
         epic_id: Optional[int] = None,
         only_pending: bool = False,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        done: Optional[bool] = None
     ) -> List[Dict[str, Any]]:
         """
         List tasks with optional filtering.
@@ -1029,6 +1269,7 @@ class TaskDatabase:
             epic_id: Filter by epic
             only_pending: Only incomplete tasks
             limit: Maximum tasks to return
+            done: Filter by completion state (None = all)
 
         Returns:
             List of task records
@@ -1047,6 +1288,9 @@ class TaskDatabase:
 
         if only_pending:
             query += " AND t.done = false"
+        elif done is not None:
+            params.append(done)
+            query += f" AND t.done = ${len(params)}"
 
         query += " ORDER BY e.priority, t.priority, t.id"
 
@@ -1153,17 +1397,7 @@ class TaskDatabase:
                 return dict(row)
             else:
                 # Return empty stats if no data
-                return {
-                    "project_id": project_id,
-                    "total_epics": 0,
-                    "completed_epics": 0,
-                    "total_tasks": 0,
-                    "completed_tasks": 0,
-                    "total_tests": 0,
-                    "passing_tests": 0,
-                    "task_completion_pct": 0.0,
-                    "test_pass_pct": 0.0
-                }
+                return _empty_progress(project_id)
 
     async def get_epic_progress(
         self,
@@ -1931,8 +2165,9 @@ class TaskDatabase:
         proposal_id: UUID,
         status: str,
         applied_by: Optional[str] = None,
-        applied_to_version: Optional[str] = None
-    ):
+        applied_to_version: Optional[str] = None,
+        expected_status: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Update proposal status.
 
@@ -1941,10 +2176,14 @@ class TaskDatabase:
             status: New status ('accepted', 'rejected', 'implemented')
             applied_by: Who applied the change
             applied_to_version: Git commit hash
+            expected_status: Only update if the proposal currently has this status
+
+        Returns:
+            Updated proposal record, or None if no proposal matched
         """
         async with self.acquire() as conn:
             if status == 'implemented':
-                await conn.execute(
+                row = await conn.fetchrow(
                     """
                     UPDATE prompt_proposals
                     SET
@@ -1952,19 +2191,76 @@ class TaskDatabase:
                         applied_at = NOW(),
                         applied_by = $3,
                         applied_to_version = $4
-                    WHERE id = $1
+                    WHERE id = $1 AND ($5::varchar IS NULL OR status = $5)
+                    RETURNING *
                     """,
-                    proposal_id, status, applied_by, applied_to_version
+                    proposal_id, status, applied_by, applied_to_version, expected_status
                 )
             else:
-                await conn.execute(
+                row = await conn.fetchrow(
                     """
                     UPDATE prompt_proposals
                     SET status = $2
-                    WHERE id = $1
+                    WHERE id = $1 AND ($3::varchar IS NULL OR status = $3)
+                    RETURNING *
                     """,
-                    proposal_id, status
+                    proposal_id, status, expected_status
                 )
+            return dict(row) if row else None
+
+    async def get_prompt_improvement_metrics(self, issue_limit: int = 5) -> Dict[str, Any]:
+        """
+        Aggregate prompt improvement metrics in a single query.
+
+        Args:
+            issue_limit: Number of most common issue types to return
+
+        Returns:
+            Dict with analysis/proposal counts, average quality improvement of
+            completed analyses and the most common issue types
+        """
+        async with self.acquire() as conn:
+            row = await conn.fetchrow(
+                """
+                SELECT
+                    (SELECT COUNT(*) FROM prompt_improvement_analyses) AS total_analyses,
+                    p.total_proposals,
+                    p.accepted_proposals,
+                    p.implemented_proposals,
+                    (
+                        SELECT COALESCE(AVG(quality_impact_estimate), 0)
+                        FROM prompt_improvement_analyses
+                        WHERE status = 'completed' AND quality_impact_estimate <> 0
+                    ) AS avg_quality_improvement,
+                    (
+                        SELECT COALESCE(jsonb_agg(i ORDER BY i.count DESC), '[]'::jsonb)
+                        FROM (
+                            SELECT
+                                COALESCE(issue->>'type', 'unknown') AS type,
+                                COUNT(*) AS count,
+                                COALESCE(mode() WITHIN GROUP (ORDER BY issue->>'severity'), 'unknown') AS severity
+                            FROM prompt_improvement_analyses a,
+                                 jsonb_array_elements(a.patterns_identified->'issues') AS issue
+                            WHERE a.status = 'completed'
+                              AND jsonb_typeof(a.patterns_identified->'issues') = 'array'
+                            GROUP BY 1
+                            ORDER BY count DESC
+                            LIMIT $1
+                        ) i
+                    ) AS most_common_issues
+                FROM (
+                    SELECT
+                        COUNT(*) AS total_proposals,
+                        COUNT(*) FILTER (WHERE status = 'accepted') AS accepted_proposals,
+                        COUNT(*) FILTER (WHERE status = 'implemented') AS implemented_proposals
+                    FROM prompt_proposals
+                ) p
+                """,
+                issue_limit
+            )
+            metrics = dict(row)
+            metrics['avg_quality_improvement'] = float(metrics['avg_quality_improvement'])
+            return metrics
 
     async def get_project_review_stats(
         self,
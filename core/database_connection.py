@@ -18,20 +18,14 @@ Usage:
 """
 
 import os
-from pathlib import Path
 from typing import Optional
 import logging
 
 # Load environment variables from .env file in agent root directory
 # CRITICAL: Do NOT load from CWD, which might be a generated project directory
-from dotenv import load_dotenv
+from core.config import load_agent_env
 
-# Get agent root directory (parent of core/ where this file is located)
-_agent_root = Path(__file__).parent.parent
-_agent_env_file = _agent_root / ".env"
-
-# Load from agent's .env only, not from any project directory
-load_dotenv(dotenv_path=_agent_env_file)
+load_agent_env()
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +33,9 @@ logger = logging.getLogger(__name__)
 _db_instance: Optional['TaskDatabase'] = None
 _db_lock = None  # Will be set to asyncio.Lock() when needed
 
+# Prepared statements cached per pooled connection (0 disables the cache)
+DEFAULT_STATEMENT_CACHE_SIZE = 1024
+
 
 def get_database_url() -> str:
     """
@@ -62,6 +59,36 @@ def get_database_url() -> str:
     return database_url
 
 
+def get_statement_cache_size() -> int:
+    """
+    Get the asyncpg prepared statement cache size from environment.
+
+    PgBouncer in transaction pooling mode breaks server-side named prepared
+    statements unless it is 1.21+ with max_prepared_statements enabled.
+    Set DATABASE_STATEMENT_CACHE_SIZE=0 to disable the cache in that case.
+
+    asyncpg prepares and caches every query by SQL text per connection, so
+    the hot read paths (list_tasks, list_epics, get_progress, ...) skip
+    parse/plan after first use. The default is larger than asyncpg's 100 so
+    dynamically-built query variants do not evict each other.
+
+    Returns:
+        Statement cache size per connection
+    """
+    value = os.getenv("DATABASE_STATEMENT_CACHE_SIZE", "").strip()
+    if not value:
+        return DEFAULT_STATEMENT_CACHE_SIZE
+
+    try:
+        return max(0, int(value))
+    except ValueError:
+        logger.warning(
+            f"Invalid DATABASE_STATEMENT_CACHE_SIZE '{value}', "
+            f"using default {DEFAULT_STATEMENT_CACHE_SIZE}"
+        )
+        return DEFAULT_STATEMENT_CACHE_SIZE
+
+
 def create_database(connection_string: Optional[str] = None):
     """
     Create a PostgreSQL database instance.
@@ -116,6 +143,10 @@ async def get_db(connection_string: Optional[str] = None):
     """
     global _db_instance, _db_lock
 
+    # Fast path: pool already created, no need to contend on the lock
+    if _db_instance is not None and _db_instance.pool is not None:
+        return _db_instance
+
     # Initialize lock on first use
     if _db_lock is None:
         import asyncio
@@ -140,8 +171,9 @@ async def close_db():
 
     Example:
         # On FastAPI shutdown
-        @app.on_event("shutdown")
-        async def shutdown():
+        @asynccontextmanager
+        async def lifespan(app):
+            yield
             await close_db()
     """
     global _db_instance
@@ -19,7 +19,7 @@ Design Philosophy:
 
 import asyncio
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Callable, Awaitable, TYPE_CHECKING
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable, TYPE_CHECKING
 from datetime import datetime
 from uuid import UUID
 import os
@@ -63,6 +63,71 @@ logger = get_logger(__name__)
 __all__ = ['AgentOrchestrator', 'SessionInfo', 'SessionStatus', 'SessionType']
 
 
+def _probe_env_files(project_path: Path) -> Tuple[bool, bool, bool]:
+    """
+    Check a project's environment configuration files.
+
+    Blocking filesystem access; call via asyncio.to_thread().
+
+    Returns:
+        (has_env_file, has_env_example, has_env_variables)
+    """
+    env_file = project_path / ".env"
+    env_example = project_path / ".env.example"
+    has_env_file = env_file.exists()
+    has_env_example = env_example.exists()
+
+    # Check if .env.example actually has variables (not just empty file)
+    has_env_variables = False
+    if has_env_example:
+        try:
+            content = env_example.read_text()
+            # Count non-empty, non-comment lines
+            lines = [line.strip() for line in content.splitlines()]
+            var_lines = [line for line in lines if line and not line.startswith('#')]
+            has_env_variables = len(var_lines) > 0
+        except Exception:
+            # If we can't read the file, assume it has variables
+            has_env_variables = True
+
+    return has_env_file, has_env_example, has_env_variables
+
+
+def _build_project_info(
+    project: Dict[str, Any],
+    project_path: Path,
+    progress: Dict[str, Any],
+    next_task: Optional[Dict[str, Any]],
+    active_session: Optional[Dict[str, Any]],
+    env_status: Tuple[bool, bool, bool],
+) -> Dict[str, Any]:
+    """Assemble the project info dict returned by get_project_info()/list_projects()."""
+    has_env_file, has_env_example, has_env_variables = env_status
+
+    # Determine if initialization is complete (Session 1 has created epics/tasks)
+    is_initialized = progress.get("total_epics", 0) > 0
+
+    # Determine if env configuration is needed
+    # Only flag if .env.example exists AND has actual variables
+    needs_env_config = (
+        is_initialized and
+        has_env_variables and
+        not project.get('env_configured', False)
+    )
+
+    return {
+        **project,
+        "local_path": str(project_path),
+        "is_initialized": is_initialized,
+        "progress": progress,
+        "next_task": next_task,
+        "active_sessions": [active_session] if active_session else [],
+        "has_env_file": has_env_file,
+        "has_env_example": has_env_example,
+        "needs_env_config": needs_env_config,
+    }
+
+
 class AgentOrchestrator:
     """
     Orchestrates autonomous agent sessions using PostgreSQL.
@@ -83,6 +148,7 @@ class AgentOrchestrator:
         self.verbose = verbose
         self.event_callback = event_callback
         self.config = Config.load_default()
+        self.generations_dir = Path(self.config.project.default_generations_dir)
 
         # Quality system integration
         self.quality = QualityIntegration(self.config, event_callback)
@@ -162,8 +228,7 @@ class AgentOrchestrator:
                     )
 
             # Create project directory in generations
-            generations_dir = Path(self.config.project.default_generations_dir)
-            project_path = generations_dir / project_name
+            project_path = self.generations_dir / project_name
             project_path.mkdir(parents=True, exist_ok=True)
 
             # Copy spec files to project directory if source provided
@@ -245,59 +310,18 @@ class AgentOrchestrator:
             if not project:
                 raise ValueError(f"Project not found: {project_id}")
 
-            # Compute local_path from project name
-            generations_dir = Path(self.config.project.default_generations_dir)
-            project_path = generations_dir / project['name']
-            project['local_path'] = str(project_path)
-
-            # Get progress statistics
-            progress = await db.get_progress(project_id)
-            next_task = await db.get_next_task(project_id)
+            project_path = self.generations_dir / project['name']
 
-            # Check for active sessions
-            active_session = await db.get_active_session(project_id)
-            active_sessions = [active_session] if active_session else []
-
-            # Check environment configuration
-            env_file = project_path / ".env" if project_path else None
-            env_example = project_path / ".env.example" if project_path else None
-            has_env_file = env_file and env_file.exists()
-            has_env_example = env_example and env_example.exists()
-
-            # Check if .env.example actually has variables (not just empty file)
-            has_env_variables = False
-            if has_env_example and env_example:
-                try:
-                    content = env_example.read_text()
-                    # Count non-empty, non-comment lines
-                    lines = [line.strip() for line in content.splitlines()]
-                    var_lines = [line for line in lines if line and not line.startswith('#')]
-                    has_env_variables = len(var_lines) > 0
-                except Exception:
-                    # If we can't read the file, assume it has variables
-                    has_env_variables = True
-
-            # Determine if initialization is complete (Session 1 has created epics/tasks)
-            is_initialized = progress.get("total_epics", 0) > 0
-
-            # Determine if env configuration is needed
-            # Only flag if .env.example exists AND has actual variables
-            needs_env_config = (
-                is_initialized and
-                has_env_variables and
-                not project.get('env_configured', False)
+            # Independent lookups; each acquires its own pooled connection, so
+            # they run concurrently alongside the env-file probe
+            progress, next_task, active_session, env_status = await asyncio.gather(
+                db.get_progress(project_id),
+                db.get_next_task(project_id),
+                db.get_active_session(project_id),
+                asyncio.to_thread(_probe_env_files, project_path),
             )
 
-            return {
-                **project,
-                "is_initialized": is_initialized,
-                "progress": progress,
-                "next_task": next_task,
-                "active_sessions": active_sessions,
-                "has_env_file": has_env_file,
-                "has_env_example": has_env_example,
-                "needs_env_config": needs_env_config,
-            }
+        return _build_project_info(project, project_path, progress, next_task, active_session, env_status)
 
     async def get_project_by_name(self, project_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -326,19 +350,26 @@ class AgentOrchestrator:
             List of project info dicts
         """
         async with DatabaseManager() as db:
-            projects = await db.list_projects(user_id=user_id)
+            # Progress, next task and active session for every project in a
+            # fixed number of queries rather than several per project
+            projects = await db.list_projects_with_progress(user_id=user_id)
 
-            # Enrich with progress info
-            enriched = []
-            for project in projects:
-                try:
-                    info = await self.get_project_info(project['id'])
-                    enriched.append(info)
-                except Exception as e:
-                    logger.warning(f"Could not get info for project {project['name']}: {e}")
-                    enriched.append(project)
+        project_paths = [self.generations_dir / project['name'] for project in projects]
+        env_statuses = await asyncio.gather(
+            *(asyncio.to_thread(_probe_env_files, path) for path in project_paths)
+        )
 
-            return enriched
+        return [
+            _build_project_info(
+                project,
+                project_path,
+                project.pop('progress'),
+                project.pop('next_task'),
+                project.pop('active_session'),
+                env_status,
+            )
+            for project, project_path, env_status in zip(projects, project_paths, env_statuses)
+        ]
 
     # =========================================================================
     # Session Operations
@@ -637,8 +668,7 @@ class AgentOrchestrator:
             # Ensure project path is valid and exists
             if not local_path or local_path == '':
                 # Create project directory
-                generations_dir = Path(self.config.project.default_generations_dir)
-                project_path = generations_dir / project_name
+                project_path = self.generations_dir / project_name
                 project_path.mkdir(parents=True, exist_ok=True)
 
                 # Update project with local path
@@ -1140,8 +1170,7 @@ class AgentOrchestrator:
 
             # Get project path
             project_name = project['name']
-            generations_dir = Path(self.config.project.default_generations_dir)
-            project_path = generations_dir / project_name
+            project_path = self.generations_dir / project_name
 
             # Delete from database first (this will cascade to all related tables)
             await db.delete_project(project_id)
@@ -194,7 +194,8 @@ class ProjectResetter:
         """
         try:
             async with DatabaseManager() as db:
-                async with db.acquire() as conn:
+                # One transaction: the reset is all-or-nothing and commits once
+                async with db.transaction() as conn:
                     # Reset tasks
                     await conn.execute(
                         """
@@ -23,7 +23,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import AsyncGenerator, Dict, List, Optional, Any
 
-from dotenv import load_dotenv
+from core.config import load_agent_env
 from core.context_strategy import analyze_context_strategy
 
 logger = logging.getLogger(__name__)
@@ -723,9 +723,7 @@ async def generate_spec_stream(
     from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 
     # Ensure authentication is configured
-    agent_root = Path(__file__).parent.parent
-    agent_env_file = agent_root / ".env"
-    load_dotenv(dotenv_path=agent_env_file)
+    load_agent_env()
 
     # CRITICAL: Remove any leaked ANTHROPIC_API_KEY first
     os.environ.pop("ANTHROPIC_API_KEY", None)
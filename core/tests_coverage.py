@@ -88,32 +88,12 @@ async def analyze_test_coverage(db, project_id: UUID) -> Dict[str, Any]:
         }
     """
     async with db.acquire() as conn:
-        # Get all epics
+        # Get epic names
         epic_rows = await conn.fetch(
-            "SELECT * FROM epics WHERE project_id = $1 ORDER BY id",
+            "SELECT id, name FROM epics WHERE project_id = $1 ORDER BY id",
             project_id
         )
-        epics = {row['id']: dict(row) for row in epic_rows}
-
-        # Get all tasks
-        task_rows = await conn.fetch(
-            "SELECT * FROM tasks WHERE project_id = $1 ORDER BY epic_id, id",
-            project_id
-        )
-        tasks = [dict(row) for row in task_rows]
-
-        # Get all tests
-        test_rows = await conn.fetch(
-            "SELECT * FROM tests WHERE project_id = $1 ORDER BY task_id",
-            project_id
-        )
-        tests = [dict(row) for row in test_rows]
-
-        # Build map of task_id -> test count
-        task_test_counts = {}
-        for test in tests:
-            task_id = test['task_id']
-            task_test_counts[task_id] = task_test_counts.get(task_id, 0) + 1
+        epics = {row['id']: row['name'] for row in epic_rows}
 
         # Analyze by epic
         epic_stats = defaultdict(lambda: {
@@ -128,29 +108,58 @@ async def analyze_test_coverage(db, project_id: UUID) -> Dict[str, Any]:
             'tasks_1_test': [],
             'tasks_2plus_tests': []
         })
-
-        for task in tasks:
-            epic_id = task['epic_id']
-            test_count = task_test_counts.get(task['id'], 0)
-
-            stats = epic_stats[epic_id]
-            stats['epic_id'] = epic_id
-            stats['epic_name'] = epics[epic_id]['name']
-            stats['total_tasks'] += 1
-            stats['total_tests'] += test_count
-
-            if test_count > 0:
-                stats['tasks_with_tests'] += 1
-            else:
-                stats['tasks_without_tests'] += 1
-
-            # Track by test count
-            if test_count == 0:
-                stats['tasks_0_tests'].append(task)
-            elif test_count == 1:
-                stats['tasks_1_test'].append(task)
-            else:
-                stats['tasks_2plus_tests'].append(task)
+        total_tasks = 0
+        total_tests = 0
+        tasks_with_tests = 0
+
+        # Stream tasks with their test counts (tests are counted in the
+        # database rather than shipping every test row here); only the
+        # cursor's prefetch window of records is held at a time
+        async with conn.transaction():
+            async for row in conn.cursor(
+                """
+                SELECT
+                    t.id, t.epic_id, t.description, t.action, t.priority, t.done,
+                    t.created_at, t.completed_at, t.session_id, t.session_notes,
+                    COALESCE(tc.test_count, 0) AS test_count
+                FROM tasks t
+                LEFT JOIN (
+                    SELECT task_id, COUNT(*) AS test_count
+                    FROM tests
+                    WHERE project_id = $1
+                    GROUP BY task_id
+                ) tc ON tc.task_id = t.id
+                WHERE t.project_id = $1
+                ORDER BY t.epic_id, t.id
+                """,
+                project_id,
+                prefetch=512
+            ):
+                task = dict(row)
+                test_count = task.pop('test_count')
+                epic_id = task['epic_id']
+
+                stats = epic_stats[epic_id]
+                stats['epic_id'] = epic_id
+                stats['epic_name'] = epics[epic_id]
+                stats['total_tasks'] += 1
+                stats['total_tests'] += test_count
+                total_tasks += 1
+                total_tests += test_count
+
+                if test_count > 0:
+                    stats['tasks_with_tests'] += 1
+                    tasks_with_tests += 1
+                else:
+                    stats['tasks_without_tests'] += 1
+
+                # Track by test count
+                if test_count == 0:
+                    stats['tasks_0_tests'].append(task)
+                elif test_count == 1:
+                    stats['tasks_1_test'].append(task)
+                else:
+                    stats['tasks_2plus_tests'].append(task)
 
         # Calculate coverage percentages
         for stats in epic_stats.values():
@@ -158,15 +167,14 @@ async def analyze_test_coverage(db, project_id: UUID) -> Dict[str, Any]:
                 stats['coverage_percentage'] = (stats['tasks_with_tests'] / stats['total_tasks']) * 100
 
         # Overall statistics
-        tasks_with_tests = sum(1 for t in tasks if task_test_counts.get(t['id'], 0) > 0)
-        tasks_without_tests = len(tasks) - tasks_with_tests
-        avg_tests_per_task = len(tests) / len(tasks) if len(tasks) > 0 else 0
-        coverage_percentage = (tasks_with_tests / len(tasks) * 100) if len(tasks) > 0 else 0
+        tasks_without_tests = total_tasks - tasks_with_tests
+        avg_tests_per_task = total_tests / total_tasks if total_tasks > 0 else 0
+        coverage_percentage = (tasks_with_tests / total_tasks * 100) if total_tasks > 0 else 0
 
         overall = {
             'total_epics': len(epics),
-            'total_tasks': len(tasks),
-            'total_tests': len(tests),
+            'total_tasks': total_tasks,
+            'total_tests': total_tests,
             'tasks_with_tests': tasks_with_tests,
             'tasks_without_tests': tasks_without_tests,
             'avg_tests_per_task': round(avg_tests_per_task, 2),
@@ -197,8 +205,8 @@ async def analyze_test_coverage(db, project_id: UUID) -> Dict[str, Any]:
             warnings.append(f"⚠️ Overall test coverage is low ({coverage_percentage:.0f}%). Consider adding more tests.")
         if len(poor_coverage_epics) > 0:
             warnings.append(f"⚠️ {len(poor_coverage_epics)} epic(s) have poor test coverage (>50% tasks without tests).")
-        if tasks_without_tests > len(tasks) * 0.3:
-            warnings.append(f"⚠️ {tasks_without_tests} tasks ({tasks_without_tests/len(tasks)*100:.0f}%) have no tests.")
+        if tasks_without_tests > total_tasks * 0.3:
+            warnings.append(f"⚠️ {tasks_without_tests} tasks ({tasks_without_tests/total_tasks*100:.0f}%) have no tests.")
 
         # Convert epic_stats to list and sort by epic_id
         by_epic = sorted(epic_stats.values(), key=lambda x: x['epic_id'])
@@ -777,7 +777,8 @@ class PromptImprovementAnalyzer:
             # Determine correct prompt file based on sandbox_type
             prompt_file = f'coding_prompt_{sandbox_type}.md'
 
-            # Store each proposal
+            # Store all proposals with one prepared statement
+            proposal_rows = []
             for proposal in proposals:
                 # Use AI-generated diff's original text if available
                 # Otherwise fallback to current_text from review
@@ -786,7 +787,21 @@ class PromptImprovementAnalyzer:
                 # Store diff metadata in the metadata JSONB field
                 diff_metadata = proposal.get('diff_metadata', {})
 
-                await conn.execute(
+                proposal_rows.append((
+                    analysis_id,
+                    prompt_file,  # coding_prompt_docker.md or coding_prompt_local.md
+                    proposal['theme'],
+                    original_text,  # AI-identified section from actual prompt file
+                    proposal['proposed_text'],  # AI-generated specific changes
+                    'modification',
+                    f"{proposal['title']} - {proposal['problem'][:200]}",
+                    json.dumps(proposal['evidence'], default=str),
+                    proposal['confidence_level'],
+                    json.dumps(diff_metadata)  # Store diff metadata (all_changes, summary, etc.)
+                ))
+
+            if proposal_rows:
+                await conn.executemany(
                     """
                     INSERT INTO prompt_proposals (
                         analysis_id,
@@ -803,16 +818,7 @@ class PromptImprovementAnalyzer:
                     )
                     VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, 'proposed', $10)
                     """,
-                    analysis_id,
-                    prompt_file,  # coding_prompt_docker.md or coding_prompt_local.md
-                    proposal['theme'],
-                    original_text,  # AI-identified section from actual prompt file
-                    proposal['proposed_text'],  # AI-generated specific changes
-                    'modification',
-                    f"{proposal['title']} - {proposal['problem'][:200]}",
-                    json.dumps(proposal['evidence'], default=str),
-                    proposal['confidence_level'],
-                    json.dumps(diff_metadata)  # Store diff metadata (all_changes, summary, etc.)
+                    proposal_rows
                 )
 
 
@@ -441,13 +441,7 @@ async def run_deep_review(
             project_id = session['project_id']
 
             session_dict = dict(session)
-            # Parse metrics JSONB field (asyncpg returns it as a string)
-            if 'metrics' in session_dict and isinstance(session_dict['metrics'], str):
-                try:
-                    session_dict['metrics'] = json.loads(session_dict['metrics'])
-                except (json.JSONDecodeError, TypeError):
-                    session_dict['metrics'] = {}
-            session_metrics = session_dict.get('metrics', {})
+            session_metrics = session_dict.get('metrics') or {}
 
             # Calculate error rate from database metrics and add to session_metrics
             error_rate = session_metrics.get('errors_count', 0) / session_metrics.get('tool_calls_count', 0) if session_metrics.get('tool_calls_count', 0) > 0 else 0
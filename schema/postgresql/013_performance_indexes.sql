@@ -0,0 +1,13 @@
+-- Performance Indexes for Hot API Queries
+-- ============================================
+-- Indexes backing filters used by frequently polled API endpoints.
+-- Safe to re-run: every statement uses IF NOT EXISTS.
+
+-- Task list filtered by completion state (GET /api/projects/{id}/tasks?status=...)
+CREATE INDEX IF NOT EXISTS idx_tasks_project_done ON tasks(project_id, done);
+
+-- Running-session lookup per project (get_active_session, reset/cancel checks).
+-- Partial, so it only ever holds the handful of running sessions and already
+-- matches the ORDER BY created_at DESC LIMIT 1.
+CREATE INDEX IF NOT EXISTS idx_sessions_project_running
+    ON sessions (project_id, created_at DESC) WHERE status = 'running';
@@ -0,0 +1,16 @@
+-- Prompt Improvement Indexes
+-- ============================================
+-- Composite indexes for the prompt improvement API filters. Each replaces a
+-- single-column index that is a prefix of it.
+-- Safe to re-run: every statement uses IF [NOT] EXISTS.
+
+-- Proposals for an analysis, optionally by status, highest confidence first
+-- (GET /api/prompt-improvements/{analysis_id}/proposals)
+CREATE INDEX IF NOT EXISTS idx_proposals_analysis_status
+    ON prompt_proposals (analysis_id, status, confidence_level DESC, created_at DESC);
+DROP INDEX IF EXISTS idx_proposals_analysis;
+
+-- Analyses filtered by status, newest first (GET /api/prompt-improvements?status=...)
+CREATE INDEX IF NOT EXISTS idx_prompt_analyses_status_created
+    ON prompt_improvement_analyses (status, created_at DESC);
+DROP INDEX IF EXISTS idx_prompt_analyses_status;
@@ -173,6 +173,7 @@ CREATE INDEX idx_sessions_type ON sessions(type);
 CREATE INDEX idx_sessions_created_at ON sessions(created_at DESC);
 CREATE INDEX idx_sessions_metrics ON sessions USING GIN (metrics);
 CREATE INDEX idx_sessions_stale_detection ON sessions (status, last_heartbeat) WHERE status = 'running';
+CREATE INDEX idx_sessions_project_running ON sessions (project_id, created_at DESC) WHERE status = 'running';
 
 COMMENT ON COLUMN sessions.last_heartbeat IS 'Timestamp of last heartbeat update during session execution. Used to detect truly stale sessions vs. long-running active sessions.';
 
@@ -232,6 +233,7 @@ CREATE INDEX idx_tasks_project_id ON tasks(project_id);
 CREATE INDEX idx_tasks_done ON tasks(done);
 CREATE INDEX idx_tasks_priority ON tasks(priority);
 CREATE INDEX idx_tasks_session_id ON tasks(session_id);
+CREATE INDEX idx_tasks_project_done ON tasks(project_id, done);
 
 -- Tests Table - Verification steps for tasks
 CREATE TABLE tests (
@@ -384,7 +386,7 @@ CREATE TABLE prompt_improvement_analyses (
     CONSTRAINT sandbox_type_valid CHECK (sandbox_type IN ('docker', 'local'))
 );
 
-CREATE INDEX idx_prompt_analyses_status ON prompt_improvement_analyses(status);
+CREATE INDEX idx_prompt_analyses_status_created ON prompt_improvement_analyses(status, created_at DESC);
 CREATE INDEX idx_prompt_analyses_created ON prompt_improvement_analyses(created_at DESC);
 CREATE INDEX idx_prompt_analyses_sandbox ON prompt_improvement_analyses(sandbox_type);
 
@@ -430,7 +432,7 @@ CREATE TABLE prompt_proposals (
     CONSTRAINT confidence_valid CHECK (confidence_level BETWEEN 1 AND 10)
 );
 
-CREATE INDEX idx_proposals_analysis ON prompt_proposals(analysis_id);
+CREATE INDEX idx_proposals_analysis_status ON prompt_proposals(analysis_id, status, confidence_level DESC, created_at DESC);
 CREATE INDEX idx_proposals_status ON prompt_proposals(status);
 CREATE INDEX idx_proposals_file ON prompt_proposals(prompt_file);
 
@@ -24,7 +24,6 @@ from datetime import datetime, timedelta
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.orchestrator import AgentOrchestrator
 from core.database_connection import DatabaseManager
 
 
@@ -59,6 +58,9 @@ async def cleanup_stale_sessions(project_name: str = None, force: bool = False):
         project_name: Optional project name to filter by
         force: If True, cleanup all running sessions regardless of time
     """
+    # Imported here so --help doesn't pay for loading the agent SDK
+    from core.orchestrator import AgentOrchestrator
+
     orchestrator = AgentOrchestrator()
 
     # List current running sessions
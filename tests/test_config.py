@@ -0,0 +1,130 @@
+"""
+Tests for Configuration Loading
+===============================
+
+Test suite for YAML config loading including:
+- Parsed-file cache reuse
+- Cache invalidation when the file changes
+- Default config discovery order
+- Agent .env loading
+"""
+
+import os
+
+import pytest
+
+import core.config as config_module
+from core.config import Config
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    config_module._config_cache.clear()
+    yield
+    config_module._config_cache.clear()
+
+
+class TestConfigFileCache:
+    """Test parsed config files are cached by file signature."""
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path, monkeypatch):
+        """Test a second load of an unchanged file skips the YAML parse."""
+        path = tmp_path / ".yokeflow.yaml"
+        path.write_text("timing:\n  auto_continue_delay: 7\n")
+
+        calls = []
+        original = Config._parse_file.__func__
+        monkeypatch.setattr(
+            Config, "_parse_file",
+            classmethod(lambda cls, p: calls.append(p) or original(cls, p)),
+        )
+
+        first = Config.load_from_file(path)
+        second = Config.load_from_file(path)
+
+        assert first.timing.auto_continue_delay == second.timing.auto_continue_delay == 7
+        assert len(calls) == 1
+
+    def test_returned_config_is_a_copy(self, tmp_path):
+        """Test mutating a loaded config does not leak into later loads."""
+        path = tmp_path / ".yokeflow.yaml"
+        path.write_text("project:\n  max_iterations: 2\n")
+
+        Config.load_from_file(path).project.max_iterations = 99
+
+        assert Config.load_from_file(path).project.max_iterations == 2
+
+    def test_edit_invalidates_cache(self, tmp_path):
+        """Test a rewritten file is reparsed."""
+        path = tmp_path / ".yokeflow.yaml"
+        path.write_text("timing:\n  auto_continue_delay: 1\n")
+        Config.load_from_file(path)
+
+        path.write_text("timing:\n  auto_continue_delay: 10\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert Config.load_from_file(path).timing.auto_continue_delay == 10
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test a missing file still raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="Config file not found"):
+            Config.load_from_file(tmp_path / "missing.yaml")
+
+
+class TestLoadDefault:
+    """Test config discovery in the current and home directories."""
+
+    def test_current_directory_takes_precedence(self, tmp_path, monkeypatch):
+        """Test ./.yokeflow.yaml wins over ~/.yokeflow.yaml."""
+        home = tmp_path / "home"
+        work = tmp_path / "work"
+        home.mkdir()
+        work.mkdir()
+        (home / ".yokeflow.yaml").write_text("timing:\n  web_ui_port: 4000\n")
+        (work / ".yokeflow.yaml").write_text("timing:\n  web_ui_port: 5000\n")
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.chdir(work)
+
+        assert Config.load_default().timing.web_ui_port == 5000
+
+    def test_falls_back_to_home_then_defaults(self, tmp_path, monkeypatch):
+        """Test the home file is used when the CWD has none, then defaults."""
+        home = tmp_path / "home"
+        home.mkdir()
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.chdir(tmp_path)
+
+        assert Config.load_default().timing.web_ui_port == 3000
+
+        (home / ".yokeflow.yaml").write_text("timing:\n  web_ui_port: 4000\n")
+        assert Config.load_default().timing.web_ui_port == 4000
+
+
+class TestAgentEnv:
+    """Test the agent .env is applied without overriding the environment."""
+
+    def test_existing_values_win(self, tmp_path, monkeypatch):
+        """Test variables already in the environment are left alone."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("YOKEFLOW_TEST_SET=from_file\nYOKEFLOW_TEST_NEW=from_file\n")
+        monkeypatch.setattr(config_module, "_agent_env_file", env_file)
+        monkeypatch.setattr(config_module, "_agent_env_cache", None)
+        monkeypatch.setenv("YOKEFLOW_TEST_SET", "from_env")
+        # set first so monkeypatch restores (removes) the variable afterwards
+        monkeypatch.setenv("YOKEFLOW_TEST_NEW", "")
+        monkeypatch.delenv("YOKEFLOW_TEST_NEW")
+
+        config_module.load_agent_env()
+
+        assert os.environ["YOKEFLOW_TEST_SET"] == "from_env"
+        assert os.environ["YOKEFLOW_TEST_NEW"] == "from_file"
+
+    def test_missing_file_is_noop(self, tmp_path, monkeypatch):
+        """Test a missing .env leaves the environment untouched."""
+        monkeypatch.setattr(config_module, "_agent_env_file", tmp_path / ".env")
+        monkeypatch.setattr(config_module, "_agent_env_cache", None)
+
+        config_module.load_agent_env()
+
+        assert config_module._agent_env_cache is None
@@ -0,0 +1,238 @@
+"""
+Tests for Database Connection Management
+=========================================
+
+Test suite for the shared connection pool helpers including:
+- Statement cache configuration (PgBouncer compatibility)
+- Singleton pool reuse in get_db()
+- Project settings TTL cache
+- JSONB codec registration
+- Bounded pool acquire wait
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import core.database_connection as database_connection
+from core.database_connection import (
+    DEFAULT_STATEMENT_CACHE_SIZE,
+    get_db,
+    get_statement_cache_size,
+)
+
+
+class TestStatementCacheSize:
+    """Test DATABASE_STATEMENT_CACHE_SIZE parsing."""
+
+    def test_default_when_unset(self, monkeypatch):
+        """Test default cache size is used when not configured."""
+        monkeypatch.delenv("DATABASE_STATEMENT_CACHE_SIZE", raising=False)
+        assert get_statement_cache_size() == DEFAULT_STATEMENT_CACHE_SIZE == 1024
+
+    def test_disabled_for_pgbouncer(self, monkeypatch):
+        """Test cache can be disabled for transaction pooling."""
+        monkeypatch.setenv("DATABASE_STATEMENT_CACHE_SIZE", "0")
+        assert get_statement_cache_size() == 0
+
+    def test_invalid_value_falls_back(self, monkeypatch):
+        """Test invalid values fall back to the default."""
+        monkeypatch.setenv("DATABASE_STATEMENT_CACHE_SIZE", "lots")
+        assert get_statement_cache_size() == DEFAULT_STATEMENT_CACHE_SIZE
+
+
+class TestSharedPool:
+    """Test the process-wide pool singleton."""
+
+    @pytest.mark.asyncio
+    async def test_get_db_reuses_existing_pool(self, monkeypatch):
+        """Test get_db returns the existing instance without reconnecting."""
+        existing = MagicMock()
+        existing.pool = MagicMock()
+        monkeypatch.setattr(database_connection, "_db_instance", existing)
+
+        with patch.object(database_connection, "create_database") as create:
+            db = await get_db()
+
+        assert db is existing
+        create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_db_creates_pool_once(self, monkeypatch):
+        """Test get_db connects a new instance when none exists."""
+        created = MagicMock()
+        created.pool = None
+
+        async def _connect():
+            created.pool = MagicMock()
+
+        created.connect = AsyncMock(side_effect=_connect)
+        monkeypatch.setattr(database_connection, "_db_instance", None)
+        monkeypatch.setattr(database_connection, "_db_lock", None)
+
+        with patch.object(database_connection, "create_database", return_value=created) as create:
+            first = await get_db("postgresql://localhost/test")
+            second = await get_db("postgresql://localhost/test")
+
+        assert first is second is created
+        create.assert_called_once()
+        created.connect.assert_awaited_once()
+
+
+class TestPoolStatementWarmup:
+    """Test hot statements are prepared on new pooled connections."""
+
+    @pytest.mark.asyncio
+    async def test_pool_init_warms_statement_cache(self, monkeypatch):
+        """Test connect() registers the warm-up hook when caching is enabled."""
+        from core.database import TaskDatabase, _init_connection
+
+        monkeypatch.delenv("DATABASE_STATEMENT_CACHE_SIZE", raising=False)
+        with patch("core.database.asyncpg.create_pool", new=AsyncMock()) as create_pool:
+            await TaskDatabase("postgresql://localhost/test").connect()
+
+        assert create_pool.call_args.kwargs["init"] is _init_connection
+
+    @pytest.mark.asyncio
+    async def test_pool_init_skipped_without_cache(self, monkeypatch):
+        """Test no warm-up runs when the statement cache is disabled."""
+        from core.database import TaskDatabase, _register_jsonb_codec
+
+        monkeypatch.setenv("DATABASE_STATEMENT_CACHE_SIZE", "0")
+        with patch("core.database.asyncpg.create_pool", new=AsyncMock()) as create_pool:
+            await TaskDatabase("postgresql://localhost/test").connect()
+
+        # Only the JSONB codec is registered
+        assert create_pool.call_args.kwargs["init"] is _register_jsonb_codec
+
+    @pytest.mark.asyncio
+    async def test_warm_statement_cache_runs_project_lookup(self):
+        """Test warm-up executes the exact get_project SQL text."""
+        from core.database import GET_PROJECT_SQL, _warm_statement_cache
+
+        conn = MagicMock()
+        conn.fetchrow = AsyncMock(return_value=None)
+        conn.fetchval = AsyncMock(return_value=None)
+        await _warm_statement_cache(conn)
+
+        conn.fetchrow.assert_awaited_once_with(GET_PROJECT_SQL, None)
+
+    @pytest.mark.asyncio
+    async def test_warm_statement_cache_runs_session_listing(self):
+        """Test warm-up executes the exact session listing SQL text."""
+        from core.database import SESSION_HISTORY_JSON_SQL, _warm_statement_cache
+
+        conn = MagicMock()
+        conn.fetchrow = AsyncMock(return_value=None)
+        conn.fetchval = AsyncMock(return_value="[]")
+        await _warm_statement_cache(conn)
+
+        conn.fetchval.assert_awaited_once_with(SESSION_HISTORY_JSON_SQL, None, 0)
+
+
+class TestJsonbCodec:
+    """Test JSONB values are decoded and encoded by the pool codec."""
+
+    @pytest.mark.asyncio
+    async def test_codec_registered_for_jsonb(self):
+        """Test the codec is registered for JSONB in binary format."""
+        from core.database import _decode_jsonb, _register_jsonb_codec
+
+        conn = MagicMock()
+        conn.set_type_codec = AsyncMock()
+        await _register_jsonb_codec(conn)
+
+        args, kwargs = conn.set_type_codec.call_args
+        assert args == ("jsonb",)
+        assert kwargs["decoder"] is _decode_jsonb
+        assert kwargs["schema"] == "pg_catalog"
+        assert kwargs["format"] == "binary"
+
+    def test_encoder_accepts_objects_and_json_text(self):
+        """Test both Python objects and pre-serialized JSON text are accepted."""
+        from uuid import UUID
+        from core.database import _encode_jsonb
+
+        assert _encode_jsonb({"a": [1, 2]}) == b'\x01{"a":[1,2]}'
+        assert _encode_jsonb('{"a": 1}') == b'\x01{"a": 1}'
+        uid = UUID("12345678-1234-5678-1234-567812345678")
+        assert _encode_jsonb({"id": uid}) == b'\x01{"id":"12345678-1234-5678-1234-567812345678"}'
+
+    def test_decoder_skips_version_byte(self):
+        """Test binary JSONB values decode to Python objects."""
+        from core.database import _decode_jsonb, _encode_jsonb
+
+        assert _decode_jsonb(_encode_jsonb({"metrics": {"cost_usd": 0.5}})) == {"metrics": {"cost_usd": 0.5}}
+
+
+class TestProjectSettingsCache:
+    """Test project settings are served from the in-process TTL cache."""
+
+    @staticmethod
+    def _db_with_conn(conn):
+        from contextlib import asynccontextmanager
+        from core.database import TaskDatabase
+
+        db = TaskDatabase("postgresql://localhost/test")
+
+        @asynccontextmanager
+        async def _acquire():
+            yield conn
+
+        db.acquire = _acquire
+        return db
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_hit_cache(self):
+        """Test a second read within the TTL skips the database."""
+        from uuid import uuid4
+
+        conn = MagicMock()
+        conn.fetchrow = AsyncMock(return_value={"metadata": {"settings": {"sandbox_type": "local"}}})
+        db = self._db_with_conn(conn)
+        project_id = uuid4()
+
+        first = await db.get_project_settings(project_id)
+        first["sandbox_type"] = "mutated"
+        second = await db.get_project_settings(project_id)
+
+        assert second["sandbox_type"] == "local"
+        conn.fetchrow.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_cache(self):
+        """Test writing settings forces the next read to reload."""
+        from uuid import uuid4
+
+        conn = MagicMock()
+        conn.fetchrow = AsyncMock(return_value={"metadata": {"settings": {}}})
+        conn.execute = AsyncMock()
+        db = self._db_with_conn(conn)
+        project_id = uuid4()
+
+        await db.get_project_settings(project_id)
+        await db.update_project_settings(project_id, {"max_iterations": 3})
+        await db.get_project_settings(project_id)
+
+        # initial read, read-modify-write, reload after invalidation
+        assert conn.fetchrow.await_count == 3
+
+
+class TestPoolAcquireTimeout:
+    """Test pooled connections are acquired with a bounded wait."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_passes_timeout(self):
+        """Test acquire() never waits on the pool without a timeout."""
+        from core.database import POOL_ACQUIRE_TIMEOUT_SECONDS, TaskDatabase
+
+        conn = MagicMock()
+        db = TaskDatabase("postgresql://localhost/test")
+        db.pool = MagicMock()
+        db.pool.acquire = AsyncMock(return_value=conn)
+        db.pool.release = AsyncMock()
+
+        async with db.acquire() as acquired:
+            assert acquired is conn
+
+        db.pool.acquire.assert_awaited_once_with(timeout=POOL_ACQUIRE_TIMEOUT_SECONDS)
+        db.pool.release.assert_awaited_once_with(conn)
@@ -0,0 +1,152 @@
+"""
+Tests for Prompt Improvement Routes
+===================================
+
+Test suite for the prompt improvement API including:
+- ETag / 304 revalidation of analysis listings
+- 202 Accepted when an analysis is started
+- Coercion of loosely typed proposal columns
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import api.prompt_improvements_routes as routes
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """Stub database returned by get_db() inside the routes."""
+    conn = MagicMock()
+    conn.fetchrow = AsyncMock(return_value={"name": "demo"})
+    conn.execute = AsyncMock()
+
+    stub = MagicMock()
+
+    @asynccontextmanager
+    async def _acquire():
+        yield conn
+
+    stub.acquire = _acquire
+    monkeypatch.setattr(routes, "get_db", AsyncMock(return_value=stub))
+    return stub
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(routes.router)
+    return TestClient(app)
+
+
+class TestConditionalResponses:
+    """Test read endpoints answer revalidation with 304."""
+
+    def test_list_analyses_revalidates_with_etag(self, db, client):
+        """Test a matching If-None-Match returns 304 with the same headers."""
+        db.list_prompt_analyses = AsyncMock(return_value=[{
+            "id": uuid4(),
+            "created_at": datetime(2025, 1, 1, 12, 0),
+            "completed_at": None,
+            "status": "running",
+            "sandbox_type": "docker",
+        }])
+
+        first = client.get("/api/prompt-improvements")
+        assert first.status_code == 200
+        assert first.json()[0]["status"] == "running"
+        etag = first.headers["ETag"]
+
+        second = client.get("/api/prompt-improvements", headers={"If-None-Match": etag})
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["ETag"] == etag
+        assert second.headers["Cache-Control"] == first.headers["Cache-Control"] == "private, no-cache"
+
+    def test_stale_etag_gets_full_body(self, db, client):
+        """Test a non-matching If-None-Match returns the listing."""
+        db.list_prompt_analyses = AsyncMock(return_value=[])
+
+        response = client.get("/api/prompt-improvements", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+
+    @pytest.mark.parametrize("header", ['W/{etag}', '"other", {etag}', '*'])
+    def test_weak_list_and_wildcard_match(self, db, client, header):
+        """Test weak, listed and wildcard If-None-Match values revalidate."""
+        db.list_prompt_analyses = AsyncMock(return_value=[])
+        etag = client.get("/api/prompt-improvements").headers["ETag"]
+
+        response = client.get(
+            "/api/prompt-improvements",
+            headers={"If-None-Match": header.format(etag=etag)},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+
+class TestTriggerAnalysis:
+    """Test starting an analysis."""
+
+    def test_started_analysis_returns_202(self, db, client, monkeypatch):
+        """Test the endpoint answers 202 Accepted and runs the analysis in the background."""
+        analyzer = MagicMock()
+        analyzer.analyze_project = AsyncMock(return_value={"status": "completed", "proposals": []})
+        monkeypatch.setattr(routes, "PromptImprovementAnalyzer", MagicMock(return_value=analyzer))
+
+        response = client.post(
+            "/api/prompt-improvements",
+            json={"project_ids": [str(uuid4())], "sandbox_type": "docker"},
+        )
+
+        assert response.status_code == 202
+        body = response.json()
+        assert body["success"] is True
+        assert body["status"] == "running"
+        analyzer.analyze_project.assert_awaited_once()
+
+    def test_invalid_project_id_returns_400(self, db, client):
+        """Test a malformed project id is rejected before any work starts."""
+        response = client.post("/api/prompt-improvements", json={"project_ids": ["not-a-uuid"]})
+
+        assert response.status_code == 400
+
+
+class TestProposalFromRow:
+    """Test proposal rows are coerced to the response schema."""
+
+    @staticmethod
+    def _row(**overrides):
+        row = {
+            "id": uuid4(),
+            "created_at": datetime(2025, 1, 1, 12, 0),
+            "prompt_file": "coding_prompt.md",
+            "change_type": "add",
+            "proposed_text": "text",
+            "rationale": "why",
+            "status": "proposed",
+        }
+        row.update(overrides)
+        return row
+
+    def test_non_dict_evidence_becomes_empty(self):
+        """Test list or scalar JSONB evidence does not leak into the response."""
+        assert routes._proposal_from_row(self._row(evidence=["a", "b"])).evidence == {}
+        assert routes._proposal_from_row(self._row(evidence="text")).evidence == {}
+        assert routes._proposal_from_row(self._row(evidence={"k": 1})).evidence == {"k": 1}
+
+    def test_confidence_level_is_an_int(self):
+        """Test numeric-like confidence values are coerced and junk falls back."""
+        assert routes._proposal_from_row(self._row(confidence_level="8")).confidence_level == 8
+        assert routes._proposal_from_row(self._row(confidence_level="high")).confidence_level == 5
+        assert routes._proposal_from_row(self._row()).confidence_level == 5
@@ -0,0 +1,76 @@
+"""
+Tests for Session Log Lookup
+============================
+
+Test suite for resolving session log files in the API including:
+- Prefix lookup through the per-directory index
+- Fallback scan when the index is stale
+- Expiry of the log list cache
+"""
+
+from uuid import uuid4
+
+import pytest
+
+import api.main as api_main
+from api.main import _resolve_session_log
+
+
+@pytest.fixture(autouse=True)
+def _clear_index():
+    api_main._session_log_index.clear()
+    yield
+    api_main._session_log_index.clear()
+
+
+class TestResolveSessionLog:
+    """Test session_NNN prefixes resolve to the right log file."""
+
+    def test_resolves_both_log_types(self, tmp_path):
+        """Test human and event logs are found for a session prefix."""
+        (tmp_path / "session_001_20250101.txt").write_text("human")
+        (tmp_path / "session_001_20250101.jsonl").write_text("{}")
+
+        assert _resolve_session_log(tmp_path, "session_001", "human").name == "session_001_20250101.txt"
+        assert _resolve_session_log(tmp_path, "session_001", "events").name == "session_001_20250101.jsonl"
+        assert _resolve_session_log(tmp_path, "session_002", "human") is None
+
+    def test_stale_index_falls_back_to_scan(self, tmp_path):
+        """Test a file created within the same mtime tick is still found."""
+        (tmp_path / "session_003_20250101.txt").write_text("human")
+        (tmp_path / "session_003_20250101.jsonl").write_text("{}")
+
+        # Simulate the index being built between the two creations within
+        # one timestamp tick: it matches the directory mtime but lacks the
+        # second file
+        index = api_main._get_session_log_index(tmp_path)
+        del index["003"]["events"]
+
+        assert _resolve_session_log(tmp_path, "session_003", "events").name == "session_003_20250101.jsonl"
+
+    def test_unknown_session_does_not_grow_index(self, tmp_path):
+        """Test a miss leaves the cached index untouched."""
+        (tmp_path / "session_001_20250101.txt").write_text("human")
+
+        assert _resolve_session_log(tmp_path, "session_009", "human") is None
+        assert list(api_main._get_session_log_index(tmp_path)) == ["001"]
+
+    def test_prefix_padding_must_match(self, tmp_path):
+        """Test session_1 does not resolve to a zero-padded session_001 file."""
+        (tmp_path / "session_001_20250101.txt").write_text("human")
+
+        assert _resolve_session_log(tmp_path, "session_1", "human") is None
+        assert _resolve_session_log(tmp_path, "session_001", "human") is not None
+
+
+class TestLogListCache:
+    """Test expired log list entries are evicted."""
+
+    def test_prune_drops_only_expired_entries(self, monkeypatch):
+        """Test pruning keeps live entries and removes expired ones."""
+        expired, live = uuid4(), uuid4()
+        monkeypatch.setattr(api_main, "_log_list_cache", {expired: (1.0, []), live: (10.0, [])})
+
+        api_main._prune_log_list_cache(5.0)
+
+        assert list(api_main._log_list_cache) == [live]
@@ -0,0 +1,108 @@
+"""
+Tests for WebSocket Broadcast Queues
+====================================
+
+Test suite for per-client outbound WebSocket delivery including:
+- Batching a burst of updates into one array frame
+- Plain object frames for lone non-progress messages
+- Dropping the oldest frame when a client queue is full
+- Registry cleanup after disconnect
+- Handshake and initial state sent through the client queue
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+import api.main as api_main
+from api.main import app, notify_project_update
+
+
+class TestProjectBroadcast:
+    """Test updates reach a connected client through its queue."""
+
+    def test_burst_arrives_as_array_frame(self):
+        """Test several queued updates are shipped in a single frame."""
+        project_id = str(uuid4())
+
+        async def burst():
+            for task_id in range(3):
+                await notify_project_update(project_id, {"type": "task_updated", "task_id": task_id})
+
+        client = TestClient(app)
+        with client.websocket_connect(f"/api/ws/{project_id}") as websocket:
+            assert websocket.receive_json()["type"] == "connected"
+            websocket.portal.call(burst)
+            frame = websocket.receive_json()
+
+        assert isinstance(frame, list)
+        assert [message["task_id"] for message in frame] == [0, 1, 2]
+
+    def test_lone_message_arrives_as_object(self):
+        """Test a single non-progress update is sent unwrapped."""
+        project_id = str(uuid4())
+
+        client = TestClient(app)
+        with client.websocket_connect(f"/api/ws/{project_id}") as websocket:
+            assert websocket.receive_json()["type"] == "connected"
+            websocket.portal.call(notify_project_update, project_id, {"type": "session_started"})
+            frame = websocket.receive_json()
+
+        assert frame == {"type": "session_started"}
+
+    def test_registries_empty_after_disconnect(self):
+        """Test the connection and its queue are forgotten on disconnect."""
+        project_id = str(uuid4())
+
+        client = TestClient(app)
+        with client.websocket_connect(f"/api/ws/{project_id}") as websocket:
+            websocket.receive_json()
+            assert project_id in api_main.active_connections
+            assert len(api_main.ws_client_queues) == 1
+
+        assert project_id not in api_main.active_connections
+        assert len(api_main.ws_client_queues) == 0
+
+
+    def test_initial_state_goes_through_queue(self, monkeypatch):
+        """Test the handshake and initial state arrive in order via the writer."""
+        project_id = str(uuid4())
+        db = MagicMock()
+        db.get_project = AsyncMock(return_value={"metadata": {"is_initialized": True}})
+        db.get_progress = AsyncMock(return_value={"total_tasks": 4})
+        monkeypatch.setattr(api_main, "get_db", AsyncMock(return_value=db))
+
+        client = TestClient(app)
+        with client.websocket_connect(f"/api/ws/{project_id}") as websocket:
+            websocket.send_text("get_initial_state")
+            connected = websocket.receive_json()
+            initial = websocket.receive_json()
+
+        assert connected["type"] == "connected"
+        assert initial == {"type": "initial_state", "progress": {"total_tasks": 4}, "is_initialized": True}
+
+
+class _FakeWebSocket:
+    """Hashable, weak-referenceable stand-in for a connected client."""
+
+
+class TestClientQueue:
+    """Test the bounded per-client queue."""
+
+    def test_full_queue_drops_oldest(self, monkeypatch):
+        """Test a slow client loses its oldest frames, not the newest."""
+        project_id = str(uuid4())
+        websocket = _FakeWebSocket()
+        queue = asyncio.Queue(maxsize=2)
+        monkeypatch.setitem(api_main.active_connections, project_id, {websocket})
+        api_main.ws_client_queues[websocket] = queue
+
+        try:
+            for frame in ("first", "second", "third"):
+                api_main._enqueue_to_project_connections(project_id, frame)
+        finally:
+            api_main.ws_client_queues.pop(websocket, None)
+
+        assert [queue.get_nowait(), queue.get_nowait()] == ["second", "third"]
@@ -70,10 +70,8 @@ export function SessionLogsViewer({ projectId }: SessionLogsViewerProps) {
         }
       });
 
-      // Convert to array and sort by session number descending (newest first)
-      const grouped = Array.from(sessionMap.values()).sort(
-        (a, b) => b.sessionNumber - a.sessionNumber
-      );
+      // The API lists logs newest session first, and the Map keeps that order
+      const grouped = Array.from(sessionMap.values());
       setGroupedSessions(grouped);
     } catch (err: any) {
       console.error('Failed to load logs list:', err);
@@ -363,10 +363,12 @@ class ApiClient {
     type: 'human' | 'events',
     filename: string
   ): Promise<string> {
-    const response = await this.client.get<{ content: string; filename: string }>(
-      `/api/projects/${projectId}/logs/${type}/${filename}`
+    // Stream the raw file rather than a JSON-wrapped copy of it
+    const response = await this.client.get<string>(
+      `/api/projects/${projectId}/logs/${type}/${filename}`,
+      { params: { stream: true }, responseType: 'text' }
     );
-    return response.data.content;
+    return response.data;
   }
 
   async getTestCoverage(projectId: string): Promise<any> {
@@ -83,157 +83,167 @@ export function useProjectWebSocket(
         console.log(`[WebSocket] Connected to project ${projectId}`);
         setConnected(true);
         setError(null);
+        // Initial progress is sent on request rather than on every connect
+        ws.send('get_initial_state');
       };
 
-      ws.onmessage = (event) => {
-        try {
-          const data: WebSocketMessage = JSON.parse(event.data);
-          console.log('[WebSocket] Message:', data.type);
-
-          switch (data.type) {
-            case 'initial_state':
-            case 'progress_update':
-              if (data.progress) {
-                setProgress(data.progress);
-              }
-              break;
-
-            case 'progress':
-              // Handle real-time progress events from agent
-              if (data.event) {
-                const event = data.event;
-
-                if (event.type === 'tool_use' && event.tool_name) {
-                  // Increment tool count
-                  setToolCount(prev => (prev || 0) + 1);
-
-                  // Optionally trigger callback if provided
-                  if (onToolUseRef.current) {
-                    // We don't have session_number in the event, so pass 0
-                    onToolUseRef.current(event.tool_name, (toolCount || 0) + 1, 0);
-                  }
-                } else if (event.type === 'tool_result') {
-                  // Tool result received - could update UI if needed
-                  console.log('[WebSocket] Tool result received:', event.tool_id);
+      const handleMessage = (data: WebSocketMessage) => {
+        console.log('[WebSocket] Message:', data.type);
+
+        switch (data.type) {
+          case 'initial_state':
+          case 'progress_update':
+            if (data.progress) {
+              setProgress(data.progress);
+            }
+            break;
+
+          case 'progress':
+            // Handle real-time progress events from agent
+            if (data.event) {
+              const event = data.event;
+
+              if (event.type === 'tool_use' && event.tool_name) {
+                // Increment tool count
+                setToolCount(prev => (prev || 0) + 1);
+
+                // Optionally trigger callback if provided
+                if (onToolUseRef.current) {
+                  // We don't have session_number in the event, so pass 0
+                  onToolUseRef.current(event.tool_name, (toolCount || 0) + 1, 0);
                 }
+              } else if (event.type === 'tool_result') {
+                // Tool result received - could update UI if needed
+                console.log('[WebSocket] Tool result received:', event.tool_id);
               }
-              break;
-
-            case 'session_started':
-              console.log(`[WebSocket] New session started:`, data.session);
-              // Reset real-time counters for new session
-              setToolCount(0);
-              setAssistantMessages([]);
-              // Trigger callback if provided
-              if (onSessionStartedRef.current && data.session) {
-                onSessionStartedRef.current(data.session);
+            }
+            break;
+
+          case 'session_started':
+            console.log(`[WebSocket] New session started:`, data.session);
+            // Reset real-time counters for new session
+            setToolCount(0);
+            setAssistantMessages([]);
+            // Trigger callback if provided
+            if (onSessionStartedRef.current && data.session) {
+              onSessionStartedRef.current(data.session);
+            }
+            break;
+
+          case 'session_complete':
+          case 'initialization_complete':  // Treat initialization_complete same as session_complete
+          case 'coding_sessions_complete':  // All coding sessions complete (stop-after-current)
+            console.log(`[WebSocket] Session completed:`, data.type);
+            // Clear real-time counters when session ends
+            setToolCount(null);
+            setAssistantMessages([]);
+            // Trigger callback if provided
+            if (onSessionCompleteRef.current) {
+              // For initialization_complete, extract session_id and status from session object
+              const sessionId = data.session_id || data.session?.session_id;
+              const status = data.status || data.session?.status || 'completed';
+              if (sessionId) {
+                onSessionCompleteRef.current(sessionId, status);
+              } else {
+                // No session_id, just trigger reload
+                onSessionCompleteRef.current('unknown', 'completed');
               }
-              break;
-
-            case 'session_complete':
-            case 'initialization_complete':  // Treat initialization_complete same as session_complete
-            case 'coding_sessions_complete':  // All coding sessions complete (stop-after-current)
-              console.log(`[WebSocket] Session completed:`, data.type);
-              // Clear real-time counters when session ends
-              setToolCount(null);
-              setAssistantMessages([]);
+            }
+            break;
+
+          case 'all_epics_complete':
+          case 'project_complete':
+            console.log(`[WebSocket] Project complete! All epics/tasks done.`);
+            // Clear real-time counters
+            setToolCount(null);
+            setAssistantMessages([]);
+            // Trigger session complete callback to reload page
+            if (onSessionCompleteRef.current) {
+              onSessionCompleteRef.current('final', 'completed');
+            }
+            break;
+
+          case 'session_error':
+            console.error('[WebSocket] Session error:', data.error);
+            setError(data.error || 'Unknown session error');
+            // Clear real-time counters on error
+            setToolCount(null);
+            setAssistantMessages([]);
+            break;
+
+          case 'api_key_warning':
+            console.warn('[WebSocket] API Key Warning:', data.message);
+            setApiKeyWarning(data.message || 'Using ANTHROPIC_API_KEY (credit-based billing)');
+            break;
+
+          // NEW Phase 2.2: Real-time session feedback events
+          case 'assistant_message':
+            if (data.text) {
+              console.log(`[WebSocket] Assistant message #${data.message_number}:`, data.text.substring(0, 50) + '...');
+              // Keep only last 10 messages
+              setAssistantMessages(prev => {
+                const updated = [...prev, data.text!];
+                return updated.slice(-10);
+              });
               // Trigger callback if provided
-              if (onSessionCompleteRef.current) {
-                // For initialization_complete, extract session_id and status from session object
-                const sessionId = data.session_id || data.session?.session_id;
-                const status = data.status || data.session?.status || 'completed';
-                if (sessionId) {
-                  onSessionCompleteRef.current(sessionId, status);
-                } else {
-                  // No session_id, just trigger reload
-                  onSessionCompleteRef.current('unknown', 'completed');
-                }
-              }
-              break;
-
-            case 'all_epics_complete':
-            case 'project_complete':
-              console.log(`[WebSocket] Project complete! All epics/tasks done.`);
-              // Clear real-time counters
-              setToolCount(null);
-              setAssistantMessages([]);
-              // Trigger session complete callback to reload page
-              if (onSessionCompleteRef.current) {
-                onSessionCompleteRef.current('final', 'completed');
-              }
-              break;
-
-            case 'session_error':
-              console.error('[WebSocket] Session error:', data.error);
-              setError(data.error || 'Unknown session error');
-              // Clear real-time counters on error
-              setToolCount(null);
-              setAssistantMessages([]);
-              break;
-
-            case 'api_key_warning':
-              console.warn('[WebSocket] API Key Warning:', data.message);
-              setApiKeyWarning(data.message || 'Using ANTHROPIC_API_KEY (credit-based billing)');
-              break;
-
-            // NEW Phase 2.2: Real-time session feedback events
-            case 'assistant_message':
-              if (data.text) {
-                console.log(`[WebSocket] Assistant message #${data.message_number}:`, data.text.substring(0, 50) + '...');
-                // Keep only last 10 messages
-                setAssistantMessages(prev => {
-                  const updated = [...prev, data.text!];
-                  return updated.slice(-10);
-                });
-                // Trigger callback if provided
-                if (onAssistantMessageRef.current && data.session_number) {
-                  onAssistantMessageRef.current(data.text, data.session_number);
-                }
-              }
-              break;
-
-            case 'tool_use':
-              if (data.tool_count !== undefined) {
-                console.log(`[WebSocket] Tool used: ${data.tool_name} (total: ${data.tool_count})`);
-                setToolCount(data.tool_count);
-                // Trigger callback if provided
-                if (onToolUseRef.current && data.tool_name && data.session_number) {
-                  onToolUseRef.current(data.tool_name, data.tool_count, data.session_number);
-                }
+              if (onAssistantMessageRef.current && data.session_number) {
+                onAssistantMessageRef.current(data.text, data.session_number);
               }
-              break;
+            }
+            break;
 
-            // Real-time task/test progress updates
-            case 'task_updated':
-              console.log(`[WebSocket] Task ${data.task_id} updated: done=${data.done}`);
+          case 'tool_use':
+            if (data.tool_count !== undefined) {
+              console.log(`[WebSocket] Tool used: ${data.tool_name} (total: ${data.tool_count})`);
+              setToolCount(data.tool_count);
               // Trigger callback if provided
-              if (onTaskUpdatedRef.current && data.task_id !== undefined && data.done !== undefined) {
-                onTaskUpdatedRef.current(data.task_id, data.done);
+              if (onToolUseRef.current && data.tool_name && data.session_number) {
+                onToolUseRef.current(data.tool_name, data.tool_count, data.session_number);
               }
-              break;
-
-            case 'test_updated':
-              console.log(`[WebSocket] Test ${data.test_id} updated: passes=${data.passes}`);
-              // Trigger callback if provided
-              if (onTestUpdatedRef.current && data.test_id !== undefined && data.passes !== undefined) {
-                onTestUpdatedRef.current(data.test_id, data.passes);
-              }
-              break;
-
-            // Prompt improvement events
-            case 'prompt_improvement_complete':
-              console.log(`[WebSocket] Prompt improvement analysis complete:`, data.analysis_id);
-              if (onPromptImprovementCompleteRef.current && data.analysis_id) {
-                onPromptImprovementCompleteRef.current(data.analysis_id, data.proposals_count || 0);
-              }
-              break;
+            }
+            break;
+
+          // Real-time task/test progress updates
+          case 'task_updated':
+            console.log(`[WebSocket] Task ${data.task_id} updated: done=${data.done}`);
+            // Trigger callback if provided
+            if (onTaskUpdatedRef.current && data.task_id !== undefined && data.done !== undefined) {
+              onTaskUpdatedRef.current(data.task_id, data.done);
+            }
+            break;
+
+          case 'test_updated':
+            console.log(`[WebSocket] Test ${data.test_id} updated: passes=${data.passes}`);
+            // Trigger callback if provided
+            if (onTestUpdatedRef.current && data.test_id !== undefined && data.passes !== undefined) {
+              onTestUpdatedRef.current(data.test_id, data.passes);
+            }
+            break;
+
+          // Prompt improvement events
+          case 'prompt_improvement_complete':
+            console.log(`[WebSocket] Prompt improvement analysis complete:`, data.analysis_id);
+            if (onPromptImprovementCompleteRef.current && data.analysis_id) {
+              onPromptImprovementCompleteRef.current(data.analysis_id, data.proposals_count || 0);
+            }
+            break;
+
+          case 'prompt_improvement_failed':
+            console.error(`[WebSocket] Prompt improvement analysis failed:`, data.error);
+            if (onPromptImprovementFailedRef.current && data.analysis_id) {
+              onPromptImprovementFailedRef.current(data.analysis_id, data.error || 'Unknown error');
+            }
+            break;
+        }
+      };
 
-            case 'prompt_improvement_failed':
-              console.error(`[WebSocket] Prompt improvement analysis failed:`, data.error);
-              if (onPromptImprovementFailedRef.current && data.analysis_id) {
-                onPromptImprovementFailedRef.current(data.analysis_id, data.error || 'Unknown error');
-              }
-              break;
+      ws.onmessage = (event) => {
+        try {
+          // The server batches bursts of updates into a single JSON array frame
+          const parsed: WebSocketMessage | WebSocketMessage[] = JSON.parse(event.data);
+          const messages = Array.isArray(parsed) ? parsed : [parsed];
+          for (const data of messages) {
+            handleMessage(data);
           }
         } catch (err) {
           console.error('[WebSocket] Failed to parse message:', err);